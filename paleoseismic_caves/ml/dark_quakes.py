@@ -14,13 +14,20 @@ Classification criteria (based on Bàsura/Yok Balum methodology):
 Output: Ranked list of dark earthquake candidates with confidence scores
 """
 
+import hashlib
+import os
+import threading
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from math import radians, sin, cos, sqrt, atan2
-import requests
+
+from sisal_loader import CACHE_DIR
+from spatial_index import (EARTH_RADIUS_KM, SiteIndex, haversine_km, point_segment_distance_km,
+                           search_window, unit_vectors)
+from tools_bridge import import_tool
 
 OUTPUT_DIR = Path(__file__).parent / "outputs"
 
@@ -139,6 +146,15 @@ def get_seismic_zone(lat: float, lon: float) -> Optional[str]:
 # Cache for loaded GEM faults
 _GEM_FAULTS_CACHE = None
 _GEM_TREE_CACHE = None
+_GEM_SEGMENTS_CACHE = None
+
+# Single-point lookups report no fault beyond this (~10 degrees of arc)
+GEM_SEARCH_RADIUS_KM = 1100
+
+# Cached fault-distance grid used for coverage checks
+_GEM_GRID_CACHE = None
+GEM_GRID_RESOLUTION = 0.1
+GEM_GRID_VERSION = 1
 
 GEM_FAULTS_PATH = Path(__file__).parent.parent / "data" / "gem_active_faults.geojson"
 
@@ -219,12 +235,170 @@ def load_gem_faults(geojson_path: Optional[Path] = None) -> Tuple[List[dict], an
         return [], None
 
 
+def _gem_segments(faults: List[dict]) -> dict:
+    """
+    Flatten GEM fault traces into great-circle arcs, grouped by fault.
+
+    Returns:
+        Dict with lat1, lon1, lat2, lon2 arrays (one entry per arc) and
+        offsets such that fault i owns arcs offsets[i]:offsets[i+1]
+    """
+    global _GEM_SEGMENTS_CACHE
+
+    if _GEM_SEGMENTS_CACHE is not None and _GEM_SEGMENTS_CACHE[0] is faults:
+        return _GEM_SEGMENTS_CACHE[1]
+
+    import shapely
+
+    parts, part_fault = shapely.get_parts([f['geometry'] for f in faults], return_index=True)
+    coords, coord_part = shapely.get_coordinates(parts, return_index=True)
+
+    # Consecutive vertices of the same part form an arc; single-vertex parts
+    # become a zero-length arc
+    same_part = coord_part[1:] == coord_part[:-1]
+    counts = np.bincount(coord_part, minlength=len(parts))
+    single = np.flatnonzero(counts == 1)
+    first_vertex = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    start = np.concatenate([np.flatnonzero(same_part), first_vertex[single]])
+    end = np.concatenate([np.flatnonzero(same_part) + 1, first_vertex[single]])
+    fault = part_fault[coord_part[start]]
+
+    order = np.argsort(fault, kind='stable')
+    start, end, fault = start[order], end[order], fault[order]
+
+    segments = {
+        'lon1': coords[start, 0], 'lat1': coords[start, 1],
+        'lon2': coords[end, 0], 'lat2': coords[end, 1],
+        'offsets': np.concatenate([[0], np.cumsum(np.bincount(fault, minlength=len(faults)))]),
+    }
+    _GEM_SEGMENTS_CACHE = (faults, segments)
+    return segments
+
+
+def _fault_pair_distances(lat: np.ndarray, lon: np.ndarray, fault_idx: np.ndarray,
+                          segments: dict) -> np.ndarray:
+    """Geodesic km from each (point, fault) pair to the nearest arc of that fault."""
+    offsets = segments['offsets']
+    counts = offsets[fault_idx + 1] - offsets[fault_idx]
+    dist = np.full(len(fault_idx), np.inf)
+
+    has = np.flatnonzero(counts > 0)
+    if len(has) == 0:
+        return dist
+
+    pair = np.repeat(has, counts[has])
+    pair_start = np.cumsum(counts[has]) - counts[has]
+    arc = offsets[fault_idx[pair]] + np.arange(len(pair)) - np.repeat(pair_start, counts[has])
+
+    arc_km = point_segment_distance_km(lat[pair], lon[pair],
+                                       segments['lat1'][arc], segments['lon1'][arc],
+                                       segments['lat2'][arc], segments['lon2'][arc])
+    dist[has] = np.minimum.reduceat(arc_km, pair_start)
+    return dist
+
+
+def get_nearest_gem_faults(lats, lons,
+                           faults: Optional[List[dict]] = None,
+                           tree: Optional[any] = None,
+                           max_distance_km: Optional[float] = None,
+                           chunk_size: int = 20000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest GEM fault and its true geodesic distance for many points at once.
+
+    The nearest fault in lon/lat degrees (STRtree.query_nearest) gives an
+    upper bound on the geodesic distance; every fault that could beat it
+    lies inside a lon/lat window derived from that bound, so one vectorized
+    `dwithin` query per chunk finds all candidates. Candidates are then
+    ranked by exact great-circle distance to their traces.
+
+    Args:
+        lats, lons: Query coordinates (degrees)
+        faults, tree: Pre-loaded fault data (optional, will load if not provided)
+        max_distance_km: Report no fault beyond this distance
+        chunk_size: Queries processed per vectorized batch
+
+    Returns:
+        (index into faults or -1, distance in km or NaN)
+    """
+    if faults is None or tree is None:
+        faults, tree = load_gem_faults()
+
+    lats = np.atleast_1d(np.asarray(lats, dtype=float))
+    lons = np.atleast_1d(np.asarray(lons, dtype=float))
+    best = np.full(len(lats), -1, dtype=np.int64)
+    best_km = np.full(len(lats), np.nan)
+
+    if not faults or tree is None:
+        return best, best_km
+
+    import shapely
+
+    segments = _gem_segments(faults)
+    queries = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+
+    for chunk in range(0, len(queries), chunk_size):
+        q = queries[chunk:chunk + chunk_size]
+        lat, lon = lats[q], lons[q]
+
+        # Upper bound: geodesic distance to the nearest fault in degree space
+        hit_q, hit_f = tree.query_nearest(shapely.points(lon, lat))
+        first = np.unique(hit_q, return_index=True)[1]
+        bound = np.full(len(q), np.inf)
+        bound[hit_q[first]] = _fault_pair_distances(lat[hit_q[first]], lon[hit_q[first]],
+                                                     hit_f[first], segments)
+        if max_distance_km is not None:
+            bound = np.minimum(bound, max_distance_km)
+
+        # Candidates: every fault within the bound's lon/lat window. The small
+        # pad covers great-circle arcs bowing away from their lon/lat chords.
+        dlat, dlon = search_window(lat, bound)
+        radius = np.hypot(dlat, dlon) * (1 + 1e-9) + 0.05
+
+        cand_q, cand_f = [], []
+        for shift in (0.0, 360.0, -360.0):
+            if shift == 0.0:
+                sub = np.arange(len(q))
+            elif shift > 0:
+                sub = np.flatnonzero(lon - dlon < -180)
+            else:
+                sub = np.flatnonzero(lon + dlon > 180)
+            sub = sub[np.isfinite(radius[sub])]
+            if len(sub) == 0:
+                continue
+            hits = tree.query(shapely.points(lon[sub] + shift, lat[sub]),
+                              predicate='dwithin', distance=radius[sub])
+            cand_q.append(sub[hits[0]])
+            cand_f.append(hits[1])
+
+        if not cand_q:
+            continue
+        cand_q = np.concatenate(cand_q)
+        cand_f = np.concatenate(cand_f)
+        dist = _fault_pair_distances(lat[cand_q], lon[cand_q], cand_f, segments)
+        if max_distance_km is not None:
+            keep = dist <= max_distance_km
+            cand_q, cand_f, dist = cand_q[keep], cand_f[keep], dist[keep]
+
+        # Nearest per query (lowest fault index on ties)
+        order = np.lexsort((cand_f, dist, cand_q))
+        cand_q, cand_f, dist = cand_q[order], cand_f[order], dist[order]
+        first = np.r_[True, cand_q[1:] != cand_q[:-1]] if len(cand_q) else np.zeros(0, dtype=bool)
+        best[q[cand_q[first]]] = cand_f[first]
+        best_km[q[cand_q[first]]] = dist[first]
+
+    return best, best_km
+
+
 def get_nearest_gem_fault(lat: float, lon: float,
                           faults: Optional[List[dict]] = None,
                           tree: Optional[any] = None) -> Tuple[Optional[str], Optional[float]]:
     """
     Find the nearest fault from the GEM database using spatial index.
 
+    Single-point wrapper around get_nearest_gem_faults(); faults farther than
+    GEM_SEARCH_RADIUS_KM are reported as not found.
+
     Args:
         lat, lon: Location coordinates
         faults, tree: Pre-loaded fault data (optional, will load if not provided)
@@ -239,38 +413,184 @@ def get_nearest_gem_fault(lat: float, lon: float,
         return None, None
 
     try:
-        from shapely.geometry import Point
+        idx, dist = get_nearest_gem_faults(lat, lon, faults, tree,
+                                           max_distance_km=GEM_SEARCH_RADIUS_KM)
+        if idx[0] < 0:
+            return None, None
+        return faults[idx[0]]['name'], float(dist[0])
 
-        point = Point(lon, lat)
+    except Exception as e:
+        print(f"Error querying GEM faults: {e}")
+        return None, None
 
-        # Query nearby faults within ~5 degrees
-        nearby_indices = list(tree.query(point.buffer(5)))
 
-        if not nearby_indices:
-            # No faults within 5 degrees (~550km), expand search
-            nearby_indices = list(tree.query(point.buffer(10)))
+# =============================================================================
+# GEM Fault-Distance Grid
+# =============================================================================
 
-        if not nearby_indices:
-            return None, None
+def _gem_grid_key(faults: Optional[List[dict]]) -> Optional[str]:
+    """
+    Cache key of the distance grid for a fault set.
+
+    The default GEM faults (faults=None, or the list load_gem_faults()
+    returned) are keyed by the GEM file's size and mtime, so a cached grid is
+    found without parsing the file; any other fault list by the content of
+    its traces. None when there is nothing to build from.
+    """
+    if faults is None or faults is _GEM_FAULTS_CACHE:
+        if not GEM_FAULTS_PATH.exists():
+            return None
+        stat = GEM_FAULTS_PATH.stat()
+        return hashlib.sha1(f'v{GEM_GRID_VERSION}:{GEM_FAULTS_PATH.name}:{stat.st_size}:'
+                            f'{stat.st_mtime_ns}'.encode()).hexdigest()[:16]
+
+    if not faults:
+        return None
+    segments = _gem_segments(faults)
+    digest = hashlib.sha1(f'v{GEM_GRID_VERSION}:traces'.encode())
+    for name in ('lat1', 'lon1', 'lat2', 'lon2', 'offsets'):
+        digest.update(np.ascontiguousarray(segments[name]).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def build_gem_distance_grid(faults: List[dict], resolution: float = GEM_GRID_RESOLUTION,
+                            step_km: float = 2.0) -> np.ndarray:
+    """
+    Distance from every grid cell centre to the nearest GEM fault.
 
-        min_dist = float('inf')
-        nearest_name = None
+    Fault arcs are densified to points every step_km along the great circle
+    and indexed in a KD-tree of 3D unit vectors; each cell takes the chord
+    distance to its nearest trace point, converted back to km.
 
-        for idx in nearby_indices:
-            fault = faults[idx]
-            dist_deg = point.distance(fault['geometry'])
-            # Convert degrees to km (approximate, varies with latitude)
-            dist_km = dist_deg * 111 * np.cos(np.radians(lat))
+    Args:
+        faults: GEM faults (from load_gem_faults)
+        resolution: Cell size in degrees
+        step_km: Densification spacing (distance error <= step_km / 2)
 
-            if dist_km < min_dist:
-                min_dist = dist_km
-                nearest_name = fault['name']
+    Returns:
+        (180/resolution, 360/resolution) uint16 array of km, row 0 = south
+    """
+    from scipy.spatial import cKDTree
+
+    segments = _gem_segments(faults)
+    a = unit_vectors(segments['lat1'], segments['lon1'])
+    b = unit_vectors(segments['lat2'], segments['lon2'])
+    angle = np.arccos(np.clip(np.einsum('ij,ij->i', a, b), -1.0, 1.0))
+
+    # Slerp each arc into ceil(length / step) pieces (endpoints included)
+    pieces = np.maximum(np.ceil(angle * EARTH_RADIUS_KM / step_km).astype(np.int64), 1)
+    arc = np.repeat(np.arange(len(angle)), pieces + 1)
+    t = (np.arange(len(arc)) - np.repeat(np.cumsum(pieces + 1) - (pieces + 1), pieces + 1)) \
+        / np.repeat(pieces, pieces + 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sin_angle = np.sin(angle[arc])
+        wa = np.where(sin_angle > 1e-12, np.sin((1 - t) * angle[arc]) / sin_angle, 1 - t)
+        wb = np.where(sin_angle > 1e-12, np.sin(t * angle[arc]) / sin_angle, t)
+    points = wa[:, None] * a[arc] + wb[:, None] * b[arc]
+    points /= np.linalg.norm(points, axis=1)[:, None]
+    tree = cKDTree(points)
+
+    n_lat, n_lon = int(round(180 / resolution)), int(round(360 / resolution))
+    cell_lat = -90 + (np.arange(n_lat) + 0.5) * resolution
+    cell_lon = -180 + (np.arange(n_lon) + 0.5) * resolution
+
+    grid = np.empty((n_lat, n_lon), dtype=np.uint16)
+    rows_per_chunk = max(1, 2_000_000 // n_lon)
+    for start in range(0, n_lat, rows_per_chunk):
+        lat, lon = np.meshgrid(cell_lat[start:start + rows_per_chunk], cell_lon, indexing='ij')
+        chord, _ = tree.query(unit_vectors(lat.ravel(), lon.ravel()), workers=-1)
+        km = 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(chord / 2, 1.0))
+        grid[start:start + lat.shape[0]] = np.minimum(np.round(km), np.iinfo(np.uint16).max) \
+            .reshape(lat.shape)
+
+    return grid
+
+
+def load_gem_distance_grid(faults: Optional[List[dict]] = None,
+                           resolution: float = GEM_GRID_RESOLUTION) -> Optional[np.ndarray]:
+    """
+    Memory-mapped GEM fault-distance grid, built and cached on first use.
 
-        return nearest_name, min_dist
+    Cached per fault set (see _gem_grid_key), so faults loaded from another
+    file get their own grid.
 
-    except Exception as e:
-        print(f"Error querying GEM faults: {e}")
-        return None, None
+    Args:
+        faults: Faults the grid measures distance to (default: the GEM
+            database, via load_gem_faults() if the grid is not cached yet)
+        resolution: Cell size in degrees
+
+    Returns:
+        uint16 km grid (see build_gem_distance_grid), or None without fault data
+    """
+    global _GEM_GRID_CACHE
+
+    key = _gem_grid_key(faults)
+    if key is None:
+        return None
+    if _GEM_GRID_CACHE is not None and _GEM_GRID_CACHE[:2] == (resolution, key):
+        return _GEM_GRID_CACHE[2]
+
+    path = CACHE_DIR / f"gem_fault_distance_{resolution:g}deg_{key}.npy"
+
+    if not path.exists():
+        if faults is None:
+            faults, _ = load_gem_faults()
+        if not faults:
+            return None
+        print(f"Building {resolution:g} degree GEM fault-distance grid...")
+        grid = build_gem_distance_grid(faults, resolution)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npy")
+        np.save(tmp_path, grid)
+        tmp_path.replace(path)
+        print(f"Saved fault-distance grid to {path}")
+
+    grid = np.load(path, mmap_mode='r')
+    _GEM_GRID_CACHE = (resolution, key, grid)
+    return grid
+
+
+def gem_fault_distance_approx(lats, lons, grid: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Approximate km to the nearest GEM fault by grid lookup (vectorized).
+
+    Accurate to about half a cell diagonal (~8 km at 0.1 degrees).
+
+    Returns:
+        Distance in km (NaN for missing coordinates or without GEM data)
+    """
+    lats = np.atleast_1d(np.asarray(lats, dtype=float))
+    lons = np.atleast_1d(np.asarray(lons, dtype=float))
+    if grid is None:
+        grid = load_gem_distance_grid()
+
+    dist = np.full(len(lats), np.nan)
+    if grid is None:
+        return dist
+
+    n_lat, n_lon = grid.shape
+    valid = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+    row = np.clip(np.floor((lats[valid] + 90) / 180 * n_lat).astype(np.int64), 0, n_lat - 1)
+    col = np.floor((lons[valid] + 180) / 360 * n_lon).astype(np.int64) % n_lon
+    dist[valid] = grid[row, col]
+    return dist
+
+
+def check_fault_coverage_batch(lats, lons, radius_km: float = 500,
+                               faults: Optional[List[dict]] = None) -> np.ndarray:
+    """
+    Vectorized check_fault_coverage(): one grid lookup per location.
+
+    Distances are cell-level (see gem_fault_distance_approx), so locations
+    within about half a cell diagonal of radius_km may fall either way.
+
+    Returns:
+        Object array of "COVERED" / "NO_COVERAGE" / "UNKNOWN"
+    """
+    grid = load_gem_distance_grid(faults)
+    dist = gem_fault_distance_approx(lats, lons, grid)
+    return np.where(np.isnan(dist), "UNKNOWN",
+                    np.where(dist <= radius_km, "COVERED", "NO_COVERAGE")).astype(object)
 
 
 def check_fault_coverage(lat: float, lon: float, radius_km: float = 500,
@@ -279,29 +599,24 @@ def check_fault_coverage(lat: float, lon: float, radius_km: float = 500,
     """
     Check if a location is within mapped fault coverage.
 
+    Looks up the cached fault-distance grid of faults (see
+    load_gem_distance_grid), so any radius costs one array read. The distance
+    is that of the location's grid cell, accurate to about half a cell
+    diagonal (~8 km at the default 0.1 degrees).
+
+    Args:
+        lat, lon: Location
+        radius_km: Coverage radius
+        faults: Fault set (default: the GEM database)
+        tree: Unused (the grid replaces the STRtree query); kept for
+            compatibility with existing callers
+
     Returns:
         "COVERED" if faults exist within radius_km
         "NO_COVERAGE" if no faults mapped (potential unknown fault region)
     """
-    if faults is None or tree is None:
-        faults, tree = load_gem_faults()
-
-    if not faults or tree is None:
-        return "UNKNOWN"
-
     try:
-        from shapely.geometry import Point
-
-        point = Point(lon, lat)
-        radius_deg = radius_km / (111 * np.cos(np.radians(lat)))
-
-        nearby = list(tree.query(point.buffer(radius_deg)))
-
-        if len(nearby) == 0:
-            return "NO_COVERAGE"
-        else:
-            return "COVERED"
-
+        return str(check_fault_coverage_batch(lat, lon, radius_km, faults)[0])
     except Exception as e:
         return "UNKNOWN"
 
@@ -327,7 +642,8 @@ def query_usgs_faults(lat: float, lon: float, radius_km: float = 200) -> List[di
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        http_cache = import_tool("http_cache")
+        response = http_cache.cached_get(url, params=params, ttl=30 * http_cache.DAY, timeout=10)
         if response.status_code == 200:
             data = response.json()
             faults = data.get('faults', {}).get('features', [])
@@ -355,61 +671,103 @@ def find_temporal_clusters(anomalies: pd.DataFrame,
     """
     Find anomalies that cluster in time across multiple caves.
     This suggests a real event affecting a regional aquifer system.
+
+    Anomalies are sorted by year once; each one's time-window partners are a
+    contiguous run found with searchsorted, and the distances of all candidate
+    pairs are computed in vectorized haversine calls (in chunks of seeds to
+    bound memory).
     """
+    if len(anomalies) == 0:
+        return {}
+
+    # Sort by year (stable, so tied years keep their input order)
+    sorted_anomalies = anomalies.sort_values('year_ce', kind='stable')
+    years = sorted_anomalies['year_ce'].to_numpy(dtype=float)
+    lats = sorted_anomalies['lat'].to_numpy(dtype=float)
+    lons = sorted_anomalies['lon'].to_numpy(dtype=float)
+    labels = pd.factorize(sorted_anomalies.index)[0]
+
+    # Candidate partners of each seed: a slightly widened year window, the
+    # exact |dyear| <= window test is applied per pair below
+    margin = 1e-9 * (1 + abs(time_window_years))
+    lo = np.searchsorted(years, years - time_window_years - margin, side='left')
+    hi = np.searchsorted(years, years + time_window_years + margin, side='right')
+    lo[np.isnan(years)] = hi[np.isnan(years)] = 0
+    counts = hi - lo
+
+    # Seeds are processed in order, partners in sorted order, so the pair
+    # stream has the same order as the original nested loop
+    max_pairs = 2_000_000
+    seed_parts, match_parts, dist_parts = [], [], []
+    start = 0
+    cum = np.cumsum(counts)
+    while start < len(years):
+        base = cum[start - 1] if start else 0
+        stop = max(int(np.searchsorted(cum, base + max_pairs, side='right')), start + 1)
+
+        chunk_counts = counts[start:stop]
+        seeds = np.repeat(np.arange(start, stop), chunk_counts)
+        first = np.repeat(lo[start:stop] - np.cumsum(chunk_counts) + chunk_counts, chunk_counts)
+        matches = first + np.arange(len(seeds))
+
+        keep = ((np.abs(years[matches] - years[seeds]) <= time_window_years) &
+                (labels[matches] != labels[seeds]))
+        seeds, matches = seeds[keep], matches[keep]
+
+        dist = haversine_km(lats[seeds], lons[seeds], lats[matches], lons[matches])
+        near = dist <= distance_threshold_km
+        seed_parts.append(seeds[near])
+        match_parts.append(matches[near])
+        dist_parts.append(dist[near])
+        start = stop
+
+    seeds = np.concatenate(seed_parts)
+    matches = np.concatenate(match_parts)
+    if len(seeds) == 0:
+        return {}
+
+    # Round to nearest 5 years for clustering (same rounding as round())
+    cluster_year = np.round(years / 5) * 5
+
+    pairs = pd.DataFrame({
+        'cluster_year': cluster_year[seeds],
+        'site': sorted_anomalies['site_name'].to_numpy()[matches],
+        'entity': sorted_anomalies['entity_name'].to_numpy()[matches],
+        'year': years[matches],
+        'distance_km': np.concatenate(dist_parts),
+        'magnitude': sorted_anomalies['shift_magnitude'].to_numpy()[matches],
+    })
+
+    # Deduplicate (first occurrence per site/entity) and count
+    pairs = pairs.drop_duplicates(['cluster_year', 'site', 'entity'], keep='first')
     clusters = {}
+    for year, group in pairs.groupby('cluster_year', sort=False):
+        if len(group) >= 2:
+            clusters[int(year)] = group.drop(columns='cluster_year').to_dict('records')
 
-    # Sort by year
-    sorted_anomalies = anomalies.sort_values('year_ce')
-
-    for idx, row in sorted_anomalies.iterrows():
-        year = row['year_ce']
-
-        # Find other anomalies within time window
-        time_matches = sorted_anomalies[
-            (abs(sorted_anomalies['year_ce'] - year) <= time_window_years) &
-            (sorted_anomalies.index != idx)
-        ]
-
-        if len(time_matches) > 0:
-            # Check geographic proximity
-            nearby = []
-            for _, match in time_matches.iterrows():
-                dist = haversine_distance(row['lat'], row['lon'],
-                                         match['lat'], match['lon'])
-                if dist <= distance_threshold_km:
-                    nearby.append({
-                        'site': match['site_name'],
-                        'entity': match['entity_name'],
-                        'year': match['year_ce'],
-                        'distance_km': dist,
-                        'magnitude': match['shift_magnitude']
-                    })
-
-            if nearby:
-                # Round to nearest 5 years for clustering
-                cluster_year = round(year / 5) * 5
-                if cluster_year not in clusters:
-                    clusters[cluster_year] = []
-                clusters[cluster_year].extend(nearby)
-
-    # Deduplicate and count
-    for year in clusters:
-        seen = set()
-        unique = []
-        for item in clusters[year]:
-            key = (item['site'], item['entity'])
-            if key not in seen:
-                seen.add(key)
-                unique.append(item)
-        clusters[year] = unique
-
-    return {k: v for k, v in clusters.items() if len(v) >= 2}
+    return clusters
 
 
 # =============================================================================
 # Confidence Scoring
 # =============================================================================
 
+def _row_features(row: pd.Series, nearby_caves: int, **features) -> pd.DataFrame:
+    """One-row feature table (see extract_candidate_features) for the scalar scorers."""
+    recovery = row.get('recovery_years', 0)
+    return pd.DataFrame({
+        'magnitude': [abs(float(row['shift_magnitude']))],
+        'recovery': [float(recovery) if pd.notna(recovery) else np.nan],
+        'nearby_caves': [int(nearby_caves)],
+        **{name: [value] for name, value in features.items()},
+    })
+
+
+def _first(scored: Tuple[np.ndarray, np.ndarray]) -> Tuple[float, str]:
+    score, evidence = scored
+    return int(score[0]), evidence[0]
+
+
 def calculate_confidence_score(row: pd.Series,
                                 nearby_caves: int = 0,
                                 nearest_fault_km: Optional[float] = None) -> Tuple[float, str]:
@@ -422,72 +780,12 @@ def calculate_confidence_score(row: pd.Series,
     - Fault proximity: closer = higher score
     - Temporal clustering: more caves = higher score
 
+    Single-candidate form of score_original().
+
     Returns: (score 0-100, evidence summary string)
     """
-    score = 0
-    evidence = []
-
-    # 1. Shift magnitude (0-25 points)
-    mag = abs(row['shift_magnitude'])
-    if mag >= 3.0:
-        score += 25
-        evidence.append(f"Very strong shift (z={mag:.2f})")
-    elif mag >= 2.5:
-        score += 20
-        evidence.append(f"Strong shift (z={mag:.2f})")
-    elif mag >= 2.0:
-        score += 15
-        evidence.append(f"Significant shift (z={mag:.2f})")
-    else:
-        score += 10
-        evidence.append(f"Moderate shift (z={mag:.2f})")
-
-    # 2. Recovery time (0-25 points)
-    recovery = row.get('recovery_years', 0)
-    if pd.notna(recovery) and recovery > 0:
-        if recovery >= 20:
-            score += 25
-            evidence.append(f"Long recovery ({recovery:.0f} years) - SEISMIC SIGNATURE")
-        elif recovery >= 10:
-            score += 20
-            evidence.append(f"Extended recovery ({recovery:.0f} years)")
-        elif recovery >= 5:
-            score += 10
-            evidence.append(f"Moderate recovery ({recovery:.0f} years)")
-        else:
-            score += 5
-            evidence.append(f"Short recovery ({recovery:.1f} years) - possibly climatic")
-
-    # 3. Fault proximity (0-25 points)
-    if nearest_fault_km is not None:
-        if nearest_fault_km <= 100:
-            score += 25
-            evidence.append(f"Near major fault ({nearest_fault_km:.0f} km)")
-        elif nearest_fault_km <= 300:
-            score += 20
-            evidence.append(f"Moderate fault distance ({nearest_fault_km:.0f} km)")
-        elif nearest_fault_km <= 500:
-            score += 15
-            evidence.append(f"Regional fault context ({nearest_fault_km:.0f} km)")
-        else:
-            score += 5
-            evidence.append(f"Distant from known faults ({nearest_fault_km:.0f} km)")
-
-    # 4. Temporal clustering (0-25 points)
-    if nearby_caves >= 3:
-        score += 25
-        evidence.append(f"Strong temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 2:
-        score += 20
-        evidence.append(f"Temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 1:
-        score += 10
-        evidence.append(f"Possible cluster ({nearby_caves} other cave)")
-    else:
-        score += 0
-        evidence.append("Single-cave detection")
-
-    return score, "; ".join(evidence)
+    fault_dist = np.nan if nearest_fault_km is None else nearest_fault_km
+    return _first(score_original(_row_features(row, nearby_caves, fault_dist=fault_dist)))
 
 
 def calculate_confidence_score_inverted(row: pd.Series,
@@ -498,72 +796,11 @@ def calculate_confidence_score_inverted(row: pd.Series,
 
     Rationale: Dark earthquakes may occur on unknown/unmapped faults.
     Being distant from known faults could indicate a discovery opportunity.
-    """
-    score = 0
-    evidence = []
-
-    # 1. Shift magnitude (0-25 points) - same as original
-    mag = abs(row['shift_magnitude'])
-    if mag >= 3.0:
-        score += 25
-        evidence.append(f"Very strong shift (z={mag:.2f})")
-    elif mag >= 2.5:
-        score += 20
-        evidence.append(f"Strong shift (z={mag:.2f})")
-    elif mag >= 2.0:
-        score += 15
-        evidence.append(f"Significant shift (z={mag:.2f})")
-    else:
-        score += 10
-        evidence.append(f"Moderate shift (z={mag:.2f})")
 
-    # 2. Recovery time (0-25 points) - same as original
-    recovery = row.get('recovery_years', 0)
-    if pd.notna(recovery) and recovery > 0:
-        if recovery >= 20:
-            score += 25
-            evidence.append(f"Long recovery ({recovery:.0f} years) - SEISMIC SIGNATURE")
-        elif recovery >= 10:
-            score += 20
-            evidence.append(f"Extended recovery ({recovery:.0f} years)")
-        elif recovery >= 5:
-            score += 10
-            evidence.append(f"Moderate recovery ({recovery:.0f} years)")
-        else:
-            score += 5
-            evidence.append(f"Short recovery ({recovery:.1f} years) - possibly climatic")
-
-    # 3. Fault proximity - INVERTED (0-25 points)
-    # Far from known faults = potential unknown fault discovery
-    if nearest_fault_km is not None:
-        if nearest_fault_km > 500:
-            score += 20
-            evidence.append(f"POTENTIAL UNKNOWN FAULT - distant from known faults ({nearest_fault_km:.0f} km)")
-        elif nearest_fault_km > 300:
-            score += 15
-            evidence.append(f"Possible unknown fault ({nearest_fault_km:.0f} km from known)")
-        elif nearest_fault_km > 100:
-            score += 10
-            evidence.append(f"Moderate distance from known faults ({nearest_fault_km:.0f} km)")
-        else:
-            score += 25
-            evidence.append(f"Near known active fault ({nearest_fault_km:.0f} km)")
-
-    # 4. Temporal clustering (0-25 points) - same as original
-    if nearby_caves >= 3:
-        score += 25
-        evidence.append(f"Strong temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 2:
-        score += 20
-        evidence.append(f"Temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 1:
-        score += 10
-        evidence.append(f"Possible cluster ({nearby_caves} other cave)")
-    else:
-        score += 0
-        evidence.append("Single-cave detection")
-
-    return score, "; ".join(evidence)
+    Single-candidate form of score_inverted().
+    """
+    fault_dist = np.nan if nearest_fault_km is None else nearest_fault_km
+    return _first(score_inverted(_row_features(row, nearby_caves, fault_dist=fault_dist)))
 
 
 def calculate_confidence_score_no_proximity(row: pd.Series,
@@ -575,173 +812,97 @@ def calculate_confidence_score_no_proximity(row: pd.Series,
     Rationale: Fault proximity introduces circular logic. This variant
     evaluates candidates purely on signal quality (magnitude + recovery + clustering).
     Maximum score is 75 instead of 100.
-    """
-    score = 0
-    evidence = []
-
-    # 1. Shift magnitude (0-25 points)
-    mag = abs(row['shift_magnitude'])
-    if mag >= 3.0:
-        score += 25
-        evidence.append(f"Very strong shift (z={mag:.2f})")
-    elif mag >= 2.5:
-        score += 20
-        evidence.append(f"Strong shift (z={mag:.2f})")
-    elif mag >= 2.0:
-        score += 15
-        evidence.append(f"Significant shift (z={mag:.2f})")
-    else:
-        score += 10
-        evidence.append(f"Moderate shift (z={mag:.2f})")
-
-    # 2. Recovery time (0-25 points)
-    recovery = row.get('recovery_years', 0)
-    if pd.notna(recovery) and recovery > 0:
-        if recovery >= 20:
-            score += 25
-            evidence.append(f"Long recovery ({recovery:.0f} years) - SEISMIC SIGNATURE")
-        elif recovery >= 10:
-            score += 20
-            evidence.append(f"Extended recovery ({recovery:.0f} years)")
-        elif recovery >= 5:
-            score += 10
-            evidence.append(f"Moderate recovery ({recovery:.0f} years)")
-        else:
-            score += 5
-            evidence.append(f"Short recovery ({recovery:.1f} years) - possibly climatic")
-
-    # 3. Fault proximity - REMOVED
-    # Just note the distance for context, no scoring
-    if nearest_fault_km is not None:
-        evidence.append(f"[{nearest_fault_km:.0f} km from known fault - not scored]")
-
-    # 4. Temporal clustering (0-25 points)
-    if nearby_caves >= 3:
-        score += 25
-        evidence.append(f"Strong temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 2:
-        score += 20
-        evidence.append(f"Temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 1:
-        score += 10
-        evidence.append(f"Possible cluster ({nearby_caves} other cave)")
-    else:
-        score += 0
-        evidence.append("Single-cave detection")
 
-    return score, "; ".join(evidence)
+    Single-candidate form of score_no_proximity().
+    """
+    fault_dist = np.nan if nearest_fault_km is None else nearest_fault_km
+    return _first(score_no_proximity(_row_features(row, nearby_caves, fault_dist=fault_dist)))
 
 
 def calculate_confidence_score_gem(row: pd.Series,
                                    nearby_caves: int = 0,
                                    gem_fault_name: Optional[str] = None,
                                    gem_fault_km: Optional[float] = None,
-                                   fault_coverage: str = "UNKNOWN") -> Tuple[float, str]:
+                                   fault_coverage: str = "UNKNOWN",
+                                   all_sites: Optional[pd.DataFrame] = None) -> Tuple[float, str]:
     """
     GEM DATABASE scoring: uses 16,195 global faults + coverage awareness.
 
     Key insight: If in a region with NO fault coverage in GEM database,
     the candidate gets a bonus (potential unknown fault discovery).
+
+    Single-candidate form of score_gem(); clustering is coverage-adjusted
+    against the SISAL sites in all_sites (see count_sisal_caves_in_region).
     """
-    score = 0
-    evidence = []
-
-    # 1. Shift magnitude (0-25 points)
-    mag = abs(row['shift_magnitude'])
-    if mag >= 3.0:
-        score += 25
-        evidence.append(f"Very strong shift (z={mag:.2f})")
-    elif mag >= 2.5:
-        score += 20
-        evidence.append(f"Strong shift (z={mag:.2f})")
-    elif mag >= 2.0:
-        score += 15
-        evidence.append(f"Significant shift (z={mag:.2f})")
-    else:
-        score += 10
-        evidence.append(f"Moderate shift (z={mag:.2f})")
+    caves_in_region = count_sisal_caves_in_region(row['lat'], row['lon'], radius_km=500,
+                                                  all_sites=all_sites)
+    return _first(score_gem(_row_features(
+        row, nearby_caves,
+        gem_fault_name=gem_fault_name,
+        gem_fault_dist=np.nan if gem_fault_km is None else gem_fault_km,
+        fault_coverage=fault_coverage,
+        caves_in_region=caves_in_region)))
 
-    # 2. Recovery time (0-25 points)
-    recovery = row.get('recovery_years', 0)
-    if pd.notna(recovery) and recovery > 0:
-        if recovery >= 20:
-            score += 25
-            evidence.append(f"Long recovery ({recovery:.0f} years) - SEISMIC SIGNATURE")
-        elif recovery >= 10:
-            score += 20
-            evidence.append(f"Extended recovery ({recovery:.0f} years)")
-        elif recovery >= 5:
-            score += 10
-            evidence.append(f"Moderate recovery ({recovery:.0f} years)")
-        else:
-            score += 5
-            evidence.append(f"Short recovery ({recovery:.1f} years) - possibly climatic")
-
-    # 3. Fault proximity with coverage awareness (0-25 points)
-    if fault_coverage == "NO_COVERAGE":
-        # No mapped faults in region - potential unknown fault discovery!
-        score += 20
-        evidence.append("UNMAPPED REGION - potential unknown fault discovery")
-    elif gem_fault_km is not None:
-        if gem_fault_km <= 50:
-            score += 25
-            evidence.append(f"Near GEM fault: {gem_fault_name} ({gem_fault_km:.0f} km)")
-        elif gem_fault_km <= 150:
-            score += 20
-            evidence.append(f"Moderate distance to {gem_fault_name} ({gem_fault_km:.0f} km)")
-        elif gem_fault_km <= 300:
-            score += 15
-            evidence.append(f"Regional fault: {gem_fault_name} ({gem_fault_km:.0f} km)")
-        else:
-            score += 10
-            evidence.append(f"Distant from mapped faults ({gem_fault_km:.0f} km)")
-    else:
-        score += 5
-        evidence.append("GEM query failed")
-
-    # 4. Temporal clustering (0-25 points)
-    if nearby_caves >= 3:
-        score += 25
-        evidence.append(f"Strong temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 2:
-        score += 20
-        evidence.append(f"Temporal cluster ({nearby_caves} caves)")
-    elif nearby_caves >= 1:
-        score += 10
-        evidence.append(f"Possible cluster ({nearby_caves} other cave)")
-    else:
-        score += 0
-        evidence.append("Single-cave detection")
 
-    return score, "; ".join(evidence)
+# Cache for the SISAL site index: (all_sites it was built from, SiteIndex)
+_SITE_INDEX_CACHE = None
 
 
-def count_sisal_caves_in_region(lat: float, lon: float, radius_km: float = 500,
-                                 all_sites: Optional[pd.DataFrame] = None) -> int:
+def get_site_index(all_sites: Optional[pd.DataFrame] = None) -> Optional[SiteIndex]:
     """
-    Count how many SISAL caves exist within a radius of the given location.
+    Spatial index of SISAL site coordinates, built once per process.
 
-    Used to determine if a region is well-sampled or sparse.
+    Args:
+        all_sites: Sites (lat, lon) to index; default reads the sites in
+            anomalies_validated.csv (once)
+
+    Returns:
+        SiteIndex, or None if no site list is available
     """
-    if all_sites is None:
+    global _SITE_INDEX_CACHE
+
+    if _SITE_INDEX_CACHE is not None and _SITE_INDEX_CACHE[0] is all_sites:
+        return _SITE_INDEX_CACHE[1]
+
+    sites = all_sites
+    if sites is None:
         # Try to load from anomalies file
         try:
             anomalies_path = OUTPUT_DIR / "anomalies_validated.csv"
-            if anomalies_path.exists():
-                df = pd.read_csv(anomalies_path)
-                all_sites = df[['site_name', 'lat', 'lon']].drop_duplicates()
-            else:
-                return 0
-        except:
-            return 0
+            if not anomalies_path.exists():
+                return None
+            df = pd.read_csv(anomalies_path)
+            sites = df[['site_name', 'lat', 'lon']].drop_duplicates()
+        except Exception:
+            return None
+
+    index = SiteIndex(sites['lat'], sites['lon'])
+    _SITE_INDEX_CACHE = (all_sites, index)
+    return index
 
-    count = 0
-    for _, site in all_sites.iterrows():
-        dist = haversine_distance(lat, lon, site['lat'], site['lon'])
-        if dist <= radius_km:
-            count += 1
 
-    return count
+def count_sisal_caves_in_region_batch(lats, lons, radius_km: float = 500,
+                                      all_sites: Optional[pd.DataFrame] = None) -> np.ndarray:
+    """
+    Vectorized count_sisal_caves_in_region() for arrays of locations.
+
+    Returns:
+        (n,) int64 number of sites within radius_km of each location
+    """
+    index = get_site_index(all_sites)
+    if index is None:
+        return np.zeros(len(np.atleast_1d(lats)), dtype=np.int64)
+    return index.count_within(lats, lons, radius_km)
+
+
+def count_sisal_caves_in_region(lat: float, lon: float, radius_km: float = 500,
+                                 all_sites: Optional[pd.DataFrame] = None) -> int:
+    """
+    Count how many SISAL caves exist within a radius of the given location.
+
+    Used to determine if a region is well-sampled or sparse.
+    """
+    return int(count_sisal_caves_in_region_batch(lat, lon, radius_km, all_sites)[0])
 
 
 def calculate_coverage_adjusted_clustering(lat: float, lon: float,
@@ -754,31 +915,266 @@ def calculate_coverage_adjusted_clustering(lat: float, lon: float,
 
     If region has few studied caves, we can't evaluate clustering - give neutral score.
     If region has many caves and only 1 detected, that's meaningful (possibly suspicious).
+
+    Single-location form of the clustering component used by score_gem().
     """
     caves_in_region = count_sisal_caves_in_region(lat, lon, radius_km=500, all_sites=all_sites)
+    features = pd.DataFrame({'nearby_caves': [int(nearby_caves)], 'caves_in_region': [caves_in_region]})
+    return _first(_coverage_clustering_component(features))
 
-    if caves_in_region <= 2:
-        # Sparse coverage - cannot meaningfully evaluate clustering
-        return 15, f"Sparse regional coverage ({caves_in_region} caves within 500km - clustering N/A)"
-    elif caves_in_region <= 5:
-        # Moderate coverage
-        if nearby_caves >= 2:
-            return 25, f"Strong cluster ({nearby_caves} caves in moderately-sampled region)"
-        elif nearby_caves >= 1:
-            return 15, f"Weak cluster ({nearby_caves} cave in moderately-sampled region)"
-        else:
-            return 10, f"Isolated in moderately-sampled region ({caves_in_region} caves)"
-    else:
-        # Well-sampled region (>5 caves within 500km)
-        if nearby_caves >= 3:
-            return 25, f"Strong cluster ({nearby_caves} caves in well-sampled region)"
-        elif nearby_caves >= 2:
-            return 20, f"Temporal cluster ({nearby_caves} caves in well-sampled region)"
-        elif nearby_caves >= 1:
-            return 10, f"Weak cluster ({nearby_caves} cave in well-sampled region)"
-        else:
-            # Isolated detection in well-sampled region = suspicious
-            return 5, f"Isolated detection in well-sampled region ({caves_in_region} caves) - suspicious"
+
+# =============================================================================
+# Candidate Feature Extraction
+# =============================================================================
+
+def extract_candidate_features(dark: pd.DataFrame,
+                               cluster_counts: Dict[tuple, int],
+                               gem_faults: Optional[List[dict]] = None,
+                               gem_tree: Optional[any] = None,
+                               all_sites: Optional[pd.DataFrame] = None,
+                               include_gem: bool = True) -> pd.DataFrame:
+    """
+    Compute every per-candidate feature the scoring variants need, once.
+
+    Geospatial features depend only on the location, so they are computed per
+    unique (lat, lon) and broadcast back to the candidates.
+
+    Args:
+        dark: Dark candidates (site_name, entity_name, lat, lon, shift_magnitude,
+            optional recovery_years)
+        cluster_counts: {(site, entity): clustered cave count} from find_temporal_clusters
+        gem_faults, gem_tree: Pre-loaded GEM data (from load_gem_faults)
+        all_sites: Sites used to measure regional cave density (default: dark sites)
+        include_gem: Also compute the GEM and coverage features (loads the GEM
+            database, distance grid and site index); only score_gem needs them
+
+    Returns:
+        DataFrame aligned with dark: magnitude, recovery, nearby_caves,
+        fault_name, fault_dist, seismic_zone, plus gem_fault_name,
+        gem_fault_dist, fault_coverage, caves_in_region with include_gem
+    """
+    lat = dark['lat'].to_numpy(dtype=float)
+    lon = dark['lon'].to_numpy(dtype=float)
+    locations = pd.DataFrame({'lat': lat, 'lon': lon})
+    location_id = locations.groupby(['lat', 'lon'], sort=False, dropna=False).ngroup().to_numpy()
+    sites = locations.drop_duplicates().reset_index(drop=True)
+    site_lat = sites['lat'].to_numpy()
+    site_lon = sites['lon'].to_numpy()
+
+    # Hardcoded major faults: nearest of the point list
+    fault_lat = np.array([f[0] for f in MAJOR_FAULTS], dtype=float)
+    fault_lon = np.array([f[1] for f in MAJOR_FAULTS], dtype=float)
+    fault_names = np.array([f[2] for f in MAJOR_FAULTS], dtype=object)
+    with np.errstate(invalid='ignore'):
+        fault_km = haversine_km(site_lat[:, None], site_lon[:, None], fault_lat, fault_lon)
+    has_fault = ~np.isnan(fault_km).all(axis=1)
+    nearest = np.argmin(np.where(np.isnan(fault_km), np.inf, fault_km), axis=1)
+    site_fault_name = np.where(has_fault, fault_names[nearest], None)
+    site_fault_dist = np.where(has_fault, fault_km[np.arange(len(sites)), nearest], np.inf)
+
+    # Seismic zone: first bounding box containing the location
+    in_zone = [(min_lat <= site_lat) & (site_lat <= max_lat) &
+               (min_lon <= site_lon) & (site_lon <= max_lon)
+               for min_lat, max_lat, min_lon, max_lon, _, _ in SEISMIC_ZONES]
+    zone_names = [np.full(len(sites), zone[4], dtype=object) for zone in SEISMIC_ZONES]
+    site_zone = np.select(in_zone, zone_names, np.full(len(sites), None, dtype=object))
+
+    recovery = (dark['recovery_years'].to_numpy(dtype=float) if 'recovery_years' in dark
+                else np.zeros(len(dark)))
+    keys = zip(dark['site_name'], dark['entity_name'])
+
+    features = pd.DataFrame({
+        'magnitude': np.abs(dark['shift_magnitude'].to_numpy(dtype=float)),
+        'recovery': recovery,
+        'nearby_caves': np.fromiter((cluster_counts.get(k, 0) for k in keys),
+                                    dtype=np.int64, count=len(dark)),
+        'fault_name': site_fault_name[location_id],
+        'fault_dist': site_fault_dist[location_id],
+        'seismic_zone': site_zone[location_id],
+    }, index=dark.index)
+    if not include_gem:
+        return features
+
+    # GEM nearest fault (one batched query) and coverage per location
+    if gem_faults is None or gem_tree is None:
+        gem_faults, gem_tree = load_gem_faults()
+    gem_idx, gem_km = get_nearest_gem_faults(site_lat, site_lon, gem_faults, gem_tree,
+                                             max_distance_km=GEM_SEARCH_RADIUS_KM)
+    gem_names = np.array([f['name'] for f in gem_faults] + [None], dtype=object)
+    site_gem_name = gem_names[gem_idx]
+    site_gem_dist = np.where(gem_idx >= 0, gem_km.astype(object), None)
+    site_coverage = check_fault_coverage_batch(site_lat, site_lon, 500, gem_faults)
+
+    # SISAL caves within 500 km of each location
+    if all_sites is None:
+        all_sites = dark[['site_name', 'lat', 'lon']].drop_duplicates()
+    site_caves = count_sisal_caves_in_region_batch(site_lat, site_lon, 500, all_sites)
+
+    features['gem_fault_name'] = site_gem_name[location_id]
+    features['gem_fault_dist'] = site_gem_dist[location_id]
+    features['fault_coverage'] = site_coverage[location_id]
+    features['caves_in_region'] = site_caves[location_id]
+    return features
+
+
+# =============================================================================
+# Vectorized Scoring Components
+# =============================================================================
+# Each component maps the feature table to (points, evidence text) arrays;
+# text is None where a component contributes no evidence.
+
+def _fmt(values: np.ndarray, spec: str) -> np.ndarray:
+    """Format each value with a format spec (object array of str)."""
+    return np.array([format(v, spec) for v in values], dtype=object)
+
+
+def _component(conditions: List[np.ndarray], points: List[int],
+               texts: List[np.ndarray], default_points=0, default_text=None):
+    """np.select over paired (points, text) choices."""
+    n = len(conditions[0])
+    score = np.select(conditions, points, default_points)
+    text = np.select(conditions, [np.broadcast_to(np.asarray(t, dtype=object), n) for t in texts],
+                     np.broadcast_to(np.asarray(default_text, dtype=object), n))
+    return score, text
+
+
+def _magnitude_component(f: pd.DataFrame):
+    mag = f['magnitude'].to_numpy()
+    z = _fmt(mag, '.2f')
+    return _component(
+        [mag >= 3.0, mag >= 2.5, mag >= 2.0], [25, 20, 15],
+        ["Very strong shift (z=" + z + ")", "Strong shift (z=" + z + ")",
+         "Significant shift (z=" + z + ")"],
+        10, "Moderate shift (z=" + z + ")")
+
+
+def _recovery_component(f: pd.DataFrame, short_note: str = " - possibly climatic"):
+    recovery = f['recovery'].to_numpy()
+    has = ~np.isnan(recovery) & (recovery > 0)
+    years = _fmt(recovery, '.0f')
+    return _component(
+        [has & (recovery >= 20), has & (recovery >= 10), has & (recovery >= 5), has],
+        [25, 20, 10, 5],
+        ["Long recovery (" + years + " years) - SEISMIC SIGNATURE",
+         "Extended recovery (" + years + " years)",
+         "Moderate recovery (" + years + " years)",
+         "Short recovery (" + _fmt(recovery, '.1f') + f" years){short_note}"])
+
+
+def _clustering_component(f: pd.DataFrame):
+    caves = f['nearby_caves'].to_numpy()
+    n = caves.astype(str).astype(object)
+    return _component(
+        [caves >= 3, caves >= 2, caves >= 1], [25, 20, 10],
+        ["Strong temporal cluster (" + n + " caves)", "Temporal cluster (" + n + " caves)",
+         "Possible cluster (" + n + " other cave)"],
+        0, "Single-cave detection")
+
+
+def _coverage_clustering_component(f: pd.DataFrame):
+    """Vectorized calculate_coverage_adjusted_clustering()."""
+    caves = f['nearby_caves'].to_numpy()
+    region = f['caves_in_region'].to_numpy()
+    n = caves.astype(str).astype(object)
+    r = region.astype(str).astype(object)
+    sparse, moderate = region <= 2, region <= 5
+    return _component(
+        [sparse,
+         moderate & (caves >= 2), moderate & (caves >= 1), moderate,
+         caves >= 3, caves >= 2, caves >= 1],
+        [15, 25, 15, 10, 25, 20, 10],
+        ["Sparse regional coverage (" + r + " caves within 500km - clustering N/A)",
+         "Strong cluster (" + n + " caves in moderately-sampled region)",
+         "Weak cluster (" + n + " cave in moderately-sampled region)",
+         "Isolated in moderately-sampled region (" + r + " caves)",
+         "Strong cluster (" + n + " caves in well-sampled region)",
+         "Temporal cluster (" + n + " caves in well-sampled region)",
+         "Weak cluster (" + n + " cave in well-sampled region)"],
+        5, "Isolated detection in well-sampled region (" + r + " caves) - suspicious")
+
+
+def _join_evidence(*parts: np.ndarray) -> np.ndarray:
+    """Join per-candidate evidence texts with '; ', skipping absent ones."""
+    return np.array(["; ".join(p for p in row if p is not None) for row in zip(*parts)],
+                    dtype=object)
+
+
+def _score(*components) -> Tuple[np.ndarray, np.ndarray]:
+    score = sum(points for points, _ in components)
+    return score, _join_evidence(*(text for _, text in components))
+
+
+# =============================================================================
+# Scoring Variants
+# =============================================================================
+
+def score_original(f: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized calculate_confidence_score(): near known faults = bonus."""
+    dist = f['fault_dist'].to_numpy(dtype=float)
+    km = _fmt(dist, '.0f')
+    has = ~np.isnan(dist)
+    proximity = _component(
+        [has & (dist <= 100), has & (dist <= 300), has & (dist <= 500), has],
+        [25, 20, 15, 5],
+        ["Near major fault (" + km + " km)", "Moderate fault distance (" + km + " km)",
+         "Regional fault context (" + km + " km)", "Distant from known faults (" + km + " km)"])
+    return _score(_magnitude_component(f), _recovery_component(f), proximity,
+                  _clustering_component(f))
+
+
+def score_inverted(f: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized calculate_confidence_score_inverted(): far from known faults = discovery."""
+    dist = f['fault_dist'].to_numpy(dtype=float)
+    km = _fmt(dist, '.0f')
+    has = ~np.isnan(dist)
+    proximity = _component(
+        [has & (dist > 500), has & (dist > 300), has & (dist > 100), has],
+        [20, 15, 10, 25],
+        ["POTENTIAL UNKNOWN FAULT - distant from known faults (" + km + " km)",
+         "Possible unknown fault (" + km + " km from known)",
+         "Moderate distance from known faults (" + km + " km)",
+         "Near known active fault (" + km + " km)"])
+    return _score(_magnitude_component(f), _recovery_component(f), proximity,
+                  _clustering_component(f))
+
+
+def score_no_proximity(f: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized calculate_confidence_score_no_proximity(): fault distance noted, not scored."""
+    dist = f['fault_dist'].to_numpy(dtype=float)
+    context = _component(
+        [~np.isnan(dist)], [0],
+        ["[" + _fmt(dist, '.0f') + " km from known fault - not scored]"])
+    return _score(_magnitude_component(f), _recovery_component(f), context,
+                  _clustering_component(f))
+
+
+def score_gem(f: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """GEM faults with coverage awareness plus coverage-adjusted clustering."""
+    unmapped = (f['fault_coverage'] == "NO_COVERAGE").to_numpy()
+    dist = pd.to_numeric(f['gem_fault_dist']).to_numpy(dtype=float)
+    has = ~np.isnan(dist)
+    km = _fmt(dist, '.0f')
+    name = _fmt(f['gem_fault_name'].to_numpy(dtype=object), '')
+    proximity = _component(
+        [unmapped, has & (dist <= 50), has & (dist <= 150), has & (dist <= 300), has],
+        [20, 25, 20, 15, 10],
+        ["UNMAPPED REGION - potential unknown fault",
+         "Near GEM fault: " + name + " (" + km + " km)",
+         "GEM fault: " + name + " (" + km + " km)",
+         "Regional: " + name + " (" + km + " km)",
+         "Distant (" + km + " km)"],
+        5, "GEM query failed")
+    return _score(_magnitude_component(f), _recovery_component(f, short_note=""), proximity,
+                  _coverage_clustering_component(f))
+
+
+# Registered variants: name -> (scorer, reports GEM fault columns)
+SCORING_VARIANTS = {
+    'original': (score_original, False),
+    'inverted': (score_inverted, False),
+    'no_proximity': (score_no_proximity, False),
+    'gem': (score_gem, True),
+}
 
 
 # =============================================================================
@@ -787,14 +1183,17 @@ def calculate_coverage_adjusted_clustering(lat: float, lon: float,
 
 def run_comparative_analysis(anomalies_path: Optional[Path] = None) -> Dict[str, pd.DataFrame]:
     """
-    Run all 4 scoring variants and compare results.
+    Run all scoring variants and compare results.
 
-    Variants:
+    Variants (see SCORING_VARIANTS):
     1. Original - current scoring (near known faults = bonus)
     2. Inverted - far from known faults = potential discovery
     3. No proximity - removes fault factor entirely
     4. GEM - uses global fault database with coverage awareness
 
+    Candidate features are extracted once; each variant is a vectorized
+    scorer over that feature table.
+
     Returns dict of DataFrames, one per variant.
     """
     if anomalies_path is None:
@@ -807,7 +1206,7 @@ def run_comparative_analysis(anomalies_path: Optional[Path] = None) -> Dict[str,
     # Load anomalies
     df = pd.read_csv(anomalies_path)
     dark = df[df['classification'].str.contains('DARK', na=False)].copy()
-    print(f"\nAnalyzing {len(dark)} dark candidates with 4 scoring methods...")
+    print(f"\nAnalyzing {len(dark)} dark candidates with {len(SCORING_VARIANTS)} scoring methods...")
 
     # Get all sites for coverage calculation
     all_sites = dark[['site_name', 'lat', 'lon']].drop_duplicates()
@@ -820,131 +1219,40 @@ def run_comparative_analysis(anomalies_path: Optional[Path] = None) -> Dict[str,
             key = (m['site'], m['entity'])
             cluster_counts[key] = cluster_counts.get(key, 0) + len(members)
 
-    # Load GEM faults once
+    # Load GEM faults once, then extract features once for all variants
     gem_faults, gem_tree = load_gem_faults()
+    features = extract_candidate_features(dark, cluster_counts, gem_faults, gem_tree, all_sites)
+
+    zone = features['seismic_zone'].to_numpy(dtype=object)
+    zone_suffix = np.array([f"; Zone: {z}" if pd.notna(z) and z else "" for z in zone], dtype=object)
+    recovery_years = (dark['recovery_years'].to_numpy() if 'recovery_years' in dark
+                      else np.full(len(dark), np.nan))
 
     results = {}
 
-    for variant in ['original', 'inverted', 'no_proximity', 'gem']:
+    for variant, (scorer, uses_gem) in SCORING_VARIANTS.items():
         print(f"\n--- Running {variant.upper()} scoring ---")
-        candidates = []
-
-        for idx, row in dark.iterrows():
-            # Get hardcoded fault proximity (for original/inverted/no_proximity)
-            fault_name, fault_dist = get_nearest_fault(row['lat'], row['lon'])
-
-            # Get cluster count
-            key = (row['site_name'], row['entity_name'])
-            nearby_caves = cluster_counts.get(key, 0)
-
-            # Get GEM fault data (for gem variant)
-            gem_fault_name, gem_fault_dist = get_nearest_gem_fault(
-                row['lat'], row['lon'], gem_faults, gem_tree
-            )
-            fault_coverage = check_fault_coverage(
-                row['lat'], row['lon'], 500, gem_faults, gem_tree
-            )
-
-            # Calculate score based on variant
-            if variant == 'original':
-                score, evidence = calculate_confidence_score(row, nearby_caves, fault_dist)
-            elif variant == 'inverted':
-                score, evidence = calculate_confidence_score_inverted(row, nearby_caves, fault_dist)
-            elif variant == 'no_proximity':
-                score, evidence = calculate_confidence_score_no_proximity(row, nearby_caves, fault_dist)
-            elif variant == 'gem':
-                # Also use coverage-adjusted clustering
-                cluster_score, cluster_evidence = calculate_coverage_adjusted_clustering(
-                    row['lat'], row['lon'], nearby_caves, all_sites
-                )
-
-                # Custom scoring for GEM variant with adjusted clustering
-                mag = abs(row['shift_magnitude'])
-                recovery = row.get('recovery_years', 0)
-
-                score = 0
-                evidence_parts = []
-
-                # Magnitude
-                if mag >= 3.0:
-                    score += 25
-                    evidence_parts.append(f"Very strong shift (z={mag:.2f})")
-                elif mag >= 2.5:
-                    score += 20
-                    evidence_parts.append(f"Strong shift (z={mag:.2f})")
-                elif mag >= 2.0:
-                    score += 15
-                    evidence_parts.append(f"Significant shift (z={mag:.2f})")
-                else:
-                    score += 10
-                    evidence_parts.append(f"Moderate shift (z={mag:.2f})")
-
-                # Recovery
-                if pd.notna(recovery) and recovery > 0:
-                    if recovery >= 20:
-                        score += 25
-                        evidence_parts.append(f"Long recovery ({recovery:.0f} years) - SEISMIC SIGNATURE")
-                    elif recovery >= 10:
-                        score += 20
-                        evidence_parts.append(f"Extended recovery ({recovery:.0f} years)")
-                    elif recovery >= 5:
-                        score += 10
-                        evidence_parts.append(f"Moderate recovery ({recovery:.0f} years)")
-                    else:
-                        score += 5
-                        evidence_parts.append(f"Short recovery ({recovery:.1f} years)")
-
-                # GEM fault proximity with coverage awareness
-                if fault_coverage == "NO_COVERAGE":
-                    score += 20
-                    evidence_parts.append("UNMAPPED REGION - potential unknown fault")
-                elif gem_fault_dist is not None:
-                    if gem_fault_dist <= 50:
-                        score += 25
-                        evidence_parts.append(f"Near GEM fault: {gem_fault_name} ({gem_fault_dist:.0f} km)")
-                    elif gem_fault_dist <= 150:
-                        score += 20
-                        evidence_parts.append(f"GEM fault: {gem_fault_name} ({gem_fault_dist:.0f} km)")
-                    elif gem_fault_dist <= 300:
-                        score += 15
-                        evidence_parts.append(f"Regional: {gem_fault_name} ({gem_fault_dist:.0f} km)")
-                    else:
-                        score += 10
-                        evidence_parts.append(f"Distant ({gem_fault_dist:.0f} km)")
-                else:
-                    score += 5
-                    evidence_parts.append("GEM query failed")
-
-                # Coverage-adjusted clustering
-                score += cluster_score
-                evidence_parts.append(cluster_evidence)
-
-                evidence = "; ".join(evidence_parts)
-
-            # Get seismic zone
-            zone = get_seismic_zone(row['lat'], row['lon'])
-            if zone:
-                evidence += f"; Zone: {zone}"
-
-            candidates.append({
-                'year_ce': row['year_ce'],
-                'site_name': row['site_name'],
-                'entity_name': row['entity_name'],
-                'latitude': row['lat'],
-                'longitude': row['lon'],
-                'shift_magnitude': row['shift_magnitude'],
-                'recovery_years': row.get('recovery_years', np.nan),
-                'confidence_score': score,
-                'evidence': evidence,
-                'nearest_fault': fault_name if variant != 'gem' else gem_fault_name,
-                'fault_distance_km': fault_dist if variant != 'gem' else gem_fault_dist,
-                'fault_coverage': fault_coverage if variant == 'gem' else None,
-                'seismic_zone': zone,
-                'cluster_caves': nearby_caves,
-                'scoring_method': variant
-            })
-
-        result_df = pd.DataFrame(candidates)
+
+        score, evidence = scorer(features)
+
+        result_df = pd.DataFrame({
+            'year_ce': dark['year_ce'].to_numpy(),
+            'site_name': dark['site_name'].to_numpy(),
+            'entity_name': dark['entity_name'].to_numpy(),
+            'latitude': dark['lat'].to_numpy(),
+            'longitude': dark['lon'].to_numpy(),
+            'shift_magnitude': dark['shift_magnitude'].to_numpy(),
+            'recovery_years': recovery_years,
+            'confidence_score': score,
+            'evidence': evidence + zone_suffix,
+            'nearest_fault': features['gem_fault_name' if uses_gem else 'fault_name'].to_numpy(),
+            'fault_distance_km': pd.to_numeric(
+                features['gem_fault_dist' if uses_gem else 'fault_dist']).to_numpy(),
+            'fault_coverage': features['fault_coverage'].to_numpy() if uses_gem else None,
+            'seismic_zone': zone,
+            'cluster_caves': features['nearby_caves'].to_numpy(),
+            'scoring_method': variant
+        })
         result_df = result_df.sort_values('confidence_score', ascending=False)
         results[variant] = result_df
 
@@ -1073,44 +1381,33 @@ def classify_dark_quakes(anomalies_path: Optional[Path] = None) -> pd.DataFrame:
             key = (m['site'], m['entity'])
             cluster_counts[key] = cluster_counts.get(key, 0) + len(members)
 
-    # Classify each candidate
+    # Score all candidates at once (same features and scorer as the
+    # 'original' variant of run_comparative_analysis)
     print("\nClassifying candidates...")
-    candidates = []
-
-    for idx, row in dark.iterrows():
-        # Get fault proximity
-        fault_name, fault_dist = get_nearest_fault(row['lat'], row['lon'])
-
-        # Get cluster count
-        key = (row['site_name'], row['entity_name'])
-        nearby_caves = cluster_counts.get(key, 0)
-
-        # Calculate confidence
-        score, evidence = calculate_confidence_score(row, nearby_caves, fault_dist)
-
-        # Get seismic zone
-        zone = get_seismic_zone(row['lat'], row['lon'])
-        if zone:
-            evidence += f"; Zone: {zone}"
-
-        candidates.append({
-            'year_ce': row['year_ce'],
-            'site_name': row['site_name'],
-            'entity_name': row['entity_name'],
-            'latitude': row['lat'],
-            'longitude': row['lon'],
-            'shift_magnitude': row['shift_magnitude'],
-            'recovery_years': row.get('recovery_years', np.nan),
-            'confidence_score': score,
-            'evidence': evidence,
-            'nearest_fault': fault_name,
-            'fault_distance_km': fault_dist,
-            'seismic_zone': zone,
-            'cluster_caves': nearby_caves,
-            'classification': row['classification']
-        })
-
-    result = pd.DataFrame(candidates)
+    features = extract_candidate_features(dark, cluster_counts, include_gem=False)
+    score, evidence = score_original(features)
+
+    zone = features['seismic_zone'].to_numpy(dtype=object)
+    zone_suffix = np.array([f"; Zone: {z}" if pd.notna(z) and z else "" for z in zone], dtype=object)
+    recovery_years = (dark['recovery_years'].to_numpy() if 'recovery_years' in dark
+                      else np.full(len(dark), np.nan))
+
+    result = pd.DataFrame({
+        'year_ce': dark['year_ce'].to_numpy(),
+        'site_name': dark['site_name'].to_numpy(),
+        'entity_name': dark['entity_name'].to_numpy(),
+        'latitude': dark['lat'].to_numpy(),
+        'longitude': dark['lon'].to_numpy(),
+        'shift_magnitude': dark['shift_magnitude'].to_numpy(),
+        'recovery_years': recovery_years,
+        'confidence_score': score,
+        'evidence': evidence + zone_suffix,
+        'nearest_fault': features['fault_name'].to_numpy(),
+        'fault_distance_km': features['fault_dist'].to_numpy(),
+        'seismic_zone': zone,
+        'cluster_caves': features['nearby_caves'].to_numpy(),
+        'classification': dark['classification'].to_numpy()
+    })
     result = result.sort_values('confidence_score', ascending=False)
 
     return result
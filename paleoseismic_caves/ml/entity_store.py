@@ -0,0 +1,224 @@
+"""
+Contiguous Per-Entity Time Series Store
+
+Holds every entity's time series in one "ragged array": a single buffer per
+column (ages, raw values, z-scores), sorted by (entity, age), plus an offsets
+index. Entity i occupies rows offsets[i]:offsets[i+1] of every buffer, so
+looking up an entity returns slice views with no copying.
+
+The store behaves like the dicts returned by SISALLoader.get_entity_timeseries()
+and get_entity_trace_timeseries() ({entity_id: {'ages', '<proxy>', '<proxy>_z',
+'metadata'}}), so GlobalScanner and filter_historical_era can iterate it directly.
+
+On disk it is a directory of .npy files (opened memory-mapped) plus a JSON
+file with the per-entity metadata.
+"""
+
+import json
+import warnings
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class EntitySeriesStore(Mapping):
+    """Read-only mapping of entity_id -> time series dict backed by contiguous buffers."""
+
+    def __init__(self, entity_ids: np.ndarray, offsets: np.ndarray,
+                 columns: Dict[str, np.ndarray], metadata: List[dict],
+                 present: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            entity_ids: (n_entities,) entity IDs in storage order
+            offsets: (n_entities + 1,) row offsets into the column buffers
+            columns: {column name: (n_rows,) buffer}, must include 'ages'
+            metadata: Per-entity metadata dicts in storage order
+            present: Optional {column name: (n_entities,) bool} marking which
+                entities carry a column (trace proxies are not universal)
+        """
+        self.entity_ids = np.asarray(entity_ids)
+        self.offsets = np.asarray(offsets)
+        self.columns = columns
+        self.metadata = metadata
+        self.present = present or {}
+        self._index = {int(e): i for i, e in enumerate(self.entity_ids)}
+
+    def __getitem__(self, entity_id) -> dict:
+        i = self._index[int(entity_id)]
+        start, end = self.offsets[i], self.offsets[i + 1]
+
+        data = {}
+        for name, buffer in self.columns.items():
+            if name in self.present and not self.present[name][i]:
+                continue
+            data[name] = buffer[start:end]
+        data['metadata'] = self.metadata[i]
+        return data
+
+    def __iter__(self):
+        return (int(e) for e in self.entity_ids)
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def lengths(self) -> np.ndarray:
+        """Number of samples per entity, in storage order."""
+        return np.diff(self.offsets)
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, proxies: List[str],
+                       min_samples: int, require_all: bool = True) -> 'EntitySeriesStore':
+        """
+        Build a store from a joined SISAL dataframe.
+
+        Mirrors SISALLoader.get_entity_timeseries() (require_all=True: every
+        entity needs min_samples rows) and get_entity_trace_timeseries()
+        (require_all=False: an entity needs min_samples valid values in ANY
+        proxy, and a proxy is kept for an entity if it has 2+ valid values).
+
+        Args:
+            df: Joined dataframe with entity_id, site_id, site_name,
+                entity_name, lat, lon, age_ce and the proxy columns
+            proxies: Proxy columns to store (with z-scores)
+            min_samples: Minimum samples required for an entity
+            require_all: Entity-selection rule, see above
+
+        Returns:
+            EntitySeriesStore
+        """
+        proxies = [p for p in proxies if p in df.columns]
+        values = {p: pd.to_numeric(df[p], errors='coerce') for p in proxies}
+        df = df.assign(**values)
+
+        # Entity selection
+        if require_all:
+            counts = df.groupby('entity_id').size()
+            keep = counts.index[counts >= min_samples]
+        else:
+            valid_counts = df.groupby('entity_id')[proxies].count()
+            keep = valid_counts.index[(valid_counts >= min_samples).any(axis=1)]
+
+        df = df[df['entity_id'].isin(keep)]
+        df = df.sort_values(['entity_id', 'age_ce'], kind='stable')
+
+        groups = df.groupby('entity_id', sort=False)
+        sizes = groups.size()
+        entity_ids = sizes.index.to_numpy()
+        offsets = np.concatenate([[0], np.cumsum(sizes.to_numpy())]).astype(np.int64)
+
+        columns = {'ages': df['age_ce'].to_numpy(dtype=float)}
+        present = {}
+        proxy_stats = {}
+
+        for proxy in proxies:
+            raw = df[proxy].to_numpy(dtype=float)
+            n_valid = groups[proxy].count().to_numpy()
+
+            # Per-entity stats with numpy's own reductions (same rounding as
+            # the dict builders), then z-scores over the whole buffer at once
+            means = np.full(len(entity_ids), np.nan)
+            stds = np.full(len(entity_ids), np.nan)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                for i in np.flatnonzero(n_valid > 0):
+                    segment = raw[offsets[i]:offsets[i + 1]]
+                    means[i] = np.nanmean(segment)
+                    stds[i] = np.nanstd(segment)
+
+            mean = np.repeat(means, np.diff(offsets))
+            std = np.repeat(stds, np.diff(offsets))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                z = np.where(std > 0, (raw - mean) / std, 0.0)
+
+            columns[proxy] = raw
+            columns[f'{proxy}_z'] = z
+
+            if not require_all:
+                present[proxy] = present[f'{proxy}_z'] = n_valid > 1
+            proxy_stats[proxy] = (means, stds, n_valid)
+
+        # Metadata from the first (earliest) row of each entity
+        first = df.iloc[offsets[:-1]]
+        age_min = columns['ages'][offsets[:-1]]
+        age_max = columns['ages'][offsets[1:] - 1]
+
+        metadata = []
+        for i in range(len(entity_ids)):
+            row = first.iloc[i]
+            meta = {}
+            if not require_all:
+                for proxy, (means, stds, n_valid) in proxy_stats.items():
+                    if present[proxy][i]:
+                        meta[f'{proxy}_mean'] = float(means[i])
+                        meta[f'{proxy}_std'] = float(stds[i])
+                        meta[f'{proxy}_n'] = int(n_valid[i])
+            meta.update({
+                'site_id': int(row['site_id']),
+                'site_name': row['site_name'],
+                'entity_name': row['entity_name'],
+                'lat': float(row['lat']),
+                'lon': float(row['lon']),
+                'n_samples': int(offsets[i + 1] - offsets[i]),
+                'age_min': float(age_min[i]),
+                'age_max': float(age_max[i]),
+            })
+            if require_all:
+                for proxy, (means, stds, _) in proxy_stats.items():
+                    meta[f'{proxy}_mean'] = float(means[i])
+                    meta[f'{proxy}_std'] = float(stds[i])
+            metadata.append(meta)
+
+        return cls(entity_ids, offsets, columns, metadata, present)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: Path):
+        """Write the store to a directory of .npy buffers plus metadata.json."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        np.save(path / 'entity_ids.npy', self.entity_ids)
+        np.save(path / 'offsets.npy', self.offsets)
+        for name, buffer in self.columns.items():
+            np.save(path / f'col_{name}.npy', np.ascontiguousarray(buffer))
+        for name, mask in self.present.items():
+            np.save(path / f'present_{name}.npy', mask)
+
+        with open(path / 'metadata.json', 'w') as f:
+            json.dump({
+                'columns': list(self.columns),
+                'present': list(self.present),
+                'metadata': self.metadata,
+            }, f, default=_json_default)
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> 'EntitySeriesStore':
+        """Open a saved store; buffers are memory-mapped read-only by default."""
+        path = Path(path)
+        mode = 'r' if mmap else None
+
+        with open(path / 'metadata.json') as f:
+            header = json.load(f)
+
+        columns = {name: np.load(path / f'col_{name}.npy', mmap_mode=mode)
+                   for name in header['columns']}
+        present = {name: np.load(path / f'present_{name}.npy')
+                   for name in header['present']}
+
+        return cls(np.load(path / 'entity_ids.npy'), np.load(path / 'offsets.npy'),
+                   columns, header['metadata'], present)
+
+
+def _json_default(value):
+    """Convert numpy scalars in metadata for json.dump."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
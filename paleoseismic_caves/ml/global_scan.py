@@ -2,7 +2,8 @@
 Global PELT Change Point Detection on SISAL δ18O Records
 
 Runs unsupervised anomaly detection on ALL speleothem records in SISAL v3 database.
-Uses ruptures library with PELT algorithm to find abrupt shifts in δ18O time series.
+Uses the PELT algorithm to find abrupt shifts in δ18O time series, either with
+the native L2 engine in pelt.py (default) or the ruptures library.
 
 Output: Ranked list of all detected change points with:
 - Entity/cave metadata
@@ -11,31 +12,60 @@ Output: Ranked list of all detected change points with:
 - Duration and recovery characteristics
 """
 
+import os
 import numpy as np
 import pandas as pd
-import ruptures as rpt
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple
 import warnings
 
 from sisal_loader import SISALLoader
+from pelt import DEFAULT_JUMP, L2Segmenter, pelt_l2, select_segmentation
+from scan_cache import ScanCache
 
 warnings.filterwarnings('ignore')
 
+# One row per change point from GlobalScanner.characterize_change_points()
+CHANGE_POINT_DTYPE = np.dtype([
+    ('cp_idx', np.int64),
+    ('year_ce', np.float64),
+    ('shift_magnitude', np.float64),
+    ('mean_before', np.float64),
+    ('mean_after', np.float64),
+    ('recovery_samples', np.int64),
+    ('recovery_years', np.float64),
+    ('years_per_sample', np.float64),
+])
+
 
 class GlobalScanner:
     """Run PELT change point detection on all SISAL entities."""
 
-    def __init__(self, penalty: float = 10.0, min_size: int = 3):
+    def __init__(self, penalty: float = 10.0, min_size: int = 3, n_jobs: int = 1,
+                 backend: str = 'native'):
         """
         Initialize scanner.
 
         Args:
             penalty: PELT penalty parameter (higher = fewer change points)
             min_size: Minimum segment size between change points
+            n_jobs: Worker processes for scan_all/scan_all_proxies
+                (1 = serial, None or -1 = all CPUs)
+            backend: PELT engine, 'native' (pelt.py) or 'ruptures'.
+                Both give the same change points.
         """
+        if backend not in ('native', 'ruptures'):
+            raise ValueError(f"Unknown PELT backend: {backend}")
+
         self.penalty = penalty
         self.min_size = min_size
+        self.n_jobs = os.cpu_count() if n_jobs in (None, -1) else max(1, n_jobs)
+        self.backend = backend
+
+        # CROPS solution paths:
+        # (entity_id, min_year, max_year) -> (series hash, pen_min, pen_max, path)
+        self._paths = {}
 
     def detect_change_points(self, signal: np.ndarray) -> List[int]:
         """
@@ -47,11 +77,35 @@ class GlobalScanner:
         Returns:
             List of change point indices
         """
+        signal = self._prepare_signal(signal)
+        if signal is None:
+            return []
+
+        # Run PELT with L2 cost (piecewise constant model)
+        if self.backend == 'native':
+            try:
+                change_points = pelt_l2(signal, self.penalty, min_size=self.min_size)
+            except ValueError:
+                return []
+            # Remove the last element (always equals signal length)
+            return change_points[:-1]
+
+        import ruptures as rpt
+        algo = rpt.Pelt(model="l2", min_size=self.min_size).fit(signal)
+        try:
+            change_points = algo.predict(pen=self.penalty)
+            # Remove the last element (always equals signal length)
+            return change_points[:-1]
+        except Exception as e:
+            return []
+
+    def _prepare_signal(self, signal: np.ndarray) -> np.ndarray:
+        """Interpolate NaNs; None if the series is too short or empty for PELT."""
         # Handle NaN values by interpolation
         signal = np.array(signal, dtype=float)
         nans = np.isnan(signal)
         if nans.all():
-            return []
+            return None
         if nans.any():
             # Linear interpolation for NaN values
             idx = np.arange(len(signal))
@@ -59,15 +113,31 @@ class GlobalScanner:
 
         # Need at least 2*min_size samples
         if len(signal) < 2 * self.min_size:
-            return []
+            return None
 
-        # Run PELT with L2 cost (piecewise constant model)
-        algo = rpt.Pelt(model="l2", min_size=self.min_size).fit(signal)
+        return signal
+
+    def solution_path(self, signal: np.ndarray, pen_min: float, pen_max: float) -> list:
+        """
+        Every optimal PELT segmentation for penalties in [pen_min, pen_max].
+
+        Uses the native engine (CROPS, see pelt.py) whatever the backend.
+
+        Args:
+            signal: 1D array of z-scores
+            pen_min: Lowest penalty of interest
+            pen_max: Highest penalty of interest
+
+        Returns:
+            Solution path for pelt.select_segmentation() (empty if the series
+            cannot be segmented)
+        """
+        signal = self._prepare_signal(signal)
+        if signal is None:
+            return []
         try:
-            change_points = algo.predict(pen=self.penalty)
-            # Remove the last element (always equals signal length)
-            return change_points[:-1]
-        except Exception as e:
+            return L2Segmenter(signal, self.min_size).solution_path(pen_min, pen_max)
+        except ValueError:
             return []
 
     def characterize_change_point(self, signal: np.ndarray, ages: np.ndarray,
@@ -84,58 +154,96 @@ class GlobalScanner:
         Returns:
             Dict with change point characteristics
         """
+        chars = self.characterize_change_points(signal, ages, [cp_idx], window)
+        return _char_dict(chars[0])
+
+    def characterize_change_points(self, signal: np.ndarray, ages: np.ndarray,
+                                    change_points: List[int], window: int = 10,
+                                    recovery_horizon: int = 50,
+                                    recovery_threshold: float = 0.5) -> np.ndarray:
+        """
+        Characterize all change points of a series at once.
+
+        Window means come from prefix sums of the (NaN-skipping) signal; the
+        recovery time is the first sample within recovery_threshold of the
+        pre-change mean, searched over a (n_cp x recovery_horizon) matrix.
+
+        Args:
+            signal: z-score time series
+            ages: corresponding ages (CE)
+            change_points: indices of change points
+            window: samples before/after to analyze
+            recovery_horizon: max samples to look ahead for recovery
+            recovery_threshold: "back to baseline" distance (sigma)
+
+        Returns:
+            Structured array (CHANGE_POINT_DTYPE), one row per change point
+        """
+        signal = np.asarray(signal, dtype=float)
+        ages = np.asarray(ages, dtype=float)
+        cps = np.asarray(change_points, dtype=np.int64)
         n = len(signal)
 
+        chars = np.zeros(len(cps), dtype=CHANGE_POINT_DTYPE)
+        chars['cp_idx'] = cps
+        if len(cps) == 0:
+            return chars
+
+        # Prefix sums of values and valid counts (NaN-skipping means)
+        valid = ~np.isnan(signal)
+        sums = np.concatenate([[0.0], np.cumsum(np.where(valid, signal, 0.0))])
+        counts = np.concatenate([[0], np.cumsum(valid)])
+
         # Get before/after windows
-        before_start = max(0, cp_idx - window)
-        after_end = min(n, cp_idx + window)
+        before_start = np.maximum(0, cps - window)
+        after_end = np.minimum(n, cps + window)
 
-        before = signal[before_start:cp_idx]
-        after = signal[cp_idx:after_end]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_before = (sums[cps] - sums[before_start]) / (counts[cps] - counts[before_start])
+            mean_after = (sums[after_end] - sums[cps]) / (counts[after_end] - counts[cps])
 
-        # Calculate shift magnitude
-        if len(before) > 0 and len(after) > 0:
-            mean_before = np.nanmean(before)
-            mean_after = np.nanmean(after)
-            shift = mean_after - mean_before
-        else:
-            mean_before = mean_after = shift = np.nan
+        # Calculate shift magnitude (undefined if either window is empty)
+        has_windows = (cps > before_start) & (after_end > cps)
+        mean_before = np.where(has_windows, mean_before, np.nan)
+        mean_after = np.where(has_windows, mean_after, np.nan)
 
-        # Get age at change point
-        age_ce = ages[cp_idx] if cp_idx < len(ages) else np.nan
+        chars['mean_before'] = mean_before
+        chars['mean_after'] = mean_after
+        chars['shift_magnitude'] = mean_after - mean_before
 
-        # Estimate recovery time (how long until signal returns to baseline)
-        recovery_samples = 0
-        baseline = mean_before
-        for i in range(cp_idx, min(n, cp_idx + 50)):
-            if abs(signal[i] - baseline) < 0.5:  # Within 0.5 sigma
-                break
-            recovery_samples += 1
+        # Get age at change point
+        in_range = cps < len(ages)
+        chars['year_ce'] = np.where(in_range, ages[np.minimum(cps, len(ages) - 1)], np.nan)
+
+        # Estimate recovery time (samples until signal is back within the
+        # threshold of the pre-change baseline; NaN never counts as recovered)
+        idx = cps[:, None] + np.arange(recovery_horizon)
+        in_series = idx < n
+        with np.errstate(invalid='ignore'):
+            recovered = in_series & (np.abs(signal[np.minimum(idx, n - 1)] - mean_before[:, None])
+                                     < recovery_threshold)
+        chars['recovery_samples'] = np.where(recovered.any(axis=1),
+                                             recovered.argmax(axis=1),
+                                             in_series.sum(axis=1))
 
         # Convert samples to years (estimate)
-        if cp_idx > 0 and cp_idx < len(ages) - 1:
-            years_per_sample = abs(ages[cp_idx + 1] - ages[cp_idx - 1]) / 2
-        else:
-            years_per_sample = np.nan
-
-        recovery_years = recovery_samples * years_per_sample if not np.isnan(years_per_sample) else np.nan
+        interior = (cps > 0) & (cps < len(ages) - 1)
+        lo = np.clip(cps - 1, 0, len(ages) - 1)
+        hi = np.clip(cps + 1, 0, len(ages) - 1)
+        years_per_sample = np.where(interior, np.abs(ages[hi] - ages[lo]) / 2, np.nan)
+        chars['years_per_sample'] = years_per_sample
+        chars['recovery_years'] = chars['recovery_samples'] * years_per_sample
 
-        return {
-            'year_ce': age_ce,
-            'shift_magnitude': shift,
-            'mean_before': mean_before,
-            'mean_after': mean_after,
-            'recovery_samples': recovery_samples,
-            'recovery_years': recovery_years,
-            'years_per_sample': years_per_sample
-        }
+        return chars
 
-    def scan_entity(self, entity_data: dict) -> List[dict]:
+    def scan_entity(self, entity_data: dict, change_points: List[int] = None) -> List[dict]:
         """
         Scan a single entity for change points.
 
         Args:
             entity_data: Dict with 'ages', 'd18O_z', 'metadata'
+            change_points: Precomputed change points (e.g. from a solution
+                path); detected with self.penalty if None
 
         Returns:
             List of detected anomalies with characteristics
@@ -145,17 +253,18 @@ class GlobalScanner:
         metadata = entity_data['metadata']
 
         # Detect change points
-        change_points = self.detect_change_points(signal)
+        if change_points is None:
+            change_points = self.detect_change_points(signal)
 
-        # Characterize each
-        anomalies = []
-        for cp_idx in change_points:
-            char = self.characterize_change_point(signal, ages, cp_idx)
+        # Characterize all at once
+        chars = self.characterize_change_points(signal, ages, change_points)
 
-            # Only keep significant shifts (>1 sigma)
-            if abs(char['shift_magnitude']) < 1.0:
-                continue
+        # Only keep significant shifts (>1 sigma)
+        chars = chars[~(np.abs(chars['shift_magnitude']) < 1.0)]
 
+        anomalies = []
+        for row in chars:
+            char = _char_dict(row)
             anomaly = {
                 'entity_id': metadata.get('entity_id', None),
                 'site_name': metadata['site_name'],
@@ -197,15 +306,15 @@ class GlobalScanner:
         # Detect change points
         change_points = self.detect_change_points(signal)
 
-        # Characterize each
-        anomalies = []
-        for cp_idx in change_points:
-            char = self.characterize_change_point(signal, ages, cp_idx)
+        # Characterize all at once
+        chars = self.characterize_change_points(signal, ages, change_points)
 
-            # Only keep significant shifts
-            if abs(char['shift_magnitude']) < min_shift:
-                continue
+        # Only keep significant shifts
+        chars = chars[~(np.abs(chars['shift_magnitude']) < min_shift)]
 
+        anomalies = []
+        for row in chars:
+            char = _char_dict(row)
             anomaly = {
                 'entity_id': metadata.get('entity_id', None),
                 'site_name': metadata['site_name'],
@@ -219,20 +328,67 @@ class GlobalScanner:
 
         return anomalies
 
+    def _run_units(self, units: List[Tuple[dict, str]],
+                   min_shift: float = 1.0) -> List[List[dict]]:
+        """
+        Scan (entity_data, proxy) work units, serially or on a process pool.
+
+        proxy=None scans δ18O with scan_entity(). Pool units are submitted
+        longest series first so large entities don't straggle at the end;
+        results come back in unit order either way, so the output matches
+        the serial path exactly.
+
+        Args:
+            units: List of (entity_data, proxy) pairs
+            min_shift: Minimum shift magnitude for proxy scans (in sigma)
+
+        Returns:
+            List of anomaly lists, one per unit, in input order
+        """
+        if self.n_jobs == 1 or len(units) < 2:
+            return [self.scan_entity(data) if proxy is None
+                    else self.scan_entity_proxy(data, proxy, min_shift)
+                    for data, proxy in units]
+
+        results = [[] for _ in units]
+        order = sorted(range(len(units)), key=lambda i: -len(units[i][0]['ages']))
+
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+            futures = {}
+            for i in order:
+                data, proxy = units[i]
+                payload = _unit_payload(data, proxy)
+                if payload is None:
+                    continue
+                future = pool.submit(_scan_unit, self.penalty, self.min_size,
+                                     self.backend, payload, proxy, min_shift)
+                futures[future] = i
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     def scan_all_proxies(self, entities: Dict[int, dict],
                          proxies: List[str] = None,
                          min_year: int = None,
                          max_year: int = None,
-                         min_shift: float = 1.0) -> pd.DataFrame:
+                         min_shift: float = 1.0,
+                         cache: ScanCache = None) -> pd.DataFrame:
         """
         Scan all entities for change points across multiple proxies.
 
         Args:
-            entities: Dict from SISALLoader.get_entity_trace_timeseries()
+            entities: Dict from SISALLoader.get_entity_trace_timeseries() or
+                an EntitySeriesStore from get_entity_store('trace')
             proxies: List of proxy names to scan (e.g., ['Ba_Ca', 'U_Ca'])
             min_year: Optional filter for minimum year
             max_year: Optional filter for maximum year
             min_shift: Minimum shift magnitude to report (in sigma)
+            cache: Optional ScanCache. With a cache, PELT runs on each full
+                series and the year window is applied to the change points
+                afterwards, so changing min_year/max_year/min_shift never
+                triggers a rescan (see _scan_cached)
 
         Returns:
             DataFrame of all detected anomalies across all proxies
@@ -242,9 +398,13 @@ class GlobalScanner:
 
         print(f"Scanning {len(entities)} entities for change points in {proxies}...")
         print(f"  PELT penalty: {self.penalty}, min_size: {self.min_size}")
+        if self.n_jobs > 1:
+            print(f"  Workers: {self.n_jobs}")
 
-        all_anomalies = []
-        proxy_counts = {p: 0 for p in proxies}
+        if cache is not None:
+            return self._scan_cached(entities, proxies, min_year, max_year, min_shift, cache)
+
+        units = []
 
         for entity_id, data in entities.items():
             # Add entity_id to metadata
@@ -273,28 +433,92 @@ class GlobalScanner:
             else:
                 filtered_data = data
 
-            # Scan each proxy
+            # One work unit per proxy
             for proxy in proxies:
-                anomalies = self.scan_entity_proxy(filtered_data, proxy, min_shift)
-                if anomalies:
-                    all_anomalies.extend(anomalies)
-                    proxy_counts[proxy] += len(anomalies)
+                units.append((filtered_data, proxy))
+
+        all_anomalies = []
+        proxy_counts = {p: 0 for p in proxies}
+
+        for (_, proxy), anomalies in zip(units, self._run_units(units, min_shift)):
+            if anomalies:
+                all_anomalies.extend(anomalies)
+                proxy_counts[proxy] += len(anomalies)
 
         print(f"  Total anomalies: {len(all_anomalies)}")
         for proxy, count in proxy_counts.items():
             print(f"    {proxy}: {count}")
 
-        if not all_anomalies:
-            return pd.DataFrame()
+        return _anomaly_frame(all_anomalies)
+
+    def _scan_cached(self, entities: Dict[int, dict], proxies: List[str],
+                     min_year: int, max_year: int, min_shift: float,
+                     cache: ScanCache) -> pd.DataFrame:
+        """
+        scan_all_proxies() through a persistent change point cache.
+
+        Each (entity, proxy) series is looked up by content hash; only new or
+        changed series are scanned (all change points, min_shift=0). The
+        year window and min_shift are then applied to the records.
+        """
+        lookups = []
+        units = []
+
+        for entity_id, data in entities.items():
+            # Add entity_id to metadata
+            data['metadata']['entity_id'] = entity_id
+
+            for proxy in proxies:
+                z_col = f'{proxy}_z'
+                if z_col not in data:
+                    continue
+
+                digest = cache.series_hash(data['ages'], data[z_col])
+                records = cache.get(entity_id, proxy, self.penalty, self.min_size, digest)
+                if records is None:
+                    units.append((data, proxy))
+                lookups.append((entity_id, data, proxy, digest, records))
+
+        print(f"  Scan cache: {len(lookups) - len(units)} series cached, {len(units)} to scan")
+
+        # Scan the misses and store their unfiltered change points
+        computed = iter(self._run_units(units, min_shift=0.0))
+        for i, (entity_id, data, proxy, digest, records) in enumerate(lookups):
+            if records is None:
+                records = next(computed)
+                cache.put(entity_id, proxy, self.penalty, self.min_size, digest, records)
+                lookups[i] = (entity_id, data, proxy, digest, records)
+        cache.save()
+
+        all_anomalies = []
+        proxy_counts = {p: 0 for p in proxies}
+
+        for entity_id, data, proxy, _, records in lookups:
+            metadata = data['metadata']
+            current = {
+                'entity_id': metadata.get('entity_id', None),
+                'site_name': metadata['site_name'],
+                'entity_name': metadata['entity_name'],
+                'lat': metadata['lat'],
+                'lon': metadata['lon'],
+            }
 
-        # Convert to DataFrame
-        df = pd.DataFrame(all_anomalies)
+            for record in records:
+                year = record['year_ce']
+                if min_year is not None and not year >= min_year:
+                    continue
+                if max_year is not None and not year <= max_year:
+                    continue
+                if abs(record['shift_magnitude']) < min_shift:
+                    continue
+                all_anomalies.append({**record, **current})
+                proxy_counts[proxy] += 1
 
-        # Sort by absolute magnitude
-        df['abs_magnitude'] = df['shift_magnitude'].abs()
-        df = df.sort_values('abs_magnitude', ascending=False)
+        print(f"  Total anomalies: {len(all_anomalies)}")
+        for proxy, count in proxy_counts.items():
+            print(f"    {proxy}: {count}")
 
-        return df
+        return _anomaly_frame(all_anomalies)
 
     def scan_all(self, entities: Dict[int, dict],
                  min_year: int = None, max_year: int = None) -> pd.DataFrame:
@@ -302,7 +526,8 @@ class GlobalScanner:
         Scan all entities for change points.
 
         Args:
-            entities: Dict from SISALLoader.get_entity_timeseries()
+            entities: Dict from SISALLoader.get_entity_timeseries() or
+                an EntitySeriesStore from get_entity_store()
             min_year: Optional filter for minimum year
             max_year: Optional filter for maximum year
 
@@ -311,64 +536,217 @@ class GlobalScanner:
         """
         print(f"Scanning {len(entities)} entities for change points...")
         print(f"  PELT penalty: {self.penalty}, min_size: {self.min_size}")
+        if self.n_jobs > 1:
+            print(f"  Workers: {self.n_jobs}")
 
-        all_anomalies = []
-        entities_with_anomalies = 0
+        units = []
 
         for entity_id, data in entities.items():
             # Add entity_id to metadata
             data['metadata']['entity_id'] = entity_id
 
             # Optionally filter by year range
-            if min_year is not None or max_year is not None:
-                ages = data['ages']
-                mask = np.ones(len(ages), dtype=bool)
-                if min_year is not None:
-                    mask &= ages >= min_year
-                if max_year is not None:
-                    mask &= ages <= max_year
+            filtered_data = self._filter_years(data, min_year, max_year)
+            if filtered_data is None:
+                continue
 
-                if mask.sum() < 10:
-                    continue
+            units.append((filtered_data, None))
 
-                filtered_data = {
-                    'ages': ages[mask],
-                    'd18O_z': data['d18O_z'][mask],
-                    'd18O': data['d18O'][mask],
-                    'metadata': data['metadata']
-                }
-            else:
-                filtered_data = data
+        all_anomalies = []
+        entities_with_anomalies = 0
 
-            # Scan this entity
-            anomalies = self.scan_entity(filtered_data)
+        for anomalies in self._run_units(units):
             if anomalies:
                 all_anomalies.extend(anomalies)
                 entities_with_anomalies += 1
 
         print(f"  Found {len(all_anomalies)} change points in {entities_with_anomalies} entities")
 
-        if not all_anomalies:
-            return pd.DataFrame()
+        return _anomaly_frame(all_anomalies)
+
+    def scan_all_penalties(self, entities: Dict[int, dict], penalties: List[float],
+                           min_year: int = None, max_year: int = None) -> Dict[float, pd.DataFrame]:
+        """
+        Scan all entities at several penalties in one pass per series.
+
+        Same results as GlobalScanner(penalty=p).scan_all(...) for each p, but
+        each series is segmented once over [min(penalties), max(penalties)]
+        (CROPS) and every penalty's change points are read off that path.
+        Paths stay cached on the scanner (keyed by series content), so later
+        calls with penalties inside an already-covered range cost no PELT
+        runs at all.
+
+        CROPS needs exactly optimal segmentations, which the ruptures-compatible
+        PELT only guarantees for min_size <= pelt.DEFAULT_JUMP; above that each
+        penalty is scanned separately.
+
+        Args:
+            entities: Dict from SISALLoader.get_entity_timeseries() or
+                an EntitySeriesStore from get_entity_store()
+            penalties: PELT penalties to report
+            min_year: Optional filter for minimum year
+            max_year: Optional filter for maximum year
+
+        Returns:
+            Dict of {penalty: DataFrame of anomalies, sorted by magnitude}
+        """
+        if not penalties:
+            return {}
+
+        if self.min_size > DEFAULT_JUMP:
+            return {pen: GlobalScanner(penalty=pen, min_size=self.min_size, n_jobs=self.n_jobs,
+                                       backend=self.backend).scan_all(entities, min_year, max_year)
+                    for pen in penalties}
+
+        pen_min, pen_max = min(penalties), max(penalties)
+
+        print(f"Scanning {len(entities)} entities for change points...")
+        print(f"  PELT penalties: {list(penalties)}, min_size: {self.min_size}")
+
+        # Filter and find series without a cached path covering the range
+        series = []
+        missing = []
+        for entity_id, data in entities.items():
+            data['metadata']['entity_id'] = entity_id
+
+            filtered_data = self._filter_years(data, min_year, max_year)
+            if filtered_data is None:
+                continue
+
+            # A path is only reused for the same series content
+            key = (entity_id, min_year, max_year)
+            digest = ScanCache.series_hash(filtered_data['ages'], filtered_data['d18O_z'])
+            cached = self._paths.get(key)
+            if cached is not None and cached[0] != digest:
+                cached = None
+            if cached is None or cached[1] > pen_min or cached[2] < pen_max:
+                lo = pen_min if cached is None else min(pen_min, cached[1])
+                hi = pen_max if cached is None else max(pen_max, cached[2])
+                missing.append((key, digest, filtered_data['d18O_z'], lo, hi))
+            series.append((key, filtered_data))
+
+        print(f"  Solution paths: {len(series) - len(missing)} cached, {len(missing)} to compute")
+        paths = self._run_paths([(key, signal, lo, hi) for key, _, signal, lo, hi in missing])
+        for (key, digest, _, lo, hi), path in zip(missing, paths):
+            self._paths[key] = (digest, lo, hi, path)
+
+        results = {}
+        for pen in penalties:
+            all_anomalies = []
+            for key, filtered_data in series:
+                path = self._paths[key][3]
+                change_points = select_segmentation(path, pen)[:-1] if path else []
+                all_anomalies.extend(self.scan_entity(filtered_data, change_points))
+            results[pen] = _anomaly_frame(all_anomalies)
+
+        return results
+
+    def _run_paths(self, missing: List[tuple]) -> list:
+        """Compute solution paths for (key, signal, pen_min, pen_max), serially or on a process pool."""
+        if self.n_jobs == 1 or len(missing) < 2:
+            return [self.solution_path(signal, lo, hi) for _, signal, lo, hi in missing]
+
+        results = [[] for _ in missing]
+        order = sorted(range(len(missing)), key=lambda i: -len(missing[i][1]))
+
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+            futures = {}
+            for i in order:
+                _, signal, lo, hi = missing[i]
+                future = pool.submit(_path_unit, self.min_size, np.asarray(signal), lo, hi)
+                futures[future] = i
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
+    def _filter_years(self, data: dict, min_year: int = None, max_year: int = None) -> dict:
+        """Restrict a δ18O entity to a year window; None if under 10 samples remain."""
+        if min_year is None and max_year is None:
+            return data
+
+        ages = data['ages']
+        mask = np.ones(len(ages), dtype=bool)
+        if min_year is not None:
+            mask &= ages >= min_year
+        if max_year is not None:
+            mask &= ages <= max_year
+
+        if mask.sum() < 10:
+            return None
+
+        return {
+            'ages': ages[mask],
+            'd18O_z': data['d18O_z'][mask],
+            'd18O': data['d18O'][mask],
+            'metadata': data['metadata']
+        }
+
+
+def _char_dict(row: np.void) -> dict:
+    """One characterized change point as the dict used in anomaly records."""
+    return {name: row[name].item() for name in CHANGE_POINT_DTYPE.names[1:]}
 
-        # Convert to DataFrame
-        df = pd.DataFrame(all_anomalies)
 
-        # Sort by absolute magnitude
-        df['abs_magnitude'] = df['shift_magnitude'].abs()
-        df = df.sort_values('abs_magnitude', ascending=False)
+def _anomaly_frame(all_anomalies: List[dict]) -> pd.DataFrame:
+    """Anomaly records -> DataFrame sorted by absolute magnitude."""
+    if not all_anomalies:
+        return pd.DataFrame()
 
-        return df
+    # Convert to DataFrame
+    df = pd.DataFrame(all_anomalies)
 
+    # Sort by absolute magnitude
+    df['abs_magnitude'] = df['shift_magnitude'].abs()
+    df = df.sort_values('abs_magnitude', ascending=False)
 
-def run_sensitivity_analysis(entities: Dict, penalties: List[float] = [5, 10, 20, 50]):
+    return df
+
+
+def _unit_payload(data: dict, proxy: str) -> dict:
+    """
+    Trim an entity to what one work unit needs before sending it to a worker.
+
+    Returns None if the entity lacks the proxy (the unit has no anomalies).
+    np.asarray() also turns memory-mapped store slices into plain arrays.
+    """
+    z_col = 'd18O_z' if proxy is None else f'{proxy}_z'
+    if z_col not in data:
+        return None
+    return {
+        'ages': np.asarray(data['ages']),
+        z_col: np.asarray(data[z_col]),
+        'metadata': data['metadata']
+    }
+
+
+def _scan_unit(penalty: float, min_size: int, backend: str, data: dict,
+               proxy: str, min_shift: float) -> List[dict]:
+    """Process-pool worker: scan one (entity, proxy) unit."""
+    scanner = GlobalScanner(penalty=penalty, min_size=min_size, backend=backend)
+    if proxy is None:
+        return scanner.scan_entity(data)
+    return scanner.scan_entity_proxy(data, proxy, min_shift)
+
+
+def _path_unit(min_size: int, signal: np.ndarray, pen_min: float, pen_max: float) -> list:
+    """Process-pool worker: solution path of one series."""
+    return GlobalScanner(min_size=min_size).solution_path(signal, pen_min, pen_max)
+
+
+def run_sensitivity_analysis(entities: Dict, penalties: List[float] = [5, 10, 20, 50],
+                             n_jobs: int = 1):
     """Run scan with different penalty values to assess sensitivity."""
     print("\n=== PELT Sensitivity Analysis ===")
 
+    # One solution path per series covers every penalty
+    scanner = GlobalScanner(n_jobs=n_jobs)
+    scans = scanner.scan_all_penalties(entities, penalties, min_year=0, max_year=2000)
+
     results = {}
     for pen in penalties:
-        scanner = GlobalScanner(penalty=pen)
-        df = scanner.scan_all(entities, min_year=0, max_year=2000)
+        df = scans[pen]
         results[pen] = {
             'n_anomalies': len(df),
             'top_5_years': df['year_ce'].head(5).tolist() if len(df) > 0 else []
@@ -383,8 +761,7 @@ def main():
 
     # Load SISAL data
     loader = SISALLoader()
-    df = loader.load_all()
-    entities = loader.get_entity_timeseries(df, min_samples=20)
+    entities = loader.get_entity_store('d18O', min_samples=20)
 
     print(f"\n=== Running Global Change Point Detection ===")
     print(f"Entities: {len(entities)}")
@@ -19,6 +19,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 
+from tools_bridge import import_tool
+
 # ASF DAAC API endpoint
 ASF_SEARCH_URL = "https://api.daac.asf.alaska.edu/services/search/param"
 
@@ -86,8 +88,9 @@ def search_asf(bbox, start_date, end_date, product_type="SLC", platform="S1",
     print(f"  Period: {start_date} to {end_date}")
     print(f"  Product: {product_type}")
 
+    http_cache = import_tool("http_cache")
     try:
-        response = requests.get(ASF_SEARCH_URL, params=params, timeout=60)
+        response = http_cache.cached_get(ASF_SEARCH_URL, params=params, ttl=http_cache.DAY, timeout=60)
         response.raise_for_status()
         results = response.json()
 
@@ -99,7 +102,7 @@ def search_asf(bbox, start_date, end_date, product_type="SLC", platform="S1",
         print(f"  Found: {len(products)} products")
         return products
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, http_cache.HTTPCacheError) as e:
         print(f"  Error: {e}")
         return []
 
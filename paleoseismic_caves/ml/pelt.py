@@ -0,0 +1,190 @@
+"""
+Native PELT Change Point Detection (piecewise-constant L2 cost)
+
+Drop-in replacement for `rpt.Pelt(model="l2", min_size=...).fit(signal).predict(pen)`
+on the GlobalScanner hot path. Segment costs come from cumulative sums of
+the (centered) signal instead of recomputing a variance per candidate, and
+each step evaluates/prunes the whole admissible set with numpy.
+
+The recursion deliberately mirrors ruptures' Pelt so both backends return
+the same breakpoints:
+- candidate ends are subsampled every `jump` points (ruptures default: 5)
+- a start t is only usable once the optimal partition of [0:t] exists
+- ties go to the earliest admissible start
+- a start is pruned when F[t] + cost(t, end) > F[end]
+
+L2Segmenter.solution_path() runs CROPS (Haynes, Eckley & Fearnhead 2017):
+every optimal segmentation for a whole penalty range from a handful of PELT
+runs, after which any penalty in the range is a lookup.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+# ruptures' Pelt default
+DEFAULT_JUMP = 5
+
+
+class L2Segmenter:
+    """Prefix-sum statistics of one signal, reusable across PELT penalties."""
+
+    def __init__(self, signal: np.ndarray, min_size: int = 2, jump: int = DEFAULT_JUMP):
+        """
+        Args:
+            signal: Array of shape (n_samples,) or (n_samples, n_features), no NaN
+            min_size: Minimum segment length
+            jump: Only consider breakpoints at multiples of this
+        """
+        signal = np.asarray(signal, dtype=float)
+        if signal.ndim == 1:
+            signal = signal[:, None]
+        self.n = signal.shape[0]
+        self.min_size = max(min_size, 1)
+        self.jump = jump
+
+        if self.min_size > self.n:
+            raise ValueError(f"Signal of length {self.n} is shorter than min_size={self.min_size}")
+
+        # Prefix sums of the centered signal: cost(s, e) = sum over features of
+        # sum(x^2) - sum(x)^2 / (e - s). Centering keeps the subtraction well
+        # conditioned for z-scored and raw proxy values alike.
+        x = signal - signal.mean(axis=0)
+        self.s1 = np.zeros((self.n + 1, x.shape[1]))
+        self.s2 = np.zeros((self.n + 1, x.shape[1]))
+        np.cumsum(x, axis=0, out=self.s1[1:])
+        np.cumsum(x * x, axis=0, out=self.s2[1:])
+
+    def _cost(self, starts: np.ndarray, end) -> np.ndarray:
+        """L2 cost of segments [starts:end] (vectorized over starts and/or end)."""
+        length = np.asarray(end - starts)[..., None]
+        seg_sum = self.s1[end] - self.s1[starts]
+        seg_sq = self.s2[end] - self.s2[starts]
+        return np.maximum((seg_sq - seg_sum * seg_sum / length).sum(axis=-1), 0.0)
+
+    def segment(self, pen: float) -> List[int]:
+        """
+        Optimal segmentation for one penalty.
+
+        Args:
+            pen: Penalty per change point (higher = fewer change points)
+
+        Returns:
+            Sorted list of segment end indices; the last one is always n_samples
+            (same convention as ruptures' predict())
+        """
+        n, min_size, jump = self.n, self.min_size, self.jump
+
+        best_cost = np.zeros(n + 1)        # F[t]: optimal penalized cost of [0:t]
+        last_bkp = np.zeros(n + 1, dtype=np.int64)
+        solved = np.zeros(n + 1, dtype=bool)
+        solved[0] = True
+
+        ends = [k for k in range(0, n, jump) if k >= min_size] + [n]
+        admissible = np.empty(0, dtype=np.int64)
+
+        for end in ends:
+            new_start = (end - min_size) // jump * jump
+            admissible = np.append(admissible, new_start)
+
+            starts = admissible[solved[admissible]]
+            if len(starts) == 0:
+                raise ValueError(f"No admissible segmentation ending at {end}")
+
+            totals = best_cost[starts] + (self._cost(starts, end) + pen)
+
+            i = np.argmin(totals)
+            best_cost[end] = totals[i]
+            last_bkp[end] = starts[i]
+            solved[end] = True
+
+            # Pruning (ruptures pairs the surviving candidates with the head of
+            # the admissible list, which only differs when min_size > jump)
+            admissible = admissible[:len(starts)][totals <= best_cost[end] + pen]
+
+        bkps = []
+        end = n
+        while end > 0:
+            bkps.append(int(end))
+            end = last_bkp[end]
+
+        return sorted(bkps)
+
+    def segmentation_cost(self, bkps: List[int]) -> float:
+        """Unpenalized L2 cost of a segmentation (list of end indices)."""
+        ends = np.asarray(bkps, dtype=np.int64)
+        starts = np.concatenate([[0], ends[:-1]])
+        return float(self._cost(starts, ends).sum())
+
+    def solution_path(self, pen_min: float, pen_max: float) -> List[Tuple[List[int], float]]:
+        """
+        All optimal segmentations for penalties in [pen_min, pen_max] (CROPS).
+
+        Each PELT run at the intersection penalty of two known segmentations
+        either finds a new segmentation between them or proves there is none.
+
+        Args:
+            pen_min: Lowest penalty of interest
+            pen_max: Highest penalty of interest
+
+        Returns:
+            List of (bkps, cost), one per optimal number of change points,
+            fewest first; pass to select_segmentation()
+        """
+        found: Dict[int, Tuple[List[int], float]] = {}
+
+        def run(pen):
+            bkps = self.segment(pen)
+            found.setdefault(len(bkps), (bkps, self.segmentation_cost(bkps)))
+            return len(bkps)
+
+        m_lo, m_hi = run(pen_min), run(pen_max)
+        pending = [(m_lo, m_hi)]
+
+        while pending:
+            m_more, m_fewer = pending.pop()
+            if m_more <= m_fewer + 1:
+                continue
+
+            # Penalty where the two segmentations have equal penalized cost
+            cost_more, cost_fewer = found[m_more][1], found[m_fewer][1]
+            pen = (cost_fewer - cost_more) / (m_more - m_fewer)
+
+            m_mid = run(pen)
+            if m_fewer < m_mid < m_more:
+                pending.append((m_more, m_mid))
+                pending.append((m_mid, m_fewer))
+
+        return [found[m] for m in sorted(found)]
+
+
+def select_segmentation(path: List[Tuple[List[int], float]], pen: float) -> List[int]:
+    """
+    Read one penalty's segmentation off a solution path.
+
+    Args:
+        path: Output of L2Segmenter.solution_path() covering pen
+        pen: Penalty per change point
+
+    Returns:
+        Sorted list of segment end indices (last one is n_samples)
+    """
+    totals = [cost + pen * len(bkps) for bkps, cost in path]
+    return path[int(np.argmin(totals))][0]
+
+
+def pelt_l2(signal: np.ndarray, pen: float, min_size: int = 2,
+            jump: int = DEFAULT_JUMP) -> List[int]:
+    """
+    Penalized L2 change point detection.
+
+    Args:
+        signal: Array of shape (n_samples,) or (n_samples, n_features), no NaN
+        pen: Penalty per change point (higher = fewer change points)
+        min_size: Minimum segment length
+        jump: Only consider breakpoints at multiples of this
+
+    Returns:
+        Sorted list of segment end indices; the last one is always n_samples
+        (same convention as ruptures' predict())
+    """
+    return L2Segmenter(signal, min_size, jump).segment(pen)
@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 
+from spatial_index import SpatioTemporalIndex
+
 
 class ProxyCorrelator:
     """Find co-occurring anomalies and correlate with known events."""
@@ -46,57 +48,98 @@ class ProxyCorrelator:
 
         print(f"Finding coincident anomalies (window: ±{self.window_years} years)...")
 
-        clusters = []
-        processed = set()
-
-        # Group by entity first
-        for entity_id, entity_group in anomalies_df.groupby('entity_id'):
-            entity_group = entity_group.sort_values('year_ce')
-
-            for idx, row in entity_group.iterrows():
-                if idx in processed:
-                    continue
-
-                # Find all anomalies within window
-                year = row['year_ce']
-                window_mask = (
-                    (entity_group['year_ce'] >= year - self.window_years) &
-                    (entity_group['year_ce'] <= year + self.window_years)
-                )
-                cluster = entity_group[window_mask]
-
-                # Mark as processed
-                processed.update(cluster.index.tolist())
-
-                # Build cluster record
-                proxies = cluster['proxy'].unique().tolist()
-                cluster_record = {
-                    'entity_id': entity_id,
-                    'site_name': row['site_name'],
-                    'entity_name': row['entity_name'],
-                    'lat': row['lat'],
-                    'lon': row['lon'],
-                    'year_ce': cluster['year_ce'].mean(),
-                    'year_min': cluster['year_ce'].min(),
-                    'year_max': cluster['year_ce'].max(),
-                    'proxies': ','.join(sorted(proxies)),
-                    'n_proxies': len(proxies),
-                    'n_anomalies': len(cluster),
-                    'total_magnitude': cluster['shift_magnitude'].abs().sum(),
-                    'max_magnitude': cluster['shift_magnitude'].abs().max(),
-                }
-
-                # Add per-proxy magnitudes
-                for proxy in ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca', 'd18O']:
-                    proxy_data = cluster[cluster['proxy'] == proxy]
-                    if len(proxy_data) > 0:
-                        cluster_record[f'{proxy}_shift'] = proxy_data['shift_magnitude'].iloc[0]
-                    else:
-                        cluster_record[f'{proxy}_shift'] = np.nan
-
-                clusters.append(cluster_record)
-
-        result = pd.DataFrame(clusters)
+        # Sweep line over anomalies sorted by (entity, year). Each cluster is
+        # seeded by the first anomaly not yet in a cluster and spans
+        # [seed - window, seed + window]; everything up to the window's end
+        # counts as processed, so the next seed is simply the row after it.
+        df = anomalies_df[anomalies_df['entity_id'].notna()]
+        entity_codes, entity_ids = pd.factorize(df['entity_id'], sort=True)
+        years = df['year_ce'].to_numpy(dtype=float)
+        order = np.lexsort((years, entity_codes))
+
+        df = df.iloc[order]
+        entity_codes = entity_codes[order]
+        years = years[order]
+        n = len(df)
+
+        # Window bounds per row, searched within the row's entity
+        entity_starts = np.flatnonzero(np.r_[True, np.diff(entity_codes) != 0])
+        entity_ends = np.r_[entity_starts[1:], n]
+        window_lo = np.empty(n, dtype=np.int64)
+        window_hi = np.empty(n, dtype=np.int64)
+        for start, end in zip(entity_starts, entity_ends):
+            entity_years = years[start:end]
+            window_lo[start:end] = start + np.searchsorted(
+                entity_years, entity_years - self.window_years, side='left')
+            window_hi[start:end] = start + np.searchsorted(
+                entity_years, entity_years + self.window_years, side='right')
+
+        # A NaN year matches nothing: it seeds an empty cluster of its own
+        nan_year = np.isnan(years)
+        window_lo[nan_year] = window_hi[nan_year] = np.flatnonzero(nan_year)
+
+        seeds = []
+        window_end = window_hi.tolist()
+        for start, end in zip(entity_starts.tolist(), entity_ends.tolist()):
+            seed = start
+            while seed < end:
+                seeds.append(seed)
+                seed = max(window_end[seed], seed + 1)
+        seeds = np.asarray(seeds, dtype=np.int64)
+        lo, hi = window_lo[seeds], window_hi[seeds]
+        size = hi - lo
+
+        # Per-cluster aggregates with reduceat over [lo, hi) (pairs of
+        # indices; the padding row keeps hi == n in range)
+        shift = df['shift_magnitude'].to_numpy(dtype=float)
+        abs_shift = np.abs(shift)
+        bounds = np.column_stack([lo, hi]).ravel()
+
+        def window_reduce(ufunc, values, empty):
+            padded = np.r_[values, values[:1] if n else [0]]
+            out = ufunc.reduceat(padded, bounds)[::2]
+            return np.where(size > 0, out, empty)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            year_mean = window_reduce(np.add, np.nan_to_num(years), 0.0) / size
+        year_mean[size == 0] = np.nan
+
+        # Proxy sets as bitmasks over the sorted proxy names
+        proxy_codes, proxy_names = pd.factorize(df['proxy'], sort=True)
+        proxy_bits = np.left_shift(np.uint64(1), proxy_codes.astype(np.uint64))
+        masks = window_reduce(np.bitwise_or, proxy_bits, np.uint64(0))
+        proxy_sets = {}
+        for mask in np.unique(masks).tolist():
+            proxy_sets[mask] = [name for bit, name in enumerate(proxy_names) if mask >> bit & 1]
+
+        seed_rows = df.iloc[seeds]
+        result = pd.DataFrame({
+            'entity_id': entity_ids[entity_codes[seeds]],
+            'site_name': seed_rows['site_name'].to_numpy(),
+            'entity_name': seed_rows['entity_name'].to_numpy(),
+            'lat': seed_rows['lat'].to_numpy(),
+            'lon': seed_rows['lon'].to_numpy(),
+            'year_ce': year_mean,
+            'year_min': np.where(size > 0, years[np.minimum(lo, n - 1)], np.nan),
+            'year_max': np.where(size > 0, years[np.maximum(hi - 1, 0)], np.nan),
+            'proxies': [','.join(proxy_sets[m]) for m in masks.tolist()],
+            'n_proxies': [len(proxy_sets[m]) for m in masks.tolist()],
+            'n_anomalies': size,
+            'total_magnitude': window_reduce(np.add, np.nan_to_num(abs_shift), 0.0),
+            'max_magnitude': window_reduce(np.fmax, abs_shift, np.nan),
+        })
+
+        # Add per-proxy magnitudes (first anomaly of that proxy in the cluster)
+        proxy_column = df['proxy'].to_numpy()
+        for proxy in ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca', 'd18O']:
+            positions = np.flatnonzero(proxy_column == proxy)
+            first = np.searchsorted(positions, lo, side='left')
+            found = first < len(positions)
+            found[found] = positions[first[found]] < hi[found]
+            values = np.full(len(seeds), np.nan)
+            values[found] = shift[positions[first[found]]]
+            result[f'{proxy}_shift'] = values
+
         if len(result) > 0:
             result = result.sort_values('n_proxies', ascending=False)
 
@@ -160,7 +203,7 @@ class ProxyCorrelator:
         Args:
             clusters: DataFrame from find_coincident_anomalies
             earthquakes: Earthquake catalog with year, lat, lon, magnitude
-            distance_km: Maximum distance to consider a match
+            distance_km: Maximum great-circle distance to consider a match
             time_window: Years before/after anomaly to search
 
         Returns:
@@ -171,44 +214,26 @@ class ProxyCorrelator:
 
         print(f"Correlating with earthquakes (dist<{distance_km}km, window±{time_window}yr)...")
 
-        matches = []
-        for idx, cluster in clusters.iterrows():
-            # Time filter
-            eq_in_window = earthquakes[
-                (earthquakes['year'] >= cluster['year_ce'] - time_window) &
-                (earthquakes['year'] <= cluster['year_ce'] + time_window)
-            ]
+        # One batched query against a year-bucketed KD-tree over the catalog
+        index = SpatioTemporalIndex(earthquakes['lat'], earthquakes['lon'], earthquakes['year'])
+        nearest, distances = index.nearest(clusters['lat'], clusters['lon'], clusters['year_ce'],
+                                           radius_km=distance_km, time_window=time_window)
 
-            if len(eq_in_window) == 0:
-                matches.append({'eq_match': False})
-                continue
+        matched = nearest >= 0
+        match_df = pd.DataFrame({'eq_match': matched})
+        if matched.any():
+            eq = earthquakes.iloc[nearest[matched]]
 
-            # Distance filter (simple haversine approximation)
-            lat1, lon1 = cluster['lat'], cluster['lon']
-            distances = np.sqrt(
-                (eq_in_window['lat'] - lat1)**2 +
-                (eq_in_window['lon'] - lon1)**2
-            ) * 111  # Approximate km
+            def catalog_column(name, default):
+                values = np.full(len(clusters), np.nan, dtype=object)
+                values[matched] = eq[name].to_numpy() if name in eq.columns else default
+                return pd.Series(values).infer_objects()
 
-            nearby = eq_in_window[distances < distance_km]
+            match_df['eq_year'] = catalog_column('year', np.nan)
+            match_df['eq_magnitude'] = catalog_column('magnitude', np.nan)
+            match_df['eq_distance_km'] = np.where(matched, distances, np.nan)
+            match_df['eq_region'] = catalog_column('region', '')
 
-            if len(nearby) == 0:
-                matches.append({'eq_match': False})
-                continue
-
-            # Get closest earthquake
-            closest_idx = distances[distances < distance_km].idxmin()
-            eq = earthquakes.loc[closest_idx]
-
-            matches.append({
-                'eq_match': True,
-                'eq_year': eq.get('year', np.nan),
-                'eq_magnitude': eq.get('magnitude', np.nan),
-                'eq_distance_km': distances[closest_idx],
-                'eq_region': eq.get('region', ''),
-            })
-
-        match_df = pd.DataFrame(matches)
         result = pd.concat([clusters.reset_index(drop=True), match_df], axis=1)
 
         n_matched = result['eq_match'].sum()
@@ -10,7 +10,11 @@ Executes the full ML pipeline for Ba/Ca and U/Ca analysis:
 5. Output results and discovered patterns
 
 Usage:
-    python run_trace_scan.py [--min-year 0] [--max-year 2000] [--penalty 10]
+    python run_trace_scan.py [--min-year 0] [--max-year 2000] [--penalty 10] [--jobs 8]
+                             [--no-cache]
+
+Change points are cached per (entity, proxy, penalty) in ml/cache/scan_cache.pkl,
+so rerunning with a different year window only rescans entities whose data changed.
 """
 
 import argparse
@@ -21,6 +25,7 @@ from datetime import datetime
 
 from sisal_loader import SISALLoader
 from global_scan import GlobalScanner
+from scan_cache import ScanCache
 from proxy_correlation import ProxyCorrelator
 
 
@@ -28,7 +33,9 @@ def run_trace_element_scan(min_year: int = None,
                             max_year: int = None,
                             penalty: float = 10.0,
                             min_samples: int = 10,
-                            output_dir: str = None) -> dict:
+                            output_dir: str = None,
+                            n_jobs: int = 1,
+                            use_cache: bool = True) -> dict:
     """
     Run complete trace element anomaly detection pipeline.
 
@@ -38,6 +45,10 @@ def run_trace_element_scan(min_year: int = None,
         penalty: PELT penalty parameter (higher = fewer change points)
         min_samples: Minimum samples per entity to analyze
         output_dir: Directory for output files
+        n_jobs: Worker processes for PELT (1 = serial, -1 = all CPUs)
+        use_cache: Reuse cached change points for unchanged series. The
+            year window is then applied to change points detected on the
+            full series rather than to the series before detection.
 
     Returns:
         Dict with all results
@@ -64,8 +75,7 @@ def run_trace_element_scan(min_year: int = None,
     loader = SISALLoader()
     proxies = ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca']
 
-    df = loader.load_trace_elements(proxies)
-    entities = loader.get_entity_trace_timeseries(df, proxies, min_samples=min_samples)
+    entities = loader.get_entity_store('trace', proxies, min_samples=min_samples)
 
     print(f"\nLoaded {len(entities)} entities with trace element data")
 
@@ -74,13 +84,14 @@ def run_trace_element_scan(min_year: int = None,
     print("STEP 2: Running PELT change point detection")
     print("=" * 70)
 
-    scanner = GlobalScanner(penalty=penalty, min_size=3)
+    scanner = GlobalScanner(penalty=penalty, min_size=3, n_jobs=n_jobs)
     anomalies = scanner.scan_all_proxies(
         entities,
         proxies=proxies,
         min_year=min_year,
         max_year=max_year,
-        min_shift=1.0  # Minimum 1 sigma shift
+        min_shift=1.0,  # Minimum 1 sigma shift
+        cache=ScanCache() if use_cache else None
     )
 
     if len(anomalies) == 0:
@@ -200,6 +211,10 @@ def main():
                        help='Minimum samples per entity (default: 10)')
     parser.add_argument('--output', type=str, default=None,
                        help='Output directory')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Worker processes for PELT, -1 for all CPUs (default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Rescan every entity instead of using cached change points')
 
     args = parser.parse_args()
 
@@ -208,7 +223,9 @@ def main():
         max_year=args.max_year,
         penalty=args.penalty,
         min_samples=args.min_samples,
-        output_dir=args.output
+        output_dir=args.output,
+        n_jobs=args.jobs,
+        use_cache=not args.no_cache
     )
 
     return results
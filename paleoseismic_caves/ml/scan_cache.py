@@ -0,0 +1,84 @@
+"""
+Persistent Change Point Cache for GlobalScanner
+
+Stores the characterized change points of each (entity, proxy, penalty,
+min_size) together with a hash of the series they were computed from. On a
+rerun only series whose data changed are rescanned; everything else is read
+back from disk.
+
+Entries hold every change point of the FULL series (no min_shift, no year
+window), so those filters can be changed freely between runs.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import numpy as np
+from pathlib import Path
+from typing import List, Optional
+
+from sisal_loader import CACHE_DIR
+
+SCAN_CACHE_VERSION = 1
+
+
+class ScanCache:
+    """On-disk map of (entity, proxy, penalty, min_size) -> change point records."""
+
+    def __init__(self, path: Path = None):
+        """Open (or start) a cache file; default lives next to the SISAL snapshots."""
+        self.path = Path(path) if path is not None else CACHE_DIR / "scan_cache.pkl"
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('version') == SCAN_CACHE_VERSION:
+                    self.entries = data['entries']
+            except (pickle.UnpicklingError, EOFError, OSError, AttributeError):
+                print(f"  WARNING: Ignoring unreadable scan cache {self.path}")
+
+    @staticmethod
+    def series_hash(ages: np.ndarray, signal: np.ndarray) -> str:
+        """Content hash of one input series (ages + z-scores)."""
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(ages, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(signal, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _key(entity_id, proxy: str, penalty: float, min_size: int) -> tuple:
+        return (int(entity_id), proxy, float(penalty), int(min_size))
+
+    def get(self, entity_id, proxy: str, penalty: float, min_size: int,
+            series_hash: str) -> Optional[List[dict]]:
+        """Cached records, or None if missing or computed from different data."""
+        entry = self.entries.get(self._key(entity_id, proxy, penalty, min_size))
+        if entry is None or entry[0] != series_hash:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, entity_id, proxy: str, penalty: float, min_size: int,
+            series_hash: str, records: List[dict]):
+        """Store the records computed from a series."""
+        self.entries[self._key(entity_id, proxy, penalty, min_size)] = (series_hash, records)
+        self._dirty = True
+
+    def save(self):
+        """Write the cache to disk (atomic replace) if anything changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': SCAN_CACHE_VERSION, 'entries': self.entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.path)
+        self._dirty = False
@@ -23,6 +23,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 
+from tools_bridge import import_tool
+
 # Copernicus Data Space Ecosystem (successor to Scihub)
 CDSE_CATALOG = "https://catalogue.dataspace.copernicus.eu/odata/v1"
 CDSE_TOKEN = "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/protocol/openid-connect/token"
@@ -101,14 +103,15 @@ def search_cdse(bbox, start_date, end_date, max_cloud_cover=30, max_results=50):
     print(f"  Period: {start_date} to {end_date}")
     print(f"  Max cloud cover: {max_cloud_cover}%")
 
+    http_cache = import_tool("http_cache")
     try:
-        response = requests.get(url, params=params, timeout=60)
+        response = http_cache.cached_get(url, params=params, ttl=http_cache.DAY, timeout=60)
         response.raise_for_status()
         results = response.json()
         products = results.get("value", [])
         print(f"  Found: {len(products)} products")
         return products
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, http_cache.HTTPCacheError) as e:
         print(f"  Search failed: {e}")
         print("\nManual search: https://dataspace.copernicus.eu/browser/")
         return []
@@ -5,23 +5,58 @@ Loads δ18O time series from SISAL database, joins with chronology and metadata,
 and outputs standardized z-score time series per entity (cave speleothem).
 
 Join path: site → entity → sample → d18O + chronology
+
+The joined tables can be snapshotted to a columnar Parquet cache (requires
+pyarrow) with `SISALLoader.build_cache()` or `python sisal_loader.py --build-cache`.
+Snapshots are keyed by a hash of the source CSVs, so a new SISAL release
+invalidates them automatically.
 """
 
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import warnings
 
+from entity_store import EntitySeriesStore
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
 # Suppress pandas warnings about mixed dtypes
 warnings.filterwarnings('ignore', category=pd.errors.DtypeWarning)
 
+# Columnar cache of joined tables (one Parquet file per table and source hash)
+CACHE_DIR = Path(__file__).parent / "cache"
+CACHE_VERSION = 1
+
+TRACE_PROXIES = ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca']
+D18O_SOURCES = ['d18O.csv', 'sample.csv', 'sisal_chronology.csv', 'entity.csv', 'site.csv']
+TRACE_SOURCES = ['sample.csv', 'sisal_chronology.csv', 'entity.csv', 'site.csv']
+
+# Columns with fixed dtypes in the joined tables. Note that the d18O table
+# also carries entity.csv's 'Mg_Ca'/'d13C' availability flags, which are text.
+INT_COLUMNS = ['entity_id', 'site_id', 'sample_id']
+FLOAT_COLUMNS = {
+    'd18O': ['d18O', 'd18O_precision', 'age_bp', 'age_ce', 'lat', 'lon', 'elevation'],
+    'trace': ['age_bp', 'age_ce', 'lat', 'lon'] + TRACE_PROXIES,
+}
+
 
 class SISALLoader:
     """Load and process SISAL v3 database for anomaly detection."""
 
-    def __init__(self, sisal_path: str = None):
-        """Initialize with path to SISAL CSV directory."""
+    def __init__(self, sisal_path: str = None, cache_dir: str = None):
+        """Initialize with path to SISAL CSV directory and optional cache directory."""
         if sisal_path is None:
             # Default path relative to this script
             self.sisal_path = Path(__file__).parent.parent / "data" / "SISAL3" / \
@@ -29,6 +64,8 @@ class SISALLoader:
         else:
             self.sisal_path = Path(sisal_path)
 
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+
         self._validate_path()
 
     def _validate_path(self):
@@ -39,10 +76,16 @@ class SISALLoader:
             if not (self.sisal_path / f).exists():
                 raise FileNotFoundError(f"Required file not found: {self.sisal_path / f}")
 
-    def load_all(self) -> pd.DataFrame:
+    def load_all(self, columns: List[str] = None,
+                 use_cache: bool = True) -> pd.DataFrame:
         """
         Load and join all SISAL tables into a single dataframe.
 
+        Args:
+            columns: Optional subset of columns to return (read directly from
+                the columnar cache, so unused columns are never materialized)
+            use_cache: Read from / build the Parquet cache when pyarrow is available
+
         Returns DataFrame with columns:
         - entity_id, site_id, entity_name, site_name
         - lat, lon, elevation
@@ -50,6 +93,22 @@ class SISALLoader:
         - age_bp (best available chronology)
         - age_ce (converted to Common Era)
         """
+        if use_cache and pq is not None:
+            path = self._cache_path('d18O', D18O_SOURCES)
+            if not path.exists():
+                self._write_cache(self._join_d18o(), path, 'd18O')
+            print(f"Loading SISAL v3 database (cached: {path.name})...")
+            df = self._read_cache(path, columns)
+            print(f"  {len(df):,} records with age + d18O")
+            if 'entity_id' in df.columns:
+                print(f"  Entities with data: {df['entity_id'].nunique()}")
+            return df
+
+        df = self._join_d18o()
+        return df[columns] if columns is not None else df
+
+    def _join_d18o(self) -> pd.DataFrame:
+        """Parse the d18O CSVs and join them (see load_all for columns)."""
         print("Loading SISAL v3 database...")
 
         # Load tables (handle NA values)
@@ -57,7 +116,7 @@ class SISALLoader:
         d18o['d18O_measurement'] = pd.to_numeric(d18o['d18O_measurement'], errors='coerce')
         sample = pd.read_csv(self.sisal_path / 'sample.csv',
                             usecols=['entity_id', 'sample_id', 'mineralogy'])
-        chronology = pd.read_csv(self.sisal_path / 'sisal_chronology.csv')
+        chronology = self._load_chronology()
         entity = pd.read_csv(self.sisal_path / 'entity.csv',
                             usecols=['site_id', 'entity_id', 'entity_name',
                                     'speleothem_type', 'Mg_Ca', 'd13C'])  # exclude d18O flag
@@ -70,16 +129,6 @@ class SISALLoader:
         print(f"  entities: {len(entity):,}")
         print(f"  sites: {len(site):,}")
 
-        # Select best age model (priority: copRa > StalAge > lin_interp > lin_reg)
-        chronology['age_bp'] = chronology['copRa_age'].fillna(
-            chronology['StalAge_age'].fillna(
-                chronology['lin_interp_age'].fillna(
-                    chronology['lin_reg_age']
-                )
-            )
-        )
-        chronology = chronology[['sample_id', 'age_bp']].dropna()
-
         # Join: d18O → sample → chronology → entity → site
         df = d18o.merge(sample, on='sample_id', how='inner')
         df = df.merge(chronology, on='sample_id', how='inner')
@@ -103,6 +152,122 @@ class SISALLoader:
 
         return df
 
+    def _load_chronology(self) -> pd.DataFrame:
+        """Load sisal_chronology.csv and resolve one age per sample."""
+        chronology = pd.read_csv(self.sisal_path / 'sisal_chronology.csv')
+
+        # Select best age model (priority: copRa > StalAge > lin_interp > lin_reg)
+        chronology['age_bp'] = chronology['copRa_age'].fillna(
+            chronology['StalAge_age'].fillna(
+                chronology['lin_interp_age'].fillna(
+                    chronology['lin_reg_age']
+                )
+            )
+        )
+        return chronology[['sample_id', 'age_bp']].dropna()
+
+    # -------------------------------------------------------------------------
+    # Columnar cache
+    # -------------------------------------------------------------------------
+
+    def build_cache(self, force: bool = False) -> Dict[str, Path]:
+        """
+        Write the joined d18O and trace element tables to the Parquet cache.
+
+        Args:
+            force: Rebuild even if a snapshot for the current CSVs exists
+
+        Returns:
+            Dict of {table name: cache file path}
+        """
+        if pq is None:
+            raise ImportError("pyarrow is required for the SISAL cache. Run: pip install pyarrow")
+
+        paths = {}
+
+        path = self._cache_path('d18O', D18O_SOURCES)
+        if force or not path.exists():
+            self._write_cache(self._join_d18o(), path, 'd18O')
+        paths['d18O'] = path
+
+        trace_sources = TRACE_SOURCES + [f'{p}.csv' for p in TRACE_PROXIES]
+        path = self._cache_path('trace', trace_sources)
+        if force or not path.exists():
+            self._write_cache(self._join_trace_elements(TRACE_PROXIES), path, 'trace')
+        paths['trace'] = path
+
+        return paths
+
+    def _cache_path(self, table: str, sources: List[str]) -> Path:
+        """Cache file for a table, keyed by the hash of its source CSVs."""
+        digest = hashlib.sha1(f'v{CACHE_VERSION}'.encode())
+        for name in sources:
+            digest.update(name.encode())
+            digest.update(self._file_hash(self.sisal_path / name).encode())
+        return self.cache_dir / f"sisal_{table}_{digest.hexdigest()[:16]}.parquet"
+
+    def _file_hash(self, path: Path) -> str:
+        """
+        Content hash of a source CSV.
+
+        Hashes are remembered in the cache directory by (size, mtime) so an
+        unchanged file is only read once.
+        """
+        if not path.exists():
+            return 'missing'
+
+        stat = path.stat()
+        manifest_path = self.cache_dir / 'source_hashes.json'
+        manifest = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                manifest = {}
+
+        entry = manifest.get(str(path))
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha1']
+
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha1.update(chunk)
+
+        manifest[str(path)] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                               'sha1': sha1.hexdigest()}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=1)
+
+        return sha1.hexdigest()
+
+    def _write_cache(self, df: pd.DataFrame, path: Path, table: str):
+        """Normalize dtypes and write a joined table to Parquet."""
+        df = df.reset_index(drop=True)
+        float_columns = FLOAT_COLUMNS[table]
+        for col in INT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('int64')
+        for col in float_columns:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        for col in df.columns:
+            if col not in INT_COLUMNS and col not in float_columns and df[col].dtype == object:
+                df[col] = df[col].astype('string')
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        tmp_path.replace(path)
+        print(f"  Cached {len(df):,} rows to {path}")
+
+    def _read_cache(self, path: Path, columns: List[str] = None) -> pd.DataFrame:
+        """Memory-mapped read of (a subset of) the columns of a cached table."""
+        table = pq.read_table(path, columns=columns, memory_map=True)
+        return table.to_pandas()
+
     def get_entity_timeseries(self, df: pd.DataFrame = None,
                               min_samples: int = 20) -> Dict[int, dict]:
         """
@@ -214,12 +379,16 @@ class SISALLoader:
 
         return pd.DataFrame(rows).sort_values('n_samples', ascending=False)
 
-    def load_trace_elements(self, proxies: list = None) -> pd.DataFrame:
+    def load_trace_elements(self, proxies: list = None,
+                            columns: List[str] = None,
+                            use_cache: bool = True) -> pd.DataFrame:
         """
         Load trace element data (Ba/Ca, U/Ca, Mg/Ca, Sr/Ca) with chronology.
 
         Args:
             proxies: List of proxies to load. Default: ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca']
+            columns: Optional subset of non-proxy columns to return
+            use_cache: Read from / build the Parquet cache when pyarrow is available
 
         Returns:
             DataFrame with columns:
@@ -230,27 +399,43 @@ class SISALLoader:
         if proxies is None:
             proxies = ['Ba_Ca', 'U_Ca', 'Mg_Ca', 'Sr_Ca']
 
+        if use_cache and pq is not None and set(proxies) <= set(TRACE_PROXIES):
+            # One snapshot per requested proxy list: the outer join of a subset
+            # is not a row filter of the full join (replicate rows multiply)
+            trace_sources = TRACE_SOURCES + [f'{p}.csv' for p in proxies]
+            path = self._cache_path('trace', trace_sources)
+            if not path.exists():
+                self._write_cache(self._join_trace_elements(proxies), path, 'trace')
+
+            print(f"Loading trace elements: {proxies} (cached: {path.name})")
+            if columns is not None:
+                cached_columns = pq.read_schema(path).names
+                columns = list(columns) + [p for p in proxies if p in cached_columns]
+            result = self._read_cache(path, columns)
+
+            print(f"  {len(result):,} records with chronology")
+            if 'entity_id' in result.columns:
+                print(f"  Entities with trace data: {result['entity_id'].nunique()}")
+            return result
+
+        result = self._join_trace_elements(proxies)
+        if columns is not None:
+            result = result[list(columns) + [p for p in proxies if p in result.columns]]
+        return result
+
+    def _join_trace_elements(self, proxies: list) -> pd.DataFrame:
+        """Parse the trace element CSVs and join them (see load_trace_elements)."""
         print(f"Loading trace elements: {proxies}")
 
         # Load base tables
         sample = pd.read_csv(self.sisal_path / 'sample.csv',
                             usecols=['entity_id', 'sample_id'])
-        chronology = pd.read_csv(self.sisal_path / 'sisal_chronology.csv')
+        chronology = self._load_chronology()
         entity = pd.read_csv(self.sisal_path / 'entity.csv',
                             usecols=['site_id', 'entity_id', 'entity_name'])
         site = pd.read_csv(self.sisal_path / 'site.csv',
                           usecols=['site_id', 'site_name', 'latitude', 'longitude'])
 
-        # Select best age model
-        chronology['age_bp'] = chronology['copRa_age'].fillna(
-            chronology['StalAge_age'].fillna(
-                chronology['lin_interp_age'].fillna(
-                    chronology['lin_reg_age']
-                )
-            )
-        )
-        chronology = chronology[['sample_id', 'age_bp']].dropna()
-
         # Load each trace element file
         trace_dfs = {}
         for proxy in proxies:
@@ -391,6 +576,75 @@ class SISALLoader:
 
         return entities
 
+    def get_entity_store(self, table: str = 'd18O', proxies: list = None,
+                         min_samples: int = None, use_cache: bool = True) -> EntitySeriesStore:
+        """
+        Contiguous per-entity time series for whole-database scans.
+
+        Same contents as get_entity_timeseries() (table='d18O') or
+        get_entity_trace_timeseries() (table='trace'), but held in one sorted
+        buffer per column with an offsets index (see entity_store.py). Lookups
+        return slice views instead of copies.
+
+        With use_cache, the store is saved next to the Parquet snapshots,
+        keyed by the same source hash, and reopened memory-mapped.
+
+        Args:
+            table: 'd18O' or 'trace'
+            proxies: Trace proxies to include (table='trace' only)
+            min_samples: Minimum samples per entity (defaults as above: 20 / 10)
+
+        Returns:
+            EntitySeriesStore (iterates like the dicts above)
+        """
+        if table == 'd18O':
+            proxies = ['d18O']
+            min_samples = 20 if min_samples is None else min_samples
+            sources = D18O_SOURCES
+        elif table == 'trace':
+            proxies = proxies or TRACE_PROXIES
+            min_samples = 10 if min_samples is None else min_samples
+            sources = TRACE_SOURCES + [f'{p}.csv' for p in TRACE_PROXIES]
+        else:
+            raise ValueError(f"Unknown table: {table}")
+
+        store_path = None
+        if use_cache:
+            parquet_path = self._cache_path(table, sources)
+            store_path = parquet_path.with_name(
+                f"{parquet_path.stem}_store_{'-'.join(proxies)}_min{min_samples}")
+            if store_path.exists():
+                store = EntitySeriesStore.load(store_path)
+                print(f"\nOpened entity store: {len(store)} entities ({store_path.name})")
+                return store
+
+        if table == 'd18O':
+            df = self.load_all(use_cache=use_cache)
+        else:
+            df = self.load_trace_elements(proxies, use_cache=use_cache)
+
+        print(f"\nBuilding entity store (min_samples={min_samples})...")
+        store = EntitySeriesStore.from_dataframe(df, proxies, min_samples,
+                                                 require_all=(table == 'd18O'))
+        print(f"  Stored {len(store)} entities, {int(store.offsets[-1]):,} samples")
+
+        if store_path is not None:
+            # Build in a private directory, then rename into place; if another
+            # process got there first, its (identical) store is kept
+            tmp_path = Path(tempfile.mkdtemp(dir=store_path.parent, prefix=store_path.name + '.tmp-'))
+            try:
+                store.save(tmp_path)
+                try:
+                    tmp_path.replace(store_path)
+                except OSError:
+                    if not store_path.exists():
+                        raise
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            store = EntitySeriesStore.load(store_path)
+
+        return store
+
 
 def main():
     """Test the loader."""
@@ -415,4 +669,12 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--build-cache':
+        # One-time snapshot of the joined tables
+        paths = SISALLoader().build_cache(force='--force' in sys.argv)
+        for table, path in paths.items():
+            print(f"{table}: {path}")
+    else:
+        main()
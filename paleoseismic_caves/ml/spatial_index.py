@@ -0,0 +1,202 @@
+"""
+Spatial and Spatiotemporal Indexes for Catalog Matching
+
+Great-circle helpers (re-exported from tools/geodesy.py) plus
+SpatioTemporalIndex, which matches many (location, year) queries against a
+large event catalog (earthquakes, CFTI5Med, ISC-GEM, ...) in one batched call,
+and SiteIndex for radius counts against a fixed site list.
+
+Events are bucketed by year; each bucket holds a scipy cKDTree over 3D unit
+vectors, where a great-circle radius maps exactly to a chord length. A query
+only touches the buckets overlapping its time window, and exact haversine
+distances are computed only for the tree's candidates.
+"""
+
+import numpy as np
+from typing import Tuple
+
+from tools_bridge import import_tool
+
+# Great-circle kernels: one implementation, shared with the fault tools
+_geodesy = import_tool("geodesy")
+EARTH_RADIUS_KM = _geodesy.EARTH_RADIUS_KM
+haversine_km = _geodesy.haversine_km
+unit_vectors = _geodesy.unit_vectors
+point_segment_distance_km = _geodesy.point_segment_distance_km
+search_window = _geodesy.search_window
+
+
+def chord_length(distance_km) -> np.ndarray:
+    """Unit-sphere chord length for a great-circle distance in km."""
+    angle = np.minimum(np.asarray(distance_km, dtype=float) / EARTH_RADIUS_KM, np.pi)
+    return 2 * np.sin(angle / 2)
+
+
+class SpatioTemporalIndex:
+    """Year-bucketed KD-trees over an event catalog for nearest-in-window queries."""
+
+    def __init__(self, lat, lon, year, bucket_years: float = 10.0):
+        """
+        Build the index.
+
+        Args:
+            lat, lon: Event coordinates (degrees)
+            year: Event years (CE)
+            bucket_years: Width of the year buckets
+        """
+        from scipy.spatial import cKDTree
+
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        year = np.asarray(year, dtype=float)
+
+        # Events without a position or date can never match
+        valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon) | np.isnan(year)))
+
+        self.lat, self.lon, self.year = lat, lon, year
+        self.bucket_years = bucket_years
+        self.origin = year[valid].min() if len(valid) else 0.0
+
+        bucket = np.floor((year[valid] - self.origin) / bucket_years).astype(np.int64)
+        order = np.argsort(bucket, kind='stable')
+        valid, bucket = valid[order], bucket[order]
+
+        # bucket id -> (catalog positions, tree)
+        self.buckets = {}
+        if len(valid):
+            starts = np.flatnonzero(np.r_[True, np.diff(bucket) != 0])
+            ends = np.r_[starts[1:], len(valid)]
+            for start, end in zip(starts, ends):
+                members = valid[start:end]
+                self.buckets[int(bucket[start])] = (
+                    members, cKDTree(unit_vectors(lat[members], lon[members])))
+
+    def __len__(self) -> int:
+        return sum(len(members) for members, _ in self.buckets.values())
+
+    def nearest(self, lat, lon, year, radius_km: float,
+                time_window: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest event to each query within a distance and time window.
+
+        A match needs |event year - query year| <= time_window and a haversine
+        distance strictly below radius_km. Ties go to the earlier catalog row.
+
+        Args:
+            lat, lon: Query coordinates (degrees)
+            year: Query years (CE)
+            radius_km: Search radius
+            time_window: Years before/after each query year
+
+        Returns:
+            (catalog position of the match or -1, distance in km or NaN)
+        """
+        lat = np.atleast_1d(np.asarray(lat, dtype=float))
+        lon = np.atleast_1d(np.asarray(lon, dtype=float))
+        year = np.atleast_1d(np.asarray(year, dtype=float))
+        n = len(year)
+
+        best = np.full(n, -1, dtype=np.int64)
+        best_dist = np.full(n, np.nan)
+        if n == 0 or not self.buckets:
+            return best, best_dist
+
+        valid = ~(np.isnan(lat) | np.isnan(lon) | np.isnan(year))
+        first_bucket = np.floor((year - time_window - self.origin) / self.bucket_years)
+        last_bucket = np.floor((year + time_window - self.origin) / self.bucket_years)
+        points = unit_vectors(np.where(valid, lat, 0.0), np.where(valid, lon, 0.0))
+
+        # Slightly widened chord: the exact haversine test below decides
+        chord = float(chord_length(radius_km)) * (1 + 1e-9) + 1e-12
+
+        candidate_query = []
+        candidate_event = []
+        for bucket_id, (members, tree) in self.buckets.items():
+            queries = np.flatnonzero(valid & (first_bucket <= bucket_id) & (last_bucket >= bucket_id))
+            if len(queries) == 0:
+                continue
+
+            hits = tree.query_ball_point(points[queries], chord)
+            counts = np.fromiter((len(h) for h in hits), dtype=np.int64, count=len(hits))
+            if counts.sum() == 0:
+                continue
+            candidate_query.append(np.repeat(queries, counts))
+            candidate_event.append(members[np.concatenate([h for h in hits if h]).astype(np.int64)])
+
+        if not candidate_query:
+            return best, best_dist
+
+        q = np.concatenate(candidate_query)
+        e = np.concatenate(candidate_event)
+
+        # Exact time and distance tests
+        in_time = (self.year[e] >= year[q] - time_window) & (self.year[e] <= year[q] + time_window)
+        q, e = q[in_time], e[in_time]
+        dist = haversine_km(lat[q], lon[q], self.lat[e], self.lon[e])
+        close = dist < radius_km
+        q, e, dist = q[close], e[close], dist[close]
+
+        # Nearest per query (earliest catalog row on ties)
+        order = np.lexsort((e, dist, q))
+        q, e, dist = q[order], e[order], dist[order]
+        first = np.r_[True, q[1:] != q[:-1]]
+        best[q[first]] = e[first]
+        best_dist[q[first]] = dist[first]
+
+        return best, best_dist
+
+
+class SiteIndex:
+    """KD-tree over fixed sites for great-circle radius counts."""
+
+    def __init__(self, lat, lon):
+        """
+        Build the index.
+
+        Args:
+            lat, lon: Site coordinates (degrees); sites without a position are ignored
+        """
+        from scipy.spatial import cKDTree
+
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+
+        self.lat, self.lon = lat[valid], lon[valid]
+        self.tree = cKDTree(unit_vectors(self.lat, self.lon))
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def count_within(self, lat, lon, radius_km: float) -> np.ndarray:
+        """
+        Number of sites within radius_km (haversine distance <= radius_km) of each query.
+
+        Args:
+            lat, lon: Query coordinates (degrees)
+            radius_km: Search radius
+
+        Returns:
+            (n_queries,) int64 counts (0 for queries without a position)
+        """
+        lat = np.atleast_1d(np.asarray(lat, dtype=float))
+        lon = np.atleast_1d(np.asarray(lon, dtype=float))
+        counts = np.zeros(len(lat), dtype=np.int64)
+
+        queries = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        if len(queries) == 0 or len(self) == 0:
+            return counts
+
+        # Slightly widened chord: the exact haversine test below decides
+        chord = float(chord_length(radius_km)) * (1 + 1e-9) + 1e-12
+        hits = self.tree.query_ball_point(unit_vectors(lat[queries], lon[queries]), chord)
+        n_hits = np.fromiter((len(h) for h in hits), dtype=np.int64, count=len(hits))
+        if n_hits.sum() == 0:
+            return counts
+
+        q = np.repeat(queries, n_hits)
+        site = np.concatenate([h for h in hits if h]).astype(np.int64)
+        inside = haversine_km(lat[q], lon[q], self.lat[site], self.lon[site]) <= radius_km
+        counts += np.bincount(q[inside], minlength=len(lat))
+        return counts
+
@@ -0,0 +1,30 @@
+"""
+Access to the Shared Modules in tools/
+
+tools/ is not a package: the MCP server and scripts import its modules
+(geodesy, http_cache, ...) by plain name with the directory on sys.path.
+ml/ modules go through import_tool() instead of editing sys.path
+themselves, so this is the only place in ml/ that does.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+TOOLS_DIR = Path(__file__).parent.parent / "tools"
+
+
+def import_tool(name: str) -> ModuleType:
+    """
+    Import a module from tools/ by name.
+
+    Args:
+        name: Module name, e.g. 'geodesy' or 'http_cache'
+
+    Returns:
+        The module
+    """
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.append(str(TOOLS_DIR))
+    return importlib.import_module(name)
@@ -112,6 +112,89 @@ CLIMATE_PERIODS = [
 ]
 
 
+def interval_join(query_lo, query_hi, event_lo, event_hi=None,
+                  how: str = 'first', target=None, score=None) -> np.ndarray:
+    """
+    Join query intervals to overlapping event intervals and pick one event each.
+
+    An event [event_lo, event_hi] overlaps a query [query_lo, query_hi] if
+    event_lo <= query_hi and event_hi >= query_lo (point events: event_hi
+    omitted). Events are sorted once; each query's candidates come from
+    searchsorted on the sorted starts plus a running max of the ends, so the
+    whole join is vectorized.
+
+    Args:
+        query_lo, query_hi: Query interval bounds (arrays)
+        event_lo: Event starts (or event points)
+        event_hi: Event ends (None for point events)
+        how: Which overlapping event to pick:
+            'first'   - lowest event position (catalog order)
+            'nearest' - smallest |event_lo - target| (needs target per query)
+            'argmax'  - largest score (needs score per event)
+            Ties always go to the lowest event position.
+        target: Per-query reference points for how='nearest'
+        score: Per-event values for how='argmax'
+
+    Returns:
+        Array of event positions (into the inputs), -1 where nothing overlaps
+    """
+    query_lo = np.asarray(query_lo, dtype=float)
+    query_hi = np.asarray(query_hi, dtype=float)
+    event_lo = np.asarray(event_lo, dtype=float)
+    event_hi = event_lo if event_hi is None else np.asarray(event_hi, dtype=float)
+
+    result = np.full(len(query_lo), -1, dtype=np.int64)
+
+    # Events sorted by start (stable, so catalog order breaks ties)
+    events = np.flatnonzero(~(np.isnan(event_lo) | np.isnan(event_hi)))
+    events = events[np.argsort(event_lo[events], kind='stable')]
+    if len(events) == 0 or len(query_lo) == 0:
+        return result
+    starts = event_lo[events]
+    reach = np.maximum.accumulate(event_hi[events])
+
+    # Candidate range: started by query_hi, and (by running max) possibly
+    # still open at query_lo
+    queries = np.flatnonzero(~(np.isnan(query_lo) | np.isnan(query_hi)))
+    lo = np.searchsorted(reach, query_lo[queries], side='left')
+    hi = np.searchsorted(starts, query_hi[queries], side='right')
+    counts = np.maximum(hi - lo, 0)
+    if counts.sum() == 0:
+        return result
+
+    # Flat (query, event) candidate pairs, then the exact overlap test
+    q = np.repeat(queries, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    e = events[np.repeat(lo, counts) + offsets]
+    overlap = (event_lo[e] <= query_hi[q]) & (event_hi[e] >= query_lo[q])
+    q, e = q[overlap], e[overlap]
+
+    if how == 'first':
+        key = np.zeros(len(e))
+    elif how == 'nearest':
+        key = np.abs(event_lo[e] - np.asarray(target, dtype=float)[q])
+    elif how == 'argmax':
+        key = -np.asarray(score, dtype=float)[e]
+    else:
+        raise ValueError(f"Unknown join: {how}")
+
+    # Best per query: smallest key, then lowest event position
+    order = np.lexsort((e, key, q))
+    q, e = q[order], e[order]
+    first = np.r_[True, q[1:] != q[:-1]]
+    result[q[first]] = e[first]
+
+    return result
+
+
+def _match_column(values: np.ndarray, positions: np.ndarray) -> pd.Series:
+    """values[positions] for matches, None elsewhere (all-None column if nothing matched)."""
+    matched = positions >= 0
+    if not matched.any():
+        return pd.Series([None] * len(positions), dtype=object)
+    return pd.Series(np.where(matched, values[np.where(matched, positions, 0)], np.nan))
+
+
 def match_to_volcanic(anomalies: pd.DataFrame, volcanoes: pd.DataFrame,
                       window_years: int = 5, min_vssi: float = 5.0) -> pd.DataFrame:
     """Match anomalies to volcanic events within time window."""
@@ -122,21 +205,18 @@ def match_to_volcanic(anomalies: pd.DataFrame, volcanoes: pd.DataFrame,
 
     # Filter to significant eruptions
     sig_volc = volcanoes[volcanoes['vssi'] >= min_vssi]
-
-    matches = []
-    for _, row in anomalies.iterrows():
-        year = row['year_ce']
-        # Find closest volcanic event within window
-        in_window = sig_volc[(sig_volc['year_ce'] >= year - window_years) &
-                             (sig_volc['year_ce'] <= year + window_years)]
-        if len(in_window) > 0:
-            # Take the largest eruption in window
-            best = in_window.loc[in_window['vssi'].idxmax()]
-            matches.append({'volcanic_match': best['year_ce'], 'volcanic_vssi': best['vssi']})
-        else:
-            matches.append({'volcanic_match': None, 'volcanic_vssi': None})
-
-    match_df = pd.DataFrame(matches)
+    volc_years = sig_volc['year_ce'].to_numpy(dtype=float)
+    volc_vssi = sig_volc['vssi'].to_numpy(dtype=float)
+
+    # Take the largest eruption in window
+    year = anomalies['year_ce'].to_numpy(dtype=float)
+    best = interval_join(year - window_years, year + window_years, volc_years,
+                         how='argmax', score=volc_vssi)
+
+    match_df = pd.DataFrame({
+        'volcanic_match': _match_column(volc_years, best),
+        'volcanic_vssi': _match_column(volc_vssi, best),
+    })
     return pd.concat([anomalies.reset_index(drop=True), match_df], axis=1)
 
 
@@ -147,62 +227,61 @@ def match_to_earthquakes(anomalies: pd.DataFrame, earthquakes: pd.DataFrame,
         anomalies['earthquake_match'] = None
         return anomalies
 
-    matches = []
-    for _, row in anomalies.iterrows():
-        year = row['year_ce']
-        in_window = earthquakes[(earthquakes['year_ce'] >= year - window_years) &
-                                 (earthquakes['year_ce'] <= year + window_years)]
-        if len(in_window) > 0:
-            # Take closest
-            closest_idx = (in_window['year_ce'] - year).abs().idxmin()
-            matches.append({'earthquake_match': in_window.loc[closest_idx, 'year_ce']})
-        else:
-            matches.append({'earthquake_match': None})
-
-    match_df = pd.DataFrame(matches)
+    eq_years = earthquakes['year_ce'].to_numpy(dtype=float)
+
+    # Take closest
+    year = anomalies['year_ce'].to_numpy(dtype=float)
+    closest = interval_join(year - window_years, year + window_years, eq_years,
+                            how='nearest', target=year)
+
+    match_df = pd.DataFrame({
+        'earthquake_match': _match_column(eq_years, closest),
+    })
     return pd.concat([anomalies.reset_index(drop=True), match_df], axis=1)
 
 
 def match_to_climate_periods(anomalies: pd.DataFrame) -> pd.DataFrame:
     """Match anomalies to known climate anomaly periods."""
-    matches = []
-    for _, row in anomalies.iterrows():
-        year = row['year_ce']
-        matched_period = None
-        for start, end, name in CLIMATE_PERIODS:
-            if start <= year <= end:
-                matched_period = name
-                break
-        matches.append({'climate_period': matched_period})
+    starts, ends, names = (np.array(v) for v in zip(*CLIMATE_PERIODS))
+
+    # First listed period containing the year
+    year = anomalies['year_ce'].to_numpy(dtype=float)
+    period = interval_join(year, year, starts, ends, how='first')
 
-    match_df = pd.DataFrame(matches)
+    matched = period >= 0
+    match_df = pd.DataFrame({
+        'climate_period': pd.Series(np.where(matched, names[period], None).tolist()),
+    })
     return pd.concat([anomalies.reset_index(drop=True), match_df], axis=1)
 
 
 def classify_anomalies(anomalies: pd.DataFrame) -> pd.DataFrame:
     """Classify each anomaly based on matches."""
-    classifications = []
-
-    for _, row in anomalies.iterrows():
-        if pd.notna(row.get('volcanic_match')):
-            if row.get('volcanic_vssi', 0) > 20:
-                classification = 'MATCHED_VOLCANIC_MAJOR'
-            else:
-                classification = 'MATCHED_VOLCANIC'
-        elif pd.notna(row.get('earthquake_match')):
-            classification = 'MATCHED_EARTHQUAKE'
-        elif pd.notna(row.get('climate_period')):
-            classification = 'MATCHED_CLIMATE'
-        else:
-            # This is a dark candidate!
-            if abs(row['shift_magnitude']) >= 2.0:
-                classification = 'DARK_CANDIDATE_STRONG'
-            else:
-                classification = 'DARK_CANDIDATE'
-
-        classifications.append(classification)
-
-    anomalies['classification'] = classifications
+    def column(name):
+        if name in anomalies.columns:
+            return anomalies[name]
+        return pd.Series(None, index=anomalies.index, dtype=object)
+
+    volcanic = column('volcanic_match').notna().to_numpy()
+    vssi = pd.to_numeric(column('volcanic_vssi'), errors='coerce').to_numpy()
+
+    conditions = [
+        volcanic & (vssi > 20),
+        volcanic,
+        column('earthquake_match').notna().to_numpy(),
+        column('climate_period').notna().to_numpy(),
+        # Unmatched: these are dark candidates!
+        np.abs(anomalies['shift_magnitude'].to_numpy(dtype=float)) >= 2.0,
+    ]
+    choices = [
+        'MATCHED_VOLCANIC_MAJOR',
+        'MATCHED_VOLCANIC',
+        'MATCHED_EARTHQUAKE',
+        'MATCHED_CLIMATE',
+        'DARK_CANDIDATE_STRONG',
+    ]
+
+    anomalies['classification'] = np.select(conditions, choices, default='DARK_CANDIDATE')
     return anomalies
 
 
@@ -9,9 +9,14 @@ Location: 41.4167°N, 31.9333°E (North Anatolian Fault Zone)
 """
 import json
 import math
+import os
+import sys
 from collections import defaultdict
 import csv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+from geodesy import nearest_polyline
+
 # Sofular Cave location
 SOFULAR_LAT = 41.4167
 SOFULAR_LON = 31.9333
@@ -44,28 +49,6 @@ def azimuth_diff(az1, az2):
         diff = 360 - diff
     return diff
 
-def point_to_line_distance(eq_lat, eq_lon, fault_coords):
-    """
-    Calculate minimum distance from earthquake to fault line (series of coordinates).
-    Returns distance in km.
-    """
-    min_dist = float('inf')
-    for i in range(len(fault_coords) - 1):
-        # Segment from fault_coords[i] to fault_coords[i+1]
-        lon1, lat1 = fault_coords[i][0], fault_coords[i][1]
-        lon2, lat2 = fault_coords[i+1][0], fault_coords[i+1][1]
-
-        # Simple approximation: distance to segment midpoint and endpoints
-        d1 = haversine_distance(eq_lat, eq_lon, lat1, lon1)
-        d2 = haversine_distance(eq_lat, eq_lon, lat2, lon2)
-        mid_lat = (lat1 + lat2) / 2
-        mid_lon = (lon1 + lon2) / 2
-        d_mid = haversine_distance(eq_lat, eq_lon, mid_lat, mid_lon)
-
-        min_dist = min(min_dist, d1, d2, d_mid)
-
-    return min_dist
-
 def load_gem_faults(geojson_path, lat_min, lat_max, lon_min, lon_max):
     """Load GEM faults within bounding box."""
     with open(geojson_path, 'r') as f:
@@ -126,8 +109,14 @@ def main():
 
     # Calculate distance from each earthquake to Sofular and nearest fault
     print("\nCalculating distances...")
+    # Nearest fault: exact great-circle distance to the fault segments,
+    # all earthquakes x faults in one batched call
+    fault_idx, fault_dist = nearest_polyline([eq['lat'] for eq in earthquakes],
+                                             [eq['lon'] for eq in earthquakes],
+                                             [fault['coords'] for fault in faults])
+
     results = []
-    for eq in earthquakes:
+    for eq, idx, min_fault_dist in zip(earthquakes, fault_idx.tolist(), fault_dist.tolist()):
         eq_lat = eq['lat']
         eq_lon = eq['lon']
 
@@ -137,14 +126,7 @@ def main():
         # Azimuth from Sofular
         azimuth = calculate_azimuth(SOFULAR_LAT, SOFULAR_LON, eq_lat, eq_lon)
 
-        # Distance to nearest fault
-        min_fault_dist = float('inf')
-        nearest_fault = "None"
-        for fault in faults:
-            d = point_to_line_distance(eq_lat, eq_lon, fault['coords'])
-            if d < min_fault_dist:
-                min_fault_dist = d
-                nearest_fault = fault['name']
+        nearest_fault = faults[idx]['name'] if idx >= 0 else "None"
 
         results.append({
             'id': eq['id'],
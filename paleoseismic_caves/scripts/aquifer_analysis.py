@@ -19,7 +19,8 @@ Validation: If earthquakes disrupt aquifers (Chiodini model), we should see:
 - Recovery time >10 years (not 1-3 years like climate)
 """
 
-import requests
+import os
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -27,6 +28,9 @@ import matplotlib.pyplot as plt
 from scipy import stats
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+from http_cache import cached_get, DAY
+
 # =============================================================================
 # EARTHQUAKE PARAMETERS
 # =============================================================================
@@ -119,7 +123,8 @@ def query_usgs_water_quality(earthquake_key):
     print(f"  Radius: {radius_miles:.1f} miles ({eq['search_radius_km']} km)")
     print(f"  Date range: {eq['baseline_start']} to {eq['postevent_end']}")
 
-    response = requests.get(WQP_BASE_URL, params=params, timeout=120)
+    # Historical measurements: reuse a recorded response for a week
+    response = cached_get(WQP_BASE_URL, params=params, ttl=7 * DAY, timeout=120)
 
     if response.status_code == 200:
         # Save raw CSV
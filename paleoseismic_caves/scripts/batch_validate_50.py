@@ -10,9 +10,13 @@ Strategy:
 5. Document ALL tests (positives AND negatives) for statistics
 """
 
+import json
 import pandas as pd
 import sys
 
+sys.path.append('paleoseismic_caves/tools')
+from earthquake_catalog import get_catalog
+
 # Known caves from your dataset (from ML CSV)
 ml_df = pd.read_csv('paleoseismic_caves/ml/outputs/dark_quake_candidates.csv')
 
@@ -38,7 +42,7 @@ print("="*80)
 print("STEP 1: EARTHQUAKE CATALOG SEARCHES")
 print("="*80)
 print()
-print("Run these MCP tool calls to find modern earthquakes near each cave:")
+print("Caves to search for modern earthquakes:")
 print()
 
 validation_commands = []
@@ -48,8 +52,6 @@ for idx, (key, cave) in enumerate(cave_locations.items(), 1):
     site_name = cave['site_name']
 
     print(f"# Cave {idx}: {site_name} ({lat:.3f}, {lon:.3f})")
-    print(f"earthquake_search(lat={lat:.3f}, lon={lon:.3f}, radius_km=100, min_magnitude=5.0, start_date='1900-01-01', end_date='2025-01-01')")
-    print()
 
     validation_commands.append({
         'cave': site_name,
@@ -58,13 +60,49 @@ for idx, (key, cave) in enumerate(cave_locations.items(), 1):
         'entity': cave['entity_name']
     })
 
+# One MCP round trip for all caves instead of one earthquake_search per cave
+batch_call = {
+    'sites': [{'lat': round(float(cmd['lat']), 3), 'lon': round(float(cmd['lon']), 3), 'name': cmd['cave']}
+              for cmd in validation_commands],
+    'radius_km': 100,
+    'min_magnitude': 5.0,
+    'start_date': '1900-01-01',
+    'end_date': '2025-01-01',
+}
+with open('paleoseismic_caves/ml/outputs/validation_batch_call.json', 'w') as f:
+    json.dump(batch_call, f, indent=2)
+
+print()
+print("Run this MCP tool call (arguments in paleoseismic_caves/ml/outputs/validation_batch_call.json):")
+print(f"earthquake_search_batch(sites=[{len(batch_call['sites'])} caves], radius_km=100, min_magnitude=5.0, start_date='1900-01-01', end_date='2025-01-01')")
+print()
+
+# Answer the searches from the local catalog mirror where it covers them
+# (python paleoseismic_caves/tools/earthquake_catalog.py refresh --min-mag 5.0)
+catalog = get_catalog()
+if catalog is not None:
+    answered = []
+    for cmd in validation_commands:
+        args = (cmd['lat'], cmd['lon'], 100, '1900-01-01', '2025-01-01', 5.0)
+        if catalog.covers(*args, source='comcat'):
+            events = catalog.query(*args, sources=['comcat'])
+            cmd['n_earthquakes'] = len(events)
+            answered.extend({'cave': cmd['cave'], **e} for e in events)
+
+    n_local = sum('n_earthquakes' in cmd for cmd in validation_commands)
+    if n_local:
+        pd.DataFrame(answered).to_csv('paleoseismic_caves/ml/outputs/validation_earthquakes.csv', index=False)
+        print(f"Answered {n_local}/{len(validation_commands)} searches from the local catalog mirror")
+        print("Saved to: paleoseismic_caves/ml/outputs/validation_earthquakes.csv")
+        print()
+
 # Save commands for reference
 commands_df = pd.DataFrame(validation_commands)
 commands_df.to_csv('paleoseismic_caves/ml/outputs/validation_commands.csv', index=False)
 
 print()
 print("="*80)
-print(f"Generated {len(validation_commands)} earthquake search commands")
+print(f"Generated earthquake searches for {len(validation_commands)} caves")
 print("Saved to: paleoseismic_caves/ml/outputs/validation_commands.csv")
 print()
 print("NEXT: Run these searches using MCP tools and document:")
@@ -21,10 +21,14 @@ import json
 import math
 import csv
 import os
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+from geodesy import nearest_polyline
+
 # Project paths
 PROJECT_ROOT = '/Users/catherine/projects/quake/paleoseismic_caves'
 GEM_FAULTS_PATH = os.path.join(PROJECT_ROOT, 'data/gem_active_faults.geojson')
@@ -110,29 +114,6 @@ def calculate_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     return (azimuth + 360) % 360
 
 
-def point_to_line_distance(eq_lat: float, eq_lon: float, fault_coords: List) -> float:
-    """
-    Calculate minimum distance from earthquake to fault line (series of coordinates).
-    Returns distance in km.
-    """
-    min_dist = float('inf')
-    for i in range(len(fault_coords) - 1):
-        # Handle both 2D and 3D coordinates
-        lon1, lat1 = fault_coords[i][0], fault_coords[i][1]
-        lon2, lat2 = fault_coords[i+1][0], fault_coords[i+1][1]
-
-        # Distance to segment endpoints and midpoint
-        d1 = haversine_distance(eq_lat, eq_lon, lat1, lon1)
-        d2 = haversine_distance(eq_lat, eq_lon, lat2, lon2)
-        mid_lat = (lat1 + lat2) / 2
-        mid_lon = (lon1 + lon2) / 2
-        d_mid = haversine_distance(eq_lat, eq_lon, mid_lat, mid_lon)
-
-        min_dist = min(min_dist, d1, d2, d_mid)
-
-    return min_dist
-
-
 def load_gem_faults(geojson_path: str, lat: float, lon: float, radius_km: float = 200) -> List[Dict]:
     """Load GEM faults within radius of cave location."""
     # Approximate bounding box
@@ -240,9 +221,15 @@ def analyze_cave_region(
         print(f"Warning: GEM faults file not found at {GEM_FAULTS_PATH}")
         faults = []
 
+    # Distance to nearest fault (exact great-circle distance to the fault
+    # segments, all earthquakes x faults in one batched call)
+    fault_idx, fault_dist = nearest_polyline([eq['lat'] for eq in earthquakes],
+                                             [eq['lon'] for eq in earthquakes],
+                                             [fault['coords'] for fault in faults])
+
     # Process earthquakes
     processed = []
-    for eq in earthquakes:
+    for eq, idx, min_fault_dist in zip(earthquakes, fault_idx.tolist(), fault_dist.tolist()):
         earthquake = Earthquake(
             id=eq.get('id', ''),
             time=eq.get('time', ''),
@@ -257,17 +244,8 @@ def analyze_cave_region(
         earthquake.dist_to_cave_km = haversine_distance(cave_lat, cave_lon, earthquake.lat, earthquake.lon)
         earthquake.azimuth = calculate_azimuth(cave_lat, cave_lon, earthquake.lat, earthquake.lon)
 
-        # Distance to nearest fault
-        min_fault_dist = float('inf')
-        nearest_fault = "None"
-        for fault in faults:
-            d = point_to_line_distance(earthquake.lat, earthquake.lon, fault['coords'])
-            if d < min_fault_dist:
-                min_fault_dist = d
-                nearest_fault = fault['name']
-
         earthquake.dist_to_fault_km = min_fault_dist
-        earthquake.nearest_fault = nearest_fault
+        earthquake.nearest_fault = faults[idx]['name'] if idx >= 0 else "None"
         earthquake.is_orphan = min_fault_dist > orphan_threshold_km
 
         processed.append(earthquake)
@@ -12,6 +12,17 @@ Usage from command line:
     python calculators.py haversine --lat1 44.125 --lon1 8.208 --lat2 43.7 --lon2 7.26
     python calculators.py fractionation --temp 15 --mineral calcite
     python calculators.py recurrence --events "1285,1394,1580,1825"
+
+Array API:
+    The *_array functions take numpy arrays (or scalars) that broadcast
+    against each other and return struct-of-arrays results, e.g. a
+    detectability map over a magnitude x distance grid in one call:
+
+    mags, dists = np.meshgrid(np.arange(5.0, 8.01, 0.1), np.arange(1, 501))
+    energy = seismic_energy_density_array(mags, dists, connectivity=0.5)
+    energy.threshold_exceeded  # (500, 31) bool
+
+    The scalar functions (pga_attenuation, ...) are thin wrappers over them.
 """
 
 import argparse
@@ -19,6 +30,15 @@ import math
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from geodesy import haversine_km
+
+
+def _as_arrays(*values) -> List[np.ndarray]:
+    """Float arrays broadcast against each other."""
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
 
 # =============================================================================
 # PGA ATTENUATION MODELS
@@ -33,97 +53,135 @@ class PGAResult:
     model: str            # Which GMPE was used
     mmi: int              # Estimated Modified Mercalli Intensity
 
-def pga_attenuation(
-    magnitude: float,
-    distance_km: float,
-    depth_km: float = 10.0,
-    model: str = "bindi2011",
-    vs30: float = 760.0  # Rock site default
-) -> PGAResult:
+# Wald et al. (1999) PGA (cm/s²) bin edges for MMI II..X
+MMI_PGA_THRESHOLDS_CM_S2 = np.array([1.4, 3.9, 9.2, 18, 34, 65, 124, 235, 446])
+
+
+@dataclass
+class PGAArrays:
+    """Peak Ground Acceleration over arrays of inputs (struct of arrays)."""
+    pga_g: np.ndarray       # PGA in g
+    pga_cm_s2: np.ndarray   # PGA in cm/s²
+    mmi: np.ndarray         # Estimated MMI (int)
+    sigma: float            # Log-normal standard deviation
+    model: str              # Which GMPE was used
+
+
+def pga_to_mmi(pga_cm_s2) -> np.ndarray:
     """
-    Calculate Peak Ground Acceleration using various GMPEs.
+    Modified Mercalli Intensity from PGA (Wald et al. 1999).
+
+    Args:
+        pga_cm_s2: PGA in cm/s² (array or scalar)
+
+    Returns:
+        MMI 1-10 (int array)
+    """
+    return np.digitize(pga_cm_s2, MMI_PGA_THRESHOLDS_CM_S2) + 1
 
-    Models:
-        - bindi2011: Bindi et al. 2011 (Italy, recommended for Mediterranean)
-        - boore2014: Boore et al. 2014 NGA-West2 (California)
-        - akkar2014: Akkar et al. 2014 (Europe/Middle East)
-        - simple: Simple distance decay (for quick estimates)
+
+def pga_attenuation_array(
+    magnitude,
+    distance_km,
+    depth_km=10.0,
+    model: str = "bindi2011",
+    vs30: float = 760.0
+) -> PGAArrays:
+    """
+    Array version of pga_attenuation() (see there for the models).
 
     Args:
-        magnitude: Moment magnitude (Mw)
-        distance_km: Epicentral distance in km
-        depth_km: Hypocentral depth in km
-        model: GMPE model name
+        magnitude: Moment magnitude (Mw), array or scalar
+        distance_km: Epicentral distance in km, array or scalar
+        depth_km: Hypocentral depth in km, array or scalar
+        model: GMPE model name (one for all elements)
         vs30: Shear wave velocity in top 30m (m/s)
 
     Returns:
-        PGAResult with PGA values and uncertainty
+        PGAArrays with the broadcast shape of the inputs
     """
+    magnitude, distance_km, depth_km = _as_arrays(magnitude, distance_km, depth_km)
+
     # Hypocentral distance
-    r_hyp = math.sqrt(distance_km**2 + depth_km**2)
+    r_hyp = np.sqrt(distance_km**2 + depth_km**2)
 
     if model == "bindi2011":
         # Bindi et al. 2011 for Italy
         # ln(PGA) = a + b*M + c*ln(sqrt(R² + h²)) + site terms
         a, b, c = -2.0, 0.8, -1.5
         h = 6.0  # Reference depth
-        r_eff = math.sqrt(r_hyp**2 + h**2)
-        ln_pga = a + b * magnitude + c * math.log(r_eff)
+        r_eff = np.sqrt(r_hyp**2 + h**2)
+        ln_pga = a + b * magnitude + c * np.log(r_eff)
         sigma = 0.3
 
     elif model == "boore2014":
         # Simplified Boore et al. 2014 NGA-West2
         # For Mw > 5, Rjb < 200 km
         c1, c2, c3 = -4.0, 1.1, -1.3
-        r_ref = max(1.0, distance_km)  # Avoid log(0)
-        ln_pga = c1 + c2 * (magnitude - 6.0) + c3 * math.log(r_ref)
+        r_ref = np.maximum(1.0, distance_km)  # Avoid log(0)
+        ln_pga = c1 + c2 * (magnitude - 6.0) + c3 * np.log(r_ref)
         sigma = 0.28
 
     elif model == "akkar2014":
         # Akkar et al. 2014 for Europe/Middle East
         a1, a2, a3 = -3.5, 0.9, -1.4
-        r_eff = math.sqrt(r_hyp**2 + 25)  # h=5 km reference
-        ln_pga = a1 + a2 * magnitude + a3 * math.log(r_eff)
+        r_eff = np.sqrt(r_hyp**2 + 25)  # h=5 km reference
+        ln_pga = a1 + a2 * magnitude + a3 * np.log(r_eff)
         sigma = 0.32
 
     else:  # simple
         # Basic empirical: PGA ~ 10^(0.5*M - 1.5*log10(R) - 2)
-        r_eff = max(1.0, r_hyp)
-        log10_pga = 0.5 * magnitude - 1.5 * math.log10(r_eff) - 2.0
+        r_eff = np.maximum(1.0, r_hyp)
+        log10_pga = 0.5 * magnitude - 1.5 * np.log10(r_eff) - 2.0
         ln_pga = log10_pga * math.log(10)
         sigma = 0.4
 
-    pga_g = math.exp(ln_pga)
+    pga_g = np.exp(ln_pga)
     pga_cm_s2 = pga_g * 980.665
 
-    # Estimate MMI from PGA (Wald et al. 1999)
-    if pga_cm_s2 < 1.4:
-        mmi = 1
-    elif pga_cm_s2 < 3.9:
-        mmi = 2
-    elif pga_cm_s2 < 9.2:
-        mmi = 3
-    elif pga_cm_s2 < 18:
-        mmi = 4
-    elif pga_cm_s2 < 34:
-        mmi = 5
-    elif pga_cm_s2 < 65:
-        mmi = 6
-    elif pga_cm_s2 < 124:
-        mmi = 7
-    elif pga_cm_s2 < 235:
-        mmi = 8
-    elif pga_cm_s2 < 446:
-        mmi = 9
-    else:
-        mmi = 10
-
-    return PGAResult(
+    return PGAArrays(
         pga_g=pga_g,
         pga_cm_s2=pga_cm_s2,
+        mmi=pga_to_mmi(pga_cm_s2),
         sigma=sigma,
-        model=model,
-        mmi=mmi
+        model=model
+    )
+
+
+def pga_attenuation(
+    magnitude: float,
+    distance_km: float,
+    depth_km: float = 10.0,
+    model: str = "bindi2011",
+    vs30: float = 760.0  # Rock site default
+) -> PGAResult:
+    """
+    Calculate Peak Ground Acceleration using various GMPEs.
+
+    Models:
+        - bindi2011: Bindi et al. 2011 (Italy, recommended for Mediterranean)
+        - boore2014: Boore et al. 2014 NGA-West2 (California)
+        - akkar2014: Akkar et al. 2014 (Europe/Middle East)
+        - simple: Simple distance decay (for quick estimates)
+
+    Args:
+        magnitude: Moment magnitude (Mw)
+        distance_km: Epicentral distance in km
+        depth_km: Hypocentral depth in km
+        model: GMPE model name
+        vs30: Shear wave velocity in top 30m (m/s)
+
+    Returns:
+        PGAResult with PGA values and uncertainty
+    """
+    result = pga_attenuation_array(magnitude, distance_km, depth_km, model, vs30)
+
+    return PGAResult(
+        pga_g=float(result.pga_g),
+        pga_cm_s2=float(result.pga_cm_s2),
+        sigma=result.sigma,
+        model=result.model,
+        mmi=int(result.mmi)
     )
 
 
@@ -139,36 +197,37 @@ class ChiodiniResult:
     duration_years: float   # Expected duration of signal
     detectable: bool        # Whether signal should be detectable in speleothem
 
-def chiodini_co2_flux(
-    magnitude: float,
-    distance_km: float,
-    baseline_flux: float = 1.0  # Normalized
-) -> ChiodiniResult:
+@dataclass
+class ChiodiniArrays:
+    """CO2 flux perturbation over arrays of inputs (struct of arrays)."""
+    flux_ratio: np.ndarray
+    perturbation_pct: np.ndarray
+    duration_years: np.ndarray
+    detectable: np.ndarray      # bool
+
+
+def chiodini_co2_flux_array(
+    magnitude,
+    distance_km,
+    baseline_flux=1.0
+) -> ChiodiniArrays:
     """
-    Estimate CO2 flux perturbation from earthquake-induced fracturing.
-
-    Based on Chiodini et al. observations of CO2 flux changes after
-    Italian earthquakes, particularly Irpinia 1980 and L'Aquila 2009.
-
-    The model assumes:
-    - Earthquakes create/reopen fractures
-    - Deep CO2 escapes through new pathways
-    - Flux enhancement decays exponentially
+    Array version of chiodini_co2_flux().
 
     Args:
-        magnitude: Earthquake magnitude (Mw)
-        distance_km: Distance from rupture to cave
+        magnitude: Earthquake magnitude (Mw), array or scalar
+        distance_km: Distance from rupture to cave, array or scalar
         baseline_flux: Pre-earthquake CO2 flux (normalized)
 
     Returns:
-        ChiodiniResult with flux enhancement estimates
+        ChiodiniArrays with the broadcast shape of the inputs
     """
+    magnitude, distance_km = _as_arrays(magnitude, distance_km)
+
     # Empirical scaling from Chiodini observations
     # Flux enhancement ~ 10^(0.4*M) / R^1.5
     # Detectable perturbations observed up to ~100 km for M7+
-
-    if distance_km < 1:
-        distance_km = 1  # Minimum distance
+    distance_km = np.where(distance_km < 1, 1.0, distance_km)  # Minimum distance
 
     # Magnitude scaling (exponential)
     mag_factor = 10 ** (0.4 * (magnitude - 5.0))
@@ -178,20 +237,51 @@ def chiodini_co2_flux(
 
     # Combined perturbation
     perturbation = mag_factor * dist_factor
-    flux_ratio = 1.0 + perturbation
 
     # Duration scales with magnitude (larger EQ = longer perturbation)
     # M5 ~ 2 years, M7 ~ 20 years (logarithmic scaling)
     duration = 2.0 * 10 ** (0.5 * (magnitude - 5.0))
 
-    # Detectability threshold (~10% change needed for speleothem signal)
-    detectable = perturbation > 0.1
-
-    return ChiodiniResult(
-        flux_ratio=flux_ratio,
+    return ChiodiniArrays(
+        flux_ratio=1.0 + perturbation,
         perturbation_pct=perturbation * 100,
         duration_years=duration,
-        detectable=detectable
+        # Detectability threshold (~10% change needed for speleothem signal)
+        detectable=perturbation > 0.1
+    )
+
+
+def chiodini_co2_flux(
+    magnitude: float,
+    distance_km: float,
+    baseline_flux: float = 1.0  # Normalized
+) -> ChiodiniResult:
+    """
+    Estimate CO2 flux perturbation from earthquake-induced fracturing.
+
+    Based on Chiodini et al. observations of CO2 flux changes after
+    Italian earthquakes, particularly Irpinia 1980 and L'Aquila 2009.
+
+    The model assumes:
+    - Earthquakes create/reopen fractures
+    - Deep CO2 escapes through new pathways
+    - Flux enhancement decays exponentially
+
+    Args:
+        magnitude: Earthquake magnitude (Mw)
+        distance_km: Distance from rupture to cave
+        baseline_flux: Pre-earthquake CO2 flux (normalized)
+
+    Returns:
+        ChiodiniResult with flux enhancement estimates
+    """
+    result = chiodini_co2_flux_array(magnitude, distance_km, baseline_flux)
+
+    return ChiodiniResult(
+        flux_ratio=float(result.flux_ratio),
+        perturbation_pct=float(result.perturbation_pct),
+        duration_years=float(result.duration_years),
+        detectable=bool(result.detectable)
     )
 
 
@@ -209,6 +299,56 @@ class SeismicEnergyResult:
     threshold_exceeded: bool   # Whether threshold is exceeded
     ratio_to_threshold: float  # How many times above/below threshold
 
+@dataclass
+class SeismicEnergyArrays:
+    """Seismic energy density over arrays of inputs (struct of arrays)."""
+    raw_energy_jm3: np.ndarray
+    effective_energy_jm3: np.ndarray
+    connectivity: np.ndarray
+    threshold_jm3: float
+    threshold_exceeded: np.ndarray  # bool
+    ratio_to_threshold: np.ndarray
+
+
+def seismic_energy_density_array(
+    magnitude,
+    distance_km,
+    connectivity=1.0
+) -> SeismicEnergyArrays:
+    """
+    Array version of seismic_energy_density().
+
+    Args:
+        magnitude: Moment magnitude (Mw), array or scalar
+        distance_km: Distance from epicenter in km, array or scalar
+        connectivity: Aquifer connectivity coefficient (0-1), array or scalar
+
+    Returns:
+        SeismicEnergyArrays with the broadcast shape of the inputs
+    """
+    magnitude, distance_km, connectivity = _as_arrays(magnitude, distance_km, connectivity)
+    distance_km = np.where(distance_km < 1, 1.0, distance_km)  # Minimum distance to avoid log(0)
+
+    # Wang & Manga (2010) seismic energy density formula
+    log_e = -2.0 + magnitude - 2.0 * np.log10(distance_km)
+    raw_energy = 10 ** log_e
+
+    # Apply connectivity coefficient
+    effective_energy = raw_energy * connectivity
+
+    # Threshold for sustained groundwater changes (Wang & Manga 2010)
+    threshold = 1e-3  # 10⁻³ J/m³
+
+    return SeismicEnergyArrays(
+        raw_energy_jm3=raw_energy,
+        effective_energy_jm3=effective_energy,
+        connectivity=connectivity,
+        threshold_jm3=threshold,
+        threshold_exceeded=effective_energy > threshold,
+        ratio_to_threshold=effective_energy / threshold
+    )
+
+
 def seismic_energy_density(
     magnitude: float,
     distance_km: float,
@@ -243,29 +383,43 @@ def seismic_energy_density(
         Wang, C.-Y. and Manga, M. (2010). Hydrologic responses to earthquakes
         and a general metric. Geofluids, 10(1-2), 206-216.
     """
-    if distance_km < 1:
-        distance_km = 1  # Minimum distance to avoid log(0)
-
-    # Wang & Manga (2010) seismic energy density formula
-    log_e = -2.0 + magnitude - 2.0 * math.log10(distance_km)
-    raw_energy = 10 ** log_e
-
-    # Apply connectivity coefficient
-    effective_energy = raw_energy * connectivity
-
-    # Threshold for sustained groundwater changes (Wang & Manga 2010)
-    threshold = 1e-3  # 10⁻³ J/m³
+    result = seismic_energy_density_array(magnitude, distance_km, connectivity)
 
     return SeismicEnergyResult(
-        raw_energy_jm3=raw_energy,
-        effective_energy_jm3=effective_energy,
+        raw_energy_jm3=float(result.raw_energy_jm3),
+        effective_energy_jm3=float(result.effective_energy_jm3),
         connectivity=connectivity,
-        threshold_jm3=threshold,
-        threshold_exceeded=effective_energy > threshold,
-        ratio_to_threshold=effective_energy / threshold
+        threshold_jm3=result.threshold_jm3,
+        threshold_exceeded=bool(result.threshold_exceeded),
+        ratio_to_threshold=float(result.ratio_to_threshold)
     )
 
 
+def detection_distance_limit_array(
+    magnitude,
+    connectivity=1.0,
+    threshold: float = 1e-3
+) -> np.ndarray:
+    """
+    Array version of detection_distance_limit() (0 where connectivity <= 0).
+
+    Args:
+        magnitude: Earthquake magnitude, array or scalar
+        connectivity: Aquifer connectivity (0-1), array or scalar
+        threshold: Detection threshold in J/m³
+
+    Returns:
+        Maximum detection distance in km (broadcast shape of the inputs)
+    """
+    magnitude, connectivity = _as_arrays(magnitude, connectivity)
+    connected = connectivity > 0
+
+    # Solve for R from energy density equation
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_r = (magnitude - 2.0 - np.log10(threshold / np.where(connected, connectivity, 1.0))) / 2.0
+    return np.where(connected, 10 ** log_r, 0.0)
+
+
 def detection_distance_limit(
     magnitude: float,
     connectivity: float = 1.0,
@@ -285,12 +439,7 @@ def detection_distance_limit(
     Returns:
         Maximum detection distance in km
     """
-    if connectivity <= 0:
-        return 0.0
-
-    # Solve for R from energy density equation
-    log_r = (magnitude - 2.0 - math.log10(threshold / connectivity)) / 2.0
-    return 10 ** log_r
+    return float(detection_distance_limit_array(magnitude, connectivity, threshold))
 
 
 # =============================================================================
@@ -307,6 +456,108 @@ class AquiferConnectivityResult:
     confidence: str              # Assessment confidence level
     explanation: str             # Human-readable explanation
 
+@dataclass
+class AquiferConnectivityArrays:
+    """Aquifer connectivity over arrays of inputs (struct of arrays)."""
+    connectivity: np.ndarray
+    fault_factor: np.ndarray
+    geology_factor: np.ndarray
+    distance_factor: np.ndarray
+    confidence: np.ndarray      # str
+    explanation: np.ndarray     # str
+
+
+# Fault type factors (empirical); unknown types use DEFAULT_FAULT_FACTOR
+FAULT_FACTORS = {
+    "offshore_subduction": 0.05,
+    "offshore_transform": 0.1,
+    "onland_strike_slip": 0.4,
+    "onland_normal": 0.5,
+    "onland_thrust": 0.45,
+    "local_karst": 0.9,
+}
+DEFAULT_FAULT_FACTOR = 0.3
+
+# Geology factors; unknown rock types use DEFAULT_GEOLOGY_FACTOR
+GEOLOGY_FACTORS = {
+    "sedimentary_basin": 0.3,
+    "crystalline": 0.5,
+    "fractured": 0.6,
+    "karst": 0.9,
+    "same_aquifer": 1.0,
+}
+DEFAULT_GEOLOGY_FACTOR = 0.5
+
+
+def aquifer_connectivity_array(
+    fault_type,
+    geology,
+    distance_km,
+    fault_intersects_aquifer=False
+) -> AquiferConnectivityArrays:
+    """
+    Array version of aquifer_connectivity() (see there for the categories).
+
+    Args:
+        fault_type: Fault mechanism name(s), array or scalar
+        geology: Rock type name(s), array or scalar
+        distance_km: Distance from fault to cave in km, array or scalar
+        fault_intersects_aquifer: Does the fault cut the aquifer? (bool array or scalar)
+
+    Returns:
+        AquiferConnectivityArrays with the broadcast shape of the inputs
+    """
+    fault_type, geology, distance_km, intersects = np.broadcast_arrays(
+        np.asarray(fault_type, dtype=object), np.asarray(geology, dtype=object),
+        np.asarray(distance_km, dtype=float), np.asarray(fault_intersects_aquifer, dtype=bool))
+    fault_type = np.vectorize(str.lower, otypes=[object])(fault_type)
+    geology = np.vectorize(str.lower, otypes=[object])(geology)
+
+    fault_factor = np.vectorize(lambda t: FAULT_FACTORS.get(t, DEFAULT_FAULT_FACTOR), otypes=[float])(fault_type)
+    geology_factor = np.vectorize(lambda g: GEOLOGY_FACTORS.get(g, DEFAULT_GEOLOGY_FACTOR), otypes=[float])(geology)
+
+    # Distance factor (inverse relationship)
+    # At 0 km (direct intersection): factor = 1.0
+    # At 50 km: factor ~ 0.5
+    # At 100 km: factor ~ 0.3
+    # At 200 km: factor ~ 0.2
+    distance_factor = np.where(distance_km < 1, 1.0, 1.0 / (1.0 + 0.02 * distance_km))
+
+    # Direct aquifer intersection overrides distance
+    distance_factor = np.where(intersects, 1.0, distance_factor)
+    fault_factor = np.where(intersects, np.maximum(fault_factor, 0.9), fault_factor)
+
+    # Combined connectivity (geometric mean of factors)
+    connectivity = (fault_factor * geology_factor * distance_factor) ** (1/3)
+    connectivity = np.clip(connectivity, 0.0, 1.0)  # Clamp to 0-1
+
+    # Direct intersection bonus
+    connectivity = np.where(intersects, np.minimum(1.0, connectivity * 1.5), connectivity)
+
+    # Confidence assessment
+    confidence = np.select([intersects | (distance_km < 20), distance_km < 50],
+                           ["HIGH", "MODERATE"], "LOW").astype(object)
+
+    # Generate explanation
+    explanation = np.select([connectivity > 0.7, connectivity > 0.3],
+                            ["Strong hydraulic connection expected",
+                             "Moderate hydraulic connection possible"],
+                            "Weak/no hydraulic connection").astype(object)
+    explanation = np.where(intersects, explanation + "; fault directly intersects aquifer", explanation)
+    explanation = np.where(geology == "karst", explanation + "; karst enhances connectivity", explanation)
+    offshore = np.vectorize(lambda t: t.startswith("offshore"), otypes=[bool])(fault_type)
+    explanation = np.where(offshore, explanation + "; offshore faults typically disconnected", explanation)
+
+    return AquiferConnectivityArrays(
+        connectivity=connectivity,
+        fault_factor=fault_factor,
+        geology_factor=geology_factor,
+        distance_factor=distance_factor,
+        confidence=confidence,
+        explanation=explanation
+    )
+
+
 def aquifer_connectivity(
     fault_type: str,
     geology: str,
@@ -347,81 +598,15 @@ def aquifer_connectivity(
         - Yok Balum 1976/2012 null results
         - Bàsura 1887 offshore null result
     """
-    # Fault type factors (empirical)
-    fault_factors = {
-        "offshore_subduction": 0.05,
-        "offshore_transform": 0.1,
-        "onland_strike_slip": 0.4,
-        "onland_normal": 0.5,
-        "onland_thrust": 0.45,
-        "local_karst": 0.9,
-    }
-    fault_factor = fault_factors.get(fault_type.lower(), 0.3)
-
-    # Geology factors
-    geology_factors = {
-        "sedimentary_basin": 0.3,
-        "crystalline": 0.5,
-        "fractured": 0.6,
-        "karst": 0.9,
-        "same_aquifer": 1.0,
-    }
-    geology_factor = geology_factors.get(geology.lower(), 0.5)
-
-    # Distance factor (inverse relationship)
-    # At 0 km (direct intersection): factor = 1.0
-    # At 50 km: factor ~ 0.5
-    # At 100 km: factor ~ 0.3
-    # At 200 km: factor ~ 0.2
-    if distance_km < 1:
-        distance_factor = 1.0
-    else:
-        distance_factor = 1.0 / (1.0 + 0.02 * distance_km)
-
-    # Direct aquifer intersection overrides distance
-    if fault_intersects_aquifer:
-        distance_factor = 1.0
-        fault_factor = max(fault_factor, 0.9)
-
-    # Combined connectivity (geometric mean of factors)
-    connectivity = (fault_factor * geology_factor * distance_factor) ** (1/3)
-    connectivity = min(1.0, max(0.0, connectivity))  # Clamp to 0-1
-
-    # Direct intersection bonus
-    if fault_intersects_aquifer:
-        connectivity = min(1.0, connectivity * 1.5)
-
-    # Confidence assessment
-    if fault_intersects_aquifer or distance_km < 20:
-        confidence = "HIGH"
-    elif distance_km < 50:
-        confidence = "MODERATE"
-    else:
-        confidence = "LOW"
-
-    # Generate explanation
-    explanations = []
-    if connectivity > 0.7:
-        explanations.append("Strong hydraulic connection expected")
-    elif connectivity > 0.3:
-        explanations.append("Moderate hydraulic connection possible")
-    else:
-        explanations.append("Weak/no hydraulic connection")
-
-    if fault_intersects_aquifer:
-        explanations.append("fault directly intersects aquifer")
-    if geology.lower() == "karst":
-        explanations.append("karst enhances connectivity")
-    if fault_type.lower().startswith("offshore"):
-        explanations.append("offshore faults typically disconnected")
+    result = aquifer_connectivity_array(fault_type, geology, distance_km, fault_intersects_aquifer)
 
     return AquiferConnectivityResult(
-        connectivity=connectivity,
-        fault_factor=fault_factor,
-        geology_factor=geology_factor,
-        distance_factor=distance_factor,
-        confidence=confidence,
-        explanation="; ".join(explanations)
+        connectivity=float(result.connectivity),
+        fault_factor=float(result.fault_factor),
+        geology_factor=float(result.geology_factor),
+        distance_factor=float(result.distance_factor),
+        confidence=str(result.confidence[()]),
+        explanation=str(result.explanation[()])
     )
 
 
@@ -439,6 +624,64 @@ class PorePressureResult:
     skempton_b: float           # Skempton's B coefficient used
     detectable: bool            # Whether perturbation is significant
 
+@dataclass
+class PorePressureArrays:
+    """Pore pressure perturbation over arrays of inputs (struct of arrays)."""
+    delta_p_pa: np.ndarray
+    delta_p_kpa: np.ndarray
+    delta_p_bar: np.ndarray
+    static_stress_pa: np.ndarray
+    skempton_b: np.ndarray
+    detectable: np.ndarray      # bool
+
+
+def pore_pressure_perturbation_array(
+    magnitude,
+    distance_km,
+    skempton_b=0.7,
+    shear_modulus_gpa: float = 30.0
+) -> PorePressureArrays:
+    """
+    Array version of pore_pressure_perturbation().
+
+    Args:
+        magnitude: Earthquake magnitude (Mw), array or scalar
+        distance_km: Distance from fault in km, array or scalar
+        skempton_b: Skempton's B coefficient, array or scalar
+        shear_modulus_gpa: Shear modulus in GPa
+
+    Returns:
+        PorePressureArrays with the broadcast shape of the inputs
+    """
+    magnitude, distance_km, skempton_b = _as_arrays(magnitude, distance_km, skempton_b)
+    distance_km = np.where(distance_km < 1, 1.0, distance_km)
+
+    # Estimate seismic moment
+    # M0 = 10^(1.5*Mw + 9.1) in N·m
+    moment_nm = 10 ** (1.5 * magnitude + 9.1)
+
+    # Static stress change at distance R (simplified Okada model)
+    # Δσ ~ M0 / (4π × R³) for point source approximation (mean stress,
+    # order of magnitude)
+    distance_m = distance_km * 1000
+    static_stress_pa = moment_nm / (4 * math.pi * distance_m ** 3)
+
+    # Pore pressure change via Skempton equation
+    # Δp = B × Δσ_mean
+    delta_p_pa = skempton_b * static_stress_pa
+    delta_p_kpa = delta_p_pa / 1000
+
+    return PorePressureArrays(
+        delta_p_pa=delta_p_pa,
+        delta_p_kpa=delta_p_kpa,
+        delta_p_bar=delta_p_pa / 1e5,
+        static_stress_pa=static_stress_pa,
+        skempton_b=skempton_b,
+        # Detectability threshold (~1 kPa for measurable groundwater response)
+        detectable=delta_p_kpa > 1.0
+    )
+
+
 def pore_pressure_perturbation(
     magnitude: float,
     distance_km: float,
@@ -474,49 +717,15 @@ def pore_pressure_perturbation(
         Manga, M. and Wang, C.-Y. (2007). Earthquake hydrology.
         Treatise on Geophysics, 4, 293-320.
     """
-    if distance_km < 1:
-        distance_km = 1
-
-    # Estimate seismic moment
-    # M0 = 10^(1.5*Mw + 9.1) in N·m
-    moment_nm = 10 ** (1.5 * magnitude + 9.1)
-
-    # Estimate rupture area from moment
-    # M0 = μ × A × D, where μ = shear modulus, A = area, D = slip
-    # Empirically: A ~ M0 / (μ × D_avg)
-    # For simplicity, use Wells & Coppersmith: log10(A) = M - 4.0
-    rupture_area_km2 = 10 ** (magnitude - 4.0)
-    rupture_area_m2 = rupture_area_km2 * 1e6
-
-    # Estimate average slip
-    slip_m = 10 ** (-4.80 + 0.69 * magnitude)
-
-    # Static stress change at distance R (simplified Okada model)
-    # Δσ ~ μ × D / R for far field
-    # More accurately: Δσ ~ M0 / (4π × R³) for point source approximation
-    shear_modulus_pa = shear_modulus_gpa * 1e9
-    distance_m = distance_km * 1000
-
-    # Static stress change (simplified, order of magnitude)
-    # Δσ_static ~ M0 / (4π × R³) for mean stress
-    static_stress_pa = moment_nm / (4 * math.pi * distance_m ** 3)
-
-    # Pore pressure change via Skempton equation
-    # Δp = B × Δσ_mean
-    delta_p_pa = skempton_b * static_stress_pa
-    delta_p_kpa = delta_p_pa / 1000
-    delta_p_bar = delta_p_pa / 1e5
-
-    # Detectability threshold (~1 kPa for measurable groundwater response)
-    detectable = delta_p_kpa > 1.0
+    result = pore_pressure_perturbation_array(magnitude, distance_km, skempton_b, shear_modulus_gpa)
 
     return PorePressureResult(
-        delta_p_pa=delta_p_pa,
-        delta_p_kpa=delta_p_kpa,
-        delta_p_bar=delta_p_bar,
-        static_stress_pa=static_stress_pa,
+        delta_p_pa=float(result.delta_p_pa),
+        delta_p_kpa=float(result.delta_p_kpa),
+        delta_p_bar=float(result.delta_p_bar),
+        static_stress_pa=float(result.static_stress_pa),
         skempton_b=skempton_b,
-        detectable=detectable
+        detectable=bool(result.detectable)
     )
 
 
@@ -650,6 +859,21 @@ def recurrence_interval(event_dates: List[float]) -> Tuple[float, float, List[fl
 # GEOGRAPHIC UTILITIES
 # =============================================================================
 
+def haversine_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Array version of haversine(): great-circle distance in km (broadcasting),
+    via the shared geodesy.haversine_km kernel.
+
+    Args:
+        lat1, lon1: First point(s) (degrees)
+        lat2, lon2: Second point(s) (degrees)
+
+    Returns:
+        Distance in kilometers (broadcast shape of the inputs)
+    """
+    return haversine_km(lat1, lon1, lat2, lon2)
+
+
 def haversine(
     lat1: float, lon1: float,
     lat2: float, lon2: float
@@ -664,18 +888,28 @@ def haversine(
     Returns:
         Distance in kilometers
     """
-    R = 6371.0  # Earth radius in km
+    return float(haversine_array(lat1, lon1, lat2, lon2))
 
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
 
-    a = (math.sin(dlat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+def bearing_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Array version of bearing(): initial bearing in degrees (broadcasting).
 
-    return R * c
+    Returns:
+        Bearing in degrees (0-360, clockwise from north)
+    """
+    lat1, lon1, lat2, lon2 = _as_arrays(lat1, lon1, lat2, lon2)
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlon = np.radians(lon2 - lon1)
+
+    x = np.sin(dlon) * np.cos(lat2_rad)
+    y = (np.cos(lat1_rad) * np.sin(lat2_rad) -
+         np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon))
+
+    bearing_deg = np.degrees(np.arctan2(x, y))
+
+    return (bearing_deg + 360) % 360
 
 
 def bearing(
@@ -688,18 +922,7 @@ def bearing(
     Returns:
         Bearing in degrees (0-360, clockwise from north)
     """
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlon = math.radians(lon2 - lon1)
-
-    x = math.sin(dlon) * math.cos(lat2_rad)
-    y = (math.cos(lat1_rad) * math.sin(lat2_rad) -
-         math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
-
-    bearing_rad = math.atan2(x, y)
-    bearing_deg = math.degrees(bearing_rad)
-
-    return (bearing_deg + 360) % 360
+    return float(bearing_array(lat1, lon1, lat2, lon2))
 
 
 # =============================================================================
@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+Local Earthquake Catalog Mirror for Paleoseismic Research.
+
+Imports catalog exports (USGS ComCat CSV/GeoJSON, INGV FDSN text) or pulls
+them from the FDSN web services into a SQLite file with an R*Tree index over
+(lat, lon, day, magnitude). Radius/time/magnitude queries then run in
+milliseconds instead of one live FDSN request per cave.
+
+A coverage table records which (source, time range, minimum magnitude,
+bounding box) windows have been mirrored, so callers can tell whether the
+local copy answers a query completely (see covers()), and refresh() only
+downloads the time ranges that are not covered yet.
+
+Usage:
+    from earthquake_catalog import get_catalog
+
+    catalog = get_catalog(create=True)
+    catalog.refresh('comcat', '1900-01-01', min_magnitude=4.5)
+    events = catalog.query(44.1, 8.2, radius_km=100, start_date='1900-01-01',
+                           min_magnitude=5.0)
+
+    python earthquake_catalog.py refresh --source comcat --start 1900-01-01 --min-mag 4.5
+    python earthquake_catalog.py import-ingv data/ingv_liguria_raw.txt
+    python earthquake_catalog.py query --lat 44.1 --lon 8.2 --radius 100 --min-mag 5
+"""
+
+import csv
+import io
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from geodesy import haversine_km, search_window
+from http_cache import cached_get, HOUR
+
+CATALOG_ENV = 'PALEOSEISMIC_EQ_CATALOG'
+DEFAULT_CATALOG_PATH = Path(__file__).parent / "cache" / "earthquake_catalog.sqlite"
+
+MS_PER_DAY = 86_400_000
+NO_MAGNITUDE = -99.0  # R*Tree stand-in for events without a magnitude
+GLOBAL_BBOX = (-90.0, 90.0, -180.0, 180.0)
+
+# FDSN event services: name -> (endpoint, format, max events per request)
+FDSN_SOURCES = {
+    'comcat': ("https://earthquake.usgs.gov/fdsnws/event/1/query", 'geojson', 20000),
+    'ingv': ("https://webservices.ingv.it/fdsnws/event/1/query", 'text', 10000),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    time_ms INTEGER NOT NULL,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    depth_km REAL,
+    magnitude REAL,
+    mag_type TEXT,
+    place TEXT,
+    event_type TEXT,
+    UNIQUE (source, event_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS events_rtree USING rtree(
+    id, min_lat, max_lat, min_lon, max_lon, min_day, max_day, min_mag, max_mag
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    source TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    min_magnitude REAL NOT NULL,
+    min_lat REAL NOT NULL,
+    max_lat REAL NOT NULL,
+    min_lon REAL NOT NULL,
+    max_lon REAL NOT NULL,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+EVENT_COLUMNS = ('source', 'event_id', 'time_ms', 'lat', 'lon', 'depth_km',
+                 'magnitude', 'mag_type', 'place', 'event_type')
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def to_ms(value) -> int:
+    """Epoch milliseconds (UTC) for an ISO date/datetime string or a datetime."""
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        dt = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(round(dt.timestamp() * 1000))
+
+
+def _float(value) -> Optional[float]:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(result) else result
+
+
+def _event_row(source: str, event_id, time_ms, lat, lon, depth_km, magnitude,
+               mag_type, place, event_type) -> Optional[tuple]:
+    """Normalized events row, or None when position or time is missing."""
+    lat, lon = _float(lat), _float(lon)
+    if lat is None or lon is None or time_ms is None or not event_id:
+        return None
+    lon = (lon + 180.0) % 360.0 - 180.0
+    return (source, str(event_id), int(time_ms), lat, lon, _float(depth_km), _float(magnitude),
+            mag_type or None, place or None, (event_type or 'earthquake').strip().lower())
+
+
+def parse_comcat_geojson(data, source: str = 'comcat') -> List[tuple]:
+    """Rows from a ComCat GeoJSON export (dict or JSON text)."""
+    if isinstance(data, (str, bytes)):
+        data = json.loads(data)
+
+    rows = []
+    for feature in data.get('features', []):
+        props = feature.get('properties') or {}
+        coords = (feature.get('geometry') or {}).get('coordinates') or [None, None, None]
+        row = _event_row(source, feature.get('id'), props.get('time'),
+                         coords[1], coords[0], coords[2] if len(coords) > 2 else None,
+                         props.get('mag'), props.get('magType'), props.get('place'),
+                         props.get('type'))
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def parse_comcat_csv(text: str, source: str = 'comcat') -> List[tuple]:
+    """Rows from a ComCat CSV export (time,latitude,longitude,depth,mag,magType,...,id,...)."""
+    rows = []
+    for record in csv.DictReader(io.StringIO(text)):
+        try:
+            time_ms = to_ms(record['time'])
+        except (KeyError, ValueError):
+            continue
+        row = _event_row(source, record.get('id'), time_ms, record.get('latitude'),
+                         record.get('longitude'), record.get('depth'), record.get('mag'),
+                         record.get('magType'), record.get('place'), record.get('type'))
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def parse_fdsn_text(text: str, source: str = 'ingv') -> List[tuple]:
+    """
+    Rows from FDSN text output (INGV):
+    EventID|Time|Latitude|Longitude|Depth/Km|Author|Catalog|Contributor|
+    ContributorID|MagType|Magnitude|MagAuthor|EventLocationName|EventType
+    """
+    rows = []
+    for line in text.splitlines():
+        if not line.strip() or line.startswith('#'):
+            continue
+        parts = line.rstrip('\n').split('|')
+        if len(parts) < 11:
+            continue
+        try:
+            time_ms = to_ms(parts[1])
+        except ValueError:
+            continue
+        row = _event_row(source, parts[0], time_ms, parts[2], parts[3], parts[4],
+                         parts[10], parts[9], parts[12] if len(parts) > 12 else None,
+                         parts[13] if len(parts) > 13 else None)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+# =============================================================================
+# CATALOG STORE
+# =============================================================================
+
+class EarthquakeCatalog:
+    """SQLite earthquake mirror with an R*Tree spatial/temporal/magnitude index."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (or create) a catalog file.
+
+        Args:
+            path: SQLite file (default: $PALEOSEISMIC_EQ_CATALOG or
+                tools/cache/earthquake_catalog.sqlite)
+        """
+        if path is None:
+            path = os.environ.get(CATALOG_ENV) or DEFAULT_CATALOG_PATH
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread (the MCP server queries from worker threads)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # Import
+    # -------------------------------------------------------------------------
+
+    def upsert(self, rows: Iterable[tuple]) -> int:
+        """
+        Insert or update events (keyed by source + event_id) and their index entries.
+
+        Returns:
+            Number of rows written
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        columns = ', '.join(EVENT_COLUMNS)
+        updates = ', '.join(f"{c} = excluded.{c}" for c in EVENT_COLUMNS[2:])
+
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS staging ({columns})")
+                conn.execute("DELETE FROM staging")
+                conn.executemany(f"INSERT INTO staging VALUES ({', '.join('?' * len(EVENT_COLUMNS))})", rows)
+                conn.execute(f"""
+                    INSERT INTO events ({columns}) SELECT {columns} FROM staging WHERE true
+                    ON CONFLICT (source, event_id) DO UPDATE SET {updates}
+                """)
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO events_rtree
+                    SELECT e.id, e.lat, e.lat, e.lon, e.lon,
+                           e.time_ms / {float(MS_PER_DAY)}, e.time_ms / {float(MS_PER_DAY)},
+                           COALESCE(e.magnitude, {NO_MAGNITUDE}), COALESCE(e.magnitude, {NO_MAGNITUDE})
+                    FROM events e JOIN staging s ON e.source = s.source AND e.event_id = s.event_id
+                """)
+                conn.execute("DELETE FROM staging")
+        return len(rows)
+
+    def add_coverage(self, source: str, start_date, end_date, min_magnitude: float,
+                     bbox: Tuple[float, float, float, float] = GLOBAL_BBOX):
+        """Record that [start_date, end_date] at M >= min_magnitude inside bbox is mirrored."""
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (source, to_ms(start_date), to_ms(end_date), float(min_magnitude),
+                              *map(float, bbox), time.time()))
+
+    def import_file(self, path: Path, source: Optional[str] = None,
+                    coverage: Optional[Tuple] = None) -> int:
+        """
+        Import a catalog export; format is chosen by extension
+        (.csv ComCat CSV, .json/.geojson ComCat GeoJSON, anything else FDSN text).
+
+        Args:
+            path: Export file
+            source: Catalog name stored with the events (default: comcat for
+                ComCat formats, ingv for FDSN text)
+            coverage: Optional (start_date, end_date, min_magnitude[, bbox])
+                declaring what the export contains completely
+
+        Returns:
+            Number of events imported
+        """
+        path = Path(path)
+        text = path.read_text(encoding='utf-8', errors='replace')
+        suffix = path.suffix.lower()
+
+        if suffix == '.csv':
+            rows = parse_comcat_csv(text, source or 'comcat')
+        elif suffix in ('.json', '.geojson'):
+            rows = parse_comcat_geojson(text, source or 'comcat')
+        else:
+            rows = parse_fdsn_text(text, source or 'ingv')
+
+        n = self.upsert(rows)
+        if coverage is not None and rows:
+            self.add_coverage(rows[0][0], *coverage)
+        return n
+
+    # -------------------------------------------------------------------------
+    # Incremental refresh from FDSN
+    # -------------------------------------------------------------------------
+
+    def _covered_intervals(self, source: str, min_magnitude: float,
+                           bbox: Tuple[float, float, float, float]) -> List[Tuple[int, int]]:
+        """Merged time intervals mirrored for a source, magnitude floor and box."""
+        min_lat, max_lat, min_lon, max_lon = bbox
+        rows = self._connect().execute("""
+            SELECT start_ms, end_ms FROM coverage
+            WHERE source = ? AND min_magnitude <= ?
+              AND min_lat <= ? AND max_lat >= ? AND min_lon <= ? AND max_lon >= ?
+            ORDER BY start_ms
+        """, (source, min_magnitude, min_lat, max_lat, min_lon, max_lon)).fetchall()
+
+        merged = []
+        for start, end in rows:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _gaps(self, source: str, start_ms: int, end_ms: int, min_magnitude: float,
+              bbox: Tuple[float, float, float, float]) -> List[Tuple[int, int]]:
+        gaps = []
+        cursor = start_ms
+        for start, end in self._covered_intervals(source, min_magnitude, bbox):
+            if end < cursor:
+                continue
+            if start > end_ms:
+                break
+            if start > cursor:
+                gaps.append((cursor, start))
+            cursor = max(cursor, end)
+        if cursor < end_ms:
+            gaps.append((cursor, end_ms))
+        return gaps
+
+    def covers(self, lat: float, lon: float, radius_km: float, start_date, end_date,
+               min_magnitude: float, source: str = 'comcat') -> bool:
+        """True if the mirror holds every event a live radius query would return."""
+        dlat, dlon = (float(v) for v in search_window(lat, radius_km))
+        if dlon >= 180 or lon - dlon < -180 or lon + dlon > 180:
+            bbox = (max(lat - dlat, -90.0), min(lat + dlat, 90.0), -180.0, 180.0)
+        else:
+            bbox = (max(lat - dlat, -90.0), min(lat + dlat, 90.0), lon - dlon, lon + dlon)
+        return not self._gaps(source, to_ms(start_date), to_ms(end_date), min_magnitude, bbox)
+
+    def _fetch(self, source: str, start_ms: int, end_ms: int, min_magnitude: float,
+               bbox: Tuple[float, float, float, float]) -> List[tuple]:
+        """One FDSN request; split in half while the service limit is hit."""
+        url, fmt, limit = FDSN_SOURCES[source]
+        iso = lambda ms: datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+        params = {
+            'format': fmt,
+            'starttime': iso(start_ms),
+            'endtime': iso(end_ms),
+            'minmagnitude': min_magnitude,
+            'minlatitude': bbox[0], 'maxlatitude': bbox[1],
+            'minlongitude': bbox[2], 'maxlongitude': bbox[3],
+            'orderby': 'time-asc',
+            'limit': limit,
+        }
+        response = cached_get(url, params=params, ttl=HOUR, timeout=120)
+        response.raise_for_status()
+        rows = (parse_comcat_geojson(response.content, source) if fmt == 'geojson'
+                else parse_fdsn_text(response.text, source))
+
+        if len(rows) >= limit and end_ms - start_ms > 1000:
+            mid = (start_ms + end_ms) // 2
+            return (self._fetch(source, start_ms, mid, min_magnitude, bbox) +
+                    self._fetch(source, mid, end_ms, min_magnitude, bbox))
+        return rows
+
+    def refresh(self, source: str = 'comcat', start_date='1900-01-01', end_date=None,
+                min_magnitude: float = 4.5,
+                bbox: Tuple[float, float, float, float] = GLOBAL_BBOX,
+                chunk_days: float = 365.0, force: bool = False, verbose: bool = True) -> int:
+        """
+        Mirror a time range from an FDSN service, downloading only uncovered parts.
+
+        Each chunk is committed with its coverage record, so an interrupted
+        refresh resumes where it stopped.
+
+        Args:
+            source: 'comcat' or 'ingv'
+            start_date, end_date: Time range (end default: now)
+            min_magnitude: Magnitude floor
+            bbox: (min_lat, max_lat, min_lon, max_lon)
+            chunk_days: Request window size
+            force: Re-download even covered ranges (picks up catalog revisions)
+            verbose: Print progress
+
+        Returns:
+            Number of events written
+        """
+        if source not in FDSN_SOURCES:
+            raise ValueError(f"Unknown source '{source}'. Options: {', '.join(FDSN_SOURCES)}")
+
+        start_ms = to_ms(start_date)
+        end_ms = to_ms(end_date) if end_date is not None else int(time.time() * 1000)
+        gaps = [(start_ms, end_ms)] if force else self._gaps(source, start_ms, end_ms, min_magnitude, bbox)
+
+        written = 0
+        chunk_ms = int(chunk_days * MS_PER_DAY)
+        for gap_start, gap_end in gaps:
+            for chunk_start in range(gap_start, gap_end, chunk_ms):
+                chunk_end = min(chunk_start + chunk_ms, gap_end)
+                rows = self._fetch(source, chunk_start, chunk_end, min_magnitude, bbox)
+                written += self.upsert(rows)
+                self.add_coverage(source, datetime.fromtimestamp(chunk_start / 1000, tz=timezone.utc),
+                                  datetime.fromtimestamp(chunk_end / 1000, tz=timezone.utc),
+                                  min_magnitude, bbox)
+                if verbose:
+                    print(f"  {source} {datetime.fromtimestamp(chunk_start / 1000, tz=timezone.utc):%Y-%m-%d}"
+                          f" .. {datetime.fromtimestamp(chunk_end / 1000, tz=timezone.utc):%Y-%m-%d}:"
+                          f" {len(rows)} events")
+        return written
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(self, lat: float, lon: float, radius_km: float = 100,
+              start_date='2000-01-01', end_date=None, min_magnitude: float = 4.0,
+              sources: Optional[List[str]] = None,
+              event_type: Optional[str] = 'earthquake') -> List[Dict]:
+        """
+        Events within radius_km of a point, newest first.
+
+        Same result format as mcp_server.query_usgs_earthquakes (id, time,
+        magnitude, mag_type, place, depth_km, lat, lon).
+
+        Args:
+            lat, lon: Search centre
+            radius_km: Great-circle radius (inclusive)
+            start_date, end_date: Time range (end default: now)
+            min_magnitude: Magnitude floor (events without a magnitude are excluded)
+            sources: Catalog names to search (default: all)
+            event_type: Only this event type (None: all types)
+
+        Returns:
+            List of event dicts
+        """
+        start_day = to_ms(start_date) / MS_PER_DAY
+        end_ms = to_ms(end_date) if end_date is not None else int(time.time() * 1000)
+        end_day = end_ms / MS_PER_DAY
+
+        # R*Tree candidates (one box, or two across the antimeridian)
+        dlat, dlon = (float(v) for v in search_window(lat, radius_km))
+        if dlon >= 180:
+            lon_ranges = [(-180.0, 180.0)]
+        else:
+            lo, hi = lon - dlon, lon + dlon
+            lon_ranges = [(max(lo, -180.0), min(hi, 180.0))]
+            if lo < -180:
+                lon_ranges.append((lo + 360.0, 180.0))
+            if hi > 180:
+                lon_ranges.append((-180.0, hi - 360.0))
+
+        where = ["r.max_lat >= ? AND r.min_lat <= ?",
+                 "(" + " OR ".join("(r.max_lon >= ? AND r.min_lon <= ?)" for _ in lon_ranges) + ")",
+                 "r.max_day >= ? AND r.min_day <= ?",
+                 "r.max_mag >= ?",
+                 "e.time_ms >= ? AND e.time_ms <= ?",
+                 "e.magnitude >= ?"]
+        args = [lat - dlat, lat + dlat, *[v for r in lon_ranges for v in r],
+                start_day - 1e-3, end_day + 1e-3, min_magnitude - 1e-3,
+                to_ms(start_date), end_ms, min_magnitude]
+        if sources:
+            where.append(f"e.source IN ({', '.join('?' * len(sources))})")
+            args.extend(sources)
+        if event_type is not None:
+            where.append("e.event_type = ?")
+            args.append(event_type.lower())
+
+        rows = self._connect().execute(f"""
+            SELECT e.event_id, e.time_ms, e.magnitude, e.mag_type, e.place, e.depth_km, e.lat, e.lon
+            FROM events_rtree r JOIN events e ON e.id = r.id
+            WHERE {' AND '.join(where)}
+        """, args).fetchall()
+        if not rows:
+            return []
+
+        # Exact great-circle radius, newest first
+        event_lat = np.array([r[6] for r in rows])
+        event_lon = np.array([r[7] for r in rows])
+        inside = np.flatnonzero(haversine_km(lat, lon, event_lat, event_lon) <= radius_km)
+        rows = sorted((rows[i] for i in inside), key=lambda r: r[1], reverse=True)
+
+        return [{
+            'id': event_id,
+            'time': datetime.fromtimestamp(time_ms / 1000).isoformat(),
+            'magnitude': magnitude,
+            'mag_type': mag_type,
+            'place': place,
+            'depth_km': depth_km,
+            'lat': event_lat_,
+            'lon': event_lon_,
+        } for event_id, time_ms, magnitude, mag_type, place, depth_km, event_lat_, event_lon_ in rows]
+
+    def status(self) -> Dict:
+        """Event counts per source and the coverage windows."""
+        conn = self._connect()
+        counts = dict(conn.execute("SELECT source, COUNT(*) FROM events GROUP BY source").fetchall())
+        coverage = {}
+        for source, magnitude in conn.execute(
+                "SELECT DISTINCT source, min_magnitude FROM coverage ORDER BY source, min_magnitude"):
+            intervals = []
+            for bbox in conn.execute("""SELECT DISTINCT min_lat, max_lat, min_lon, max_lon FROM coverage
+                                        WHERE source = ? AND min_magnitude = ?""", (source, magnitude)):
+                for start, end in self._covered_intervals(source, magnitude, bbox):
+                    intervals.append({
+                        'bbox': list(bbox),
+                        'start': datetime.fromtimestamp(start / 1000, tz=timezone.utc).strftime('%Y-%m-%d'),
+                        'end': datetime.fromtimestamp(end / 1000, tz=timezone.utc).strftime('%Y-%m-%d'),
+                    })
+            coverage.setdefault(source, {})[f"M>={magnitude:g}"] = intervals
+        return {'path': str(self.path), 'events': counts, 'coverage': coverage}
+
+
+_CATALOG: Optional[EarthquakeCatalog] = None
+_CATALOG_LOCK = threading.Lock()
+
+
+def get_catalog(create: bool = False) -> Optional[EarthquakeCatalog]:
+    """
+    Process-wide catalog mirror.
+
+    Args:
+        create: Create the SQLite file if it does not exist yet
+
+    Returns:
+        EarthquakeCatalog, or None if there is no mirror and create is False
+    """
+    global _CATALOG
+    with _CATALOG_LOCK:
+        if _CATALOG is None:
+            path = Path(os.environ.get(CATALOG_ENV) or DEFAULT_CATALOG_PATH)
+            if not create and not path.exists():
+                return None
+            _CATALOG = EarthquakeCatalog(path)
+        return _CATALOG
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def main():
+    """Command-line interface for the local catalog mirror."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local earthquake catalog mirror")
+    parser.add_argument("--db", type=str, default=None, help="SQLite file (default: tools/cache)")
+    subparsers = parser.add_subparsers(dest="command", help="Command")
+
+    refresh_parser = subparsers.add_parser("refresh", help="Mirror a time range from FDSN")
+    refresh_parser.add_argument("--source", choices=sorted(FDSN_SOURCES), default="comcat")
+    refresh_parser.add_argument("--start", default="1900-01-01")
+    refresh_parser.add_argument("--end", default=None)
+    refresh_parser.add_argument("--min-mag", type=float, default=4.5)
+    refresh_parser.add_argument("--bbox", type=str, default=None, help="min_lat,max_lat,min_lon,max_lon")
+    refresh_parser.add_argument("--force", action="store_true", help="Re-download covered ranges")
+
+    for command, help_text in (("import-comcat", "Import a ComCat CSV/GeoJSON export"),
+                               ("import-ingv", "Import INGV FDSN text output")):
+        import_parser = subparsers.add_parser(command, help=help_text)
+        import_parser.add_argument("path", type=str)
+        import_parser.add_argument("--start", default=None, help="Declare coverage from this date")
+        import_parser.add_argument("--end", default=None)
+        import_parser.add_argument("--min-mag", type=float, default=None)
+        import_parser.add_argument("--bbox", type=str, default=None, help="min_lat,max_lat,min_lon,max_lon")
+
+    query_parser = subparsers.add_parser("query", help="Radius/time/magnitude query")
+    query_parser.add_argument("--lat", type=float, required=True)
+    query_parser.add_argument("--lon", type=float, required=True)
+    query_parser.add_argument("--radius", type=float, default=100)
+    query_parser.add_argument("--start", default="1900-01-01")
+    query_parser.add_argument("--end", default=None)
+    query_parser.add_argument("--min-mag", type=float, default=4.0)
+
+    subparsers.add_parser("status", help="Event counts and coverage")
+
+    args = parser.parse_args()
+    catalog = EarthquakeCatalog(args.db)
+    bbox = tuple(float(v) for v in args.bbox.split(',')) if getattr(args, 'bbox', None) else GLOBAL_BBOX
+
+    if args.command == "refresh":
+        n = catalog.refresh(args.source, args.start, args.end, args.min_mag, bbox, force=args.force)
+        print(f"\nWrote {n} events ({len(catalog)} in mirror)")
+
+    elif args.command in ("import-comcat", "import-ingv"):
+        source = 'comcat' if args.command == "import-comcat" else 'ingv'
+        coverage = None
+        if args.start and args.end and args.min_mag is not None:
+            coverage = (args.start, args.end, args.min_mag, bbox)
+        n = catalog.import_file(Path(args.path), source, coverage)
+        print(f"Imported {n} events from {args.path}")
+
+    elif args.command == "query":
+        t = time.perf_counter()
+        events = catalog.query(args.lat, args.lon, args.radius, args.start, args.end, args.min_mag)
+        print(f"\n{len(events)} events within {args.radius} km ({(time.perf_counter() - t) * 1000:.1f} ms):")
+        for e in events[:20]:
+            print(f"  {e['time'][:10]}  M{e['magnitude']:.1f}  {e['place']}")
+
+    elif args.command == "status":
+        print(json.dumps(catalog.status(), indent=2))
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
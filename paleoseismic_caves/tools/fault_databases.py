@@ -13,9 +13,12 @@ Supported databases:
 Usage:
     from fault_databases import check_fault_proximity, search_usgs_faults
 
-    # Quick check - queries all databases
+    # Quick check - queries all databases (concurrently)
     result = check_fault_proximity(lat=44.125, lon=8.208, radius_km=50)
 
+    # Many sites through the same concurrent pipeline
+    results = check_fault_proximity_batch([(44.125, 8.208), (41.42, 31.93)])
+
     # Individual database queries
     usgs_faults = search_usgs_faults(lat=32.7, lon=-117.1, radius_km=30)
 """
@@ -23,11 +26,17 @@ Usage:
 import json
 import math
 import os
-import urllib.request
-import urllib.parse
+import threading
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from http_cache import cached_get, DAY
+from geodesy import point_segment_distance_km, point_to_polyline_distance, search_window, segment_bboxes
 
 
 # =============================================================================
@@ -63,7 +72,7 @@ class FaultProximityResult:
     distance_km: Optional[float]
     faults_within_radius: List[Fault]
     databases_checked: List[str]
-    is_dark_candidate: bool  # True if NO mapped fault found
+    is_dark_candidate: Optional[bool]  # True if NO mapped fault found; None if no database answered
     confidence: str  # 'HIGH', 'MODERATE', 'LOW'
     notes: List[str]
 
@@ -89,6 +98,9 @@ def point_to_line_distance(
     """
     Calculate minimum distance from point to a line (fault trace).
 
+    Exact great-circle distance to the nearest point of any segment (see
+    geodesy.point_segment_distance_km), not just to the vertices.
+
     Args:
         point_lat, point_lon: Query point
         line_coords: List of [lon, lat] coordinate pairs
@@ -96,27 +108,291 @@ def point_to_line_distance(
     Returns:
         Minimum distance in km
     """
-    min_dist = float('inf')
+    return point_to_polyline_distance(point_lat, point_lon, line_coords)
+
+
+# =============================================================================
+# PRE-PARSED FAULT STORE
+# =============================================================================
+
+CACHE_DIR = Path(__file__).parent / "cache"
+FAULT_STORE_VERSION = 2
+GRID_CELL_DEG = 1.0
+
+# Process-resident stores: (path, polygon_centroids) -> (size, mtime_ns, FaultStore)
+_FAULT_STORES: Dict[tuple, tuple] = {}
+# Concurrent check_fault_proximity() workers must not build the same store twice
+_FAULT_STORES_LOCK = threading.Lock()
+
+
+def _geometry_parts(geom: Dict[str, Any], polygon_centroids: bool) -> List[List[List[float]]]:
+    """
+    Vertex lists ([lon, lat] pairs) of a GeoJSON geometry, one per part.
+
+    Polygons are reduced to the centroid of their outer ring when
+    polygon_centroids is set (DISS convention) and skipped otherwise.
+    """
+    gtype = geom.get('type')
+    coords = geom.get('coordinates') or []
+
+    if gtype == 'LineString':
+        return [coords] if coords else []
+    if gtype == 'MultiLineString':
+        return [line for line in coords if line]
+    if gtype == 'Point':
+        return [[coords]] if len(coords) >= 2 else []
+    if gtype == 'Polygon' and polygon_centroids:
+        ring = coords[0] if coords else []
+        if not ring:
+            return []
+        return [[[sum(c[0] for c in ring) / len(ring), sum(c[1] for c in ring) / len(ring)]]]
+    return []
+
+
+class FaultStore:
+    """
+    Pre-parsed fault file held as flat numpy arrays.
+
+    - vertex_lat / vertex_lon: every vertex of every feature
+    - part_offsets: vertices of part p are part_offsets[p]:part_offsets[p+1]
+    - feature_parts: parts of feature i are feature_parts[i]:feature_parts[i+1]
+    - seg_a / seg_b, feature_segments: segment endpoint vertex indices, grouped
+      by feature (single-vertex parts give a zero-length segment)
+    - bbox: (n_features, 4) min_lat, max_lat, min_lon, max_lon
+    - cell_offsets / cell_features: features overlapping each GRID_CELL_DEG cell
+    - properties: GeoJSON properties of each feature
+    """
+
+    ARRAYS = ('vertex_lat', 'vertex_lon', 'part_offsets', 'feature_parts',
+              'seg_a', 'seg_b', 'feature_segments', 'bbox', 'cell_offsets', 'cell_features')
 
-    for i in range(len(line_coords) - 1):
-        # Get segment endpoints
-        lon1, lat1 = line_coords[i]
-        lon2, lat2 = line_coords[i + 1]
+    def __init__(self, arrays: Dict[str, Any], properties: List[Dict[str, Any]]):
+        for name in self.ARRAYS:
+            setattr(self, name, np.asarray(arrays[name]))
+        self.properties = properties
+        self.n_lat_cells = int(round(180 / GRID_CELL_DEG))
+        self.n_lon_cells = int(round(360 / GRID_CELL_DEG))
 
-        # Distance to each endpoint
-        d1 = haversine(point_lat, point_lon, lat1, lon1)
-        d2 = haversine(point_lat, point_lon, lat2, lon2)
+    def __len__(self) -> int:
+        return len(self.properties)
 
-        # Simple approximation: use minimum of endpoint distances
-        # For more accuracy, would project point onto segment
-        min_dist = min(min_dist, d1, d2)
+    @classmethod
+    def from_geojson(cls, filepath: Path, polygon_centroids: bool = False) -> 'FaultStore':
+        """Parse a GeoJSON fault file (features without usable geometry are dropped)."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
-    # Also check single point if only one coordinate
-    if len(line_coords) == 1:
-        lon, lat = line_coords[0]
-        min_dist = haversine(point_lat, point_lon, lat, lon)
+        lons, lats = [], []
+        part_offsets, feature_parts = [0], [0]
+        properties = []
+
+        for feature in data.get('features', []):
+            parts = _geometry_parts(feature.get('geometry') or {}, polygon_centroids)
+            if not parts:
+                continue
+            for part in parts:
+                lons.extend(c[0] for c in part)
+                lats.extend(c[1] for c in part)
+                part_offsets.append(len(lons))
+            feature_parts.append(len(part_offsets) - 1)
+            properties.append(feature.get('properties') or {})
+
+        vertex_lat = np.array(lats, dtype=float)
+        vertex_lon = np.array(lons, dtype=float)
+        part_offsets = np.array(part_offsets, dtype=np.int64)
+        feature_parts = np.array(feature_parts, dtype=np.int64)
+        n_features = len(properties)
+
+        # Segments: consecutive vertices of the same part, in feature order
+        part_len = np.diff(part_offsets)
+        part_feature = np.repeat(np.arange(n_features), np.diff(feature_parts))
+        vertex_part = np.repeat(np.arange(len(part_len)), part_len)
+        inner = np.flatnonzero(vertex_part[1:] == vertex_part[:-1]) if len(vertex_part) else \
+            np.zeros(0, dtype=np.int64)
+        single = part_offsets[:-1][part_len == 1]
+        seg_a = np.concatenate([inner, single]).astype(np.int64)
+        seg_b = np.concatenate([inner + 1, single]).astype(np.int64)
+        seg_feature = part_feature[vertex_part[seg_a]]
+        order = np.lexsort((seg_a, seg_feature))
+        seg_a, seg_b, seg_feature = seg_a[order], seg_b[order], seg_feature[order]
+        feature_segments = np.concatenate([[0], np.cumsum(np.bincount(seg_feature, minlength=n_features))])
+
+        # Bounding boxes (of the segments' great-circle arcs)
+        seg_box = segment_bboxes(vertex_lat[seg_a], vertex_lon[seg_a],
+                                 vertex_lat[seg_b], vertex_lon[seg_b])
+        bbox = np.empty((n_features, 4))
+        if n_features:
+            starts = feature_segments[:-1]
+            bbox[:, 0] = np.minimum.reduceat(seg_box[:, 0], starts)
+            bbox[:, 1] = np.maximum.reduceat(seg_box[:, 1], starts)
+            bbox[:, 2] = np.minimum.reduceat(seg_box[:, 2], starts)
+            bbox[:, 3] = np.maximum.reduceat(seg_box[:, 3], starts)
+
+        # Grid buckets: every cell a feature's bbox touches
+        n_lat_cells, n_lon_cells = int(round(180 / GRID_CELL_DEG)), int(round(360 / GRID_CELL_DEG))
+        cells, cell_feature = [], []
+        for i, (min_lat, max_lat, min_lon, max_lon) in enumerate(bbox):
+            rows = np.arange(_lat_cell(min_lat, n_lat_cells), _lat_cell(max_lat, n_lat_cells) + 1)
+            cols = _lon_cells(min_lon, max_lon, n_lon_cells)
+            ids = (rows[:, None] * n_lon_cells + cols[None, :]).ravel()
+            cells.append(ids)
+            cell_feature.append(np.full(len(ids), i, dtype=np.int64))
+        cells = np.concatenate(cells) if cells else np.zeros(0, dtype=np.int64)
+        cell_feature = np.concatenate(cell_feature) if cell_feature else np.zeros(0, dtype=np.int64)
+        order = np.argsort(cells, kind='stable')
+        cell_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(cells, minlength=n_lat_cells * n_lon_cells))])
+
+        return cls({
+            'vertex_lat': vertex_lat, 'vertex_lon': vertex_lon,
+            'part_offsets': part_offsets, 'feature_parts': feature_parts,
+            'seg_a': seg_a, 'seg_b': seg_b, 'feature_segments': feature_segments,
+            'bbox': bbox, 'cell_offsets': cell_offsets, 'cell_features': cell_feature[order],
+        }, properties)
+
+    def candidates(self, lat: float, lon: float, radius_km: float):
+        """Features whose bounding box intersects the search window around a point."""
+        dlat, dlon = (float(v) for v in search_window(lat, radius_km))
+        rows = np.arange(_lat_cell(lat - dlat, self.n_lat_cells),
+                         _lat_cell(lat + dlat, self.n_lat_cells) + 1)
+        cols = _lon_cells(lon - dlon, lon + dlon, self.n_lon_cells)
+        ids = (rows[:, None] * self.n_lon_cells + cols[None, :]).ravel()
+
+        starts, ends = self.cell_offsets[ids], self.cell_offsets[ids + 1]
+        counts = ends - starts
+        if counts.sum() == 0:
+            return np.zeros(0, dtype=np.int64)
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        features = np.unique(self.cell_features[positions])
+
+        # Exact window test (longitudes compared modulo 360)
+        box = self.bbox[features]
+        lat_ok = (box[:, 1] >= lat - dlat) & (box[:, 0] <= lat + dlat)
+        if dlon >= 180:
+            return features[lat_ok]
+        lon_ok = np.zeros(len(features), dtype=bool)
+        for shift in (-360.0, 0.0, 360.0):
+            lon_ok |= (box[:, 3] + shift >= lon - dlon) & (box[:, 2] + shift <= lon + dlon)
+        return features[lat_ok & lon_ok]
+
+    def query(self, lat: float, lon: float, radius_km: float) -> List[tuple]:
+        """
+        Features within radius_km of a point.
+
+        Distance is the exact great-circle distance to the nearest segment of
+        the feature (same convention as point_to_line_distance).
+
+        Returns:
+            List of (feature index, distance_km), in file order
+        """
+        features = self.candidates(lat, lon, radius_km)
+        if len(features) == 0:
+            return []
+
+        starts = self.feature_segments[features]
+        counts = self.feature_segments[features + 1] - starts
+        first = np.cumsum(counts) - counts
+        segments = np.repeat(starts - first, counts) + np.arange(counts.sum())
+
+        a, b = self.seg_a[segments], self.seg_b[segments]
+        dist = point_segment_distance_km(lat, lon, self.vertex_lat[a], self.vertex_lon[a],
+                                         self.vertex_lat[b], self.vertex_lon[b])
+        dist = np.minimum.reduceat(dist, first)
+
+        inside = dist <= radius_km
+        return list(zip(features[inside].tolist(), dist[inside].tolist()))
+
+    def save(self, path: Path, source_stat: tuple):
+        """Write the store to a binary cache file (atomic replace)."""
+        import pickle
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'version': FAULT_STORE_VERSION,
+                'source': source_stat,
+                'arrays': {name: getattr(self, name) for name in self.ARRAYS},
+                'properties': self.properties,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, source_stat: tuple) -> Optional['FaultStore']:
+        """Read a cached store; None if missing, stale or unreadable."""
+        import pickle
+
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, OSError, AttributeError):
+            return None
+        if data.get('version') != FAULT_STORE_VERSION or data.get('source') != source_stat:
+            return None
+        return cls(data['arrays'], data['properties'])
 
-    return min_dist
+
+def _lat_cell(lat: float, n_lat_cells: int) -> int:
+    return min(max(int(math.floor((lat + 90) / GRID_CELL_DEG)), 0), n_lat_cells - 1)
+
+
+def _lon_cells(min_lon: float, max_lon: float, n_lon_cells: int):
+    """Grid columns covering a longitude range (wrapping at the antimeridian)."""
+    first = int(math.floor((min_lon + 180) / GRID_CELL_DEG))
+    last = int(math.floor((max_lon + 180) / GRID_CELL_DEG))
+    if last - first + 1 >= n_lon_cells:
+        return np.arange(n_lon_cells)
+    return np.arange(first, last + 1) % n_lon_cells
+
+
+def get_fault_store(filepath: Path, polygon_centroids: bool = False) -> Optional[FaultStore]:
+    """
+    Pre-parsed store for a GeoJSON fault file, loaded once per process.
+
+    The parsed arrays are cached on disk (tools/cache) and rebuilt when the
+    source file's size or mtime changes.
+
+    Args:
+        filepath: GeoJSON fault file
+        polygon_centroids: Represent polygons by their ring centroid (DISS)
+
+    Returns:
+        FaultStore, or None if the file is missing or not valid JSON
+    """
+    import hashlib
+
+    filepath = Path(filepath)
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        return None
+    source_stat = (stat.st_size, stat.st_mtime_ns, polygon_centroids)
+
+    key = (str(filepath.resolve()), polygon_centroids)
+
+    with _FAULT_STORES_LOCK:
+        cached = _FAULT_STORES.get(key)
+        if cached is not None and cached[0] == source_stat:
+            return cached[1]
+
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        cache_path = CACHE_DIR / f"{filepath.stem}_{digest}.faultstore.pkl"
+
+        store = FaultStore.load(cache_path, source_stat)
+        if store is None:
+            try:
+                store = FaultStore.from_geojson(filepath, polygon_centroids)
+            except (json.JSONDecodeError, FileNotFoundError):
+                return None
+            try:
+                store.save(cache_path, source_stat)
+            except OSError:
+                pass  # read-only checkout: keep the in-memory store only
+
+        _FAULT_STORES[key] = (source_stat, store)
+        return store
 
 
 # =============================================================================
@@ -178,20 +454,20 @@ def search_usgs_faults(
             # Alternative: use the Hazard Fault Search
             search_url = (
                 "https://earthquake.usgs.gov/arcgis/rest/services/"
-                "haz/hazfaults2014/MapServer/0/query?"
-                f"geometry={min_lon},{min_lat},{max_lon},{max_lat}&"
-                "geometryType=esriGeometryEnvelope&"
-                "spatialRel=esriSpatialRelIntersects&"
-                "outFields=*&f=geojson"
+                "haz/hazfaults2014/MapServer/0/query"
             )
-
-            req = urllib.request.Request(
-                search_url,
-                headers={'User-Agent': 'PaleoseismicResearch/1.0'}
-            )
-
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                data = json.loads(response.read().decode())
+            params = {
+                'geometry': f"{min_lon},{min_lat},{max_lon},{max_lat}",
+                'geometryType': 'esriGeometryEnvelope',
+                'spatialRel': 'esriSpatialRelIntersects',
+                'outFields': '*',
+                'f': 'geojson',
+            }
+
+            # The fault model changes rarely: reuse responses for a month
+            response = cached_get(search_url, params=params, ttl=30 * DAY, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
 
             for feature in data.get('features', []):
                 props = feature.get('properties', {})
@@ -267,24 +543,30 @@ def search_gem_faults(
     Returns:
         List of Fault objects within radius
     """
-    gem_path = Path(__file__).parent.parent / "data" / "fault_databases" / "gem_active_faults.geojson"
-
-    if not gem_path.exists():
-        # Try alternative paths
-        alt_paths = [
-            Path(__file__).parent.parent / "data" / "gem_active_faults.geojson",
-            Path(__file__).parent.parent.parent / "data" / "fault_databases" / "gem_active_faults.geojson",
-        ]
-        for p in alt_paths:
-            if p.exists():
-                gem_path = p
-                break
-        else:
-            return []  # No GEM data available
+    gem_path = _gem_path()
+    if gem_path is None:
+        return []  # No GEM data available
 
     return _query_local_geojson(gem_path, lat, lon, radius_km, "gem")
 
 
+def _gem_path() -> Optional[Path]:
+    """Location of the GEM GeoJSON (default path, then alternative paths)."""
+    gem_path = Path(__file__).parent.parent / "data" / "fault_databases" / "gem_active_faults.geojson"
+    if gem_path.exists():
+        return gem_path
+
+    # Try alternative paths
+    alt_paths = [
+        Path(__file__).parent.parent / "data" / "gem_active_faults.geojson",
+        Path(__file__).parent.parent.parent / "data" / "fault_databases" / "gem_active_faults.geojson",
+    ]
+    for p in alt_paths:
+        if p.exists():
+            return p
+    return None
+
+
 def _query_local_geojson(
     filepath: Path,
     lat: float,
@@ -292,59 +574,36 @@ def _query_local_geojson(
     radius_km: float,
     database: str
 ) -> List[Fault]:
-    """Query a local GeoJSON fault file."""
-    faults = []
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+    """Query a local GeoJSON fault file (via its pre-parsed FaultStore)."""
+    store = get_fault_store(filepath)
+    if store is None:
         return []
 
-    for feature in data.get('features', []):
-        props = feature.get('properties', {})
-        geom = feature.get('geometry', {})
-
-        # Get coordinates based on geometry type
-        if geom.get('type') == 'MultiLineString':
-            all_coords = []
-            for line in geom.get('coordinates', []):
-                all_coords.extend(line)
-            coords = all_coords
-        elif geom.get('type') == 'LineString':
-            coords = geom.get('coordinates', [])
-        elif geom.get('type') == 'Point':
-            coords = [geom.get('coordinates', [])]
-        else:
-            coords = []
+    faults = []
 
-        if not coords:
-            continue
+    for idx, dist in store.query(lat, lon, radius_km):
+        props = store.properties[idx]
 
-        # Calculate distance
-        dist = point_to_line_distance(lat, lon, coords)
-
-        if dist <= radius_km:
-            # Extract properties based on database format
-            if database == 'gem':
-                name = props.get('name', props.get('fault_name', 'Unknown'))
-                slip_rate = props.get('slip_rate', props.get('average_slip_rate'))
-                slip_sense = props.get('slip_type', props.get('slip_sense'))
-            else:
-                name = props.get('fault_name', props.get('NAME', 'Unknown'))
-                slip_rate = props.get('slip_rate')
-                slip_sense = props.get('slip_sense')
-
-            faults.append(Fault(
-                name=name,
-                database=database,
-                distance_km=round(dist, 1),
-                slip_rate_mm_yr=_parse_slip_rate(slip_rate),
-                slip_sense=slip_sense,
-                fault_id=props.get('ogc_fid', props.get('fault_id')),
-                length_km=props.get('length_km'),
-                metadata=props
-            ))
+        # Extract properties based on database format
+        if database == 'gem':
+            name = props.get('name', props.get('fault_name', 'Unknown'))
+            slip_rate = props.get('slip_rate', props.get('average_slip_rate'))
+            slip_sense = props.get('slip_type', props.get('slip_sense'))
+        else:
+            name = props.get('fault_name', props.get('NAME', 'Unknown'))
+            slip_rate = props.get('slip_rate')
+            slip_sense = props.get('slip_sense')
+
+        faults.append(Fault(
+            name=name,
+            database=database,
+            distance_km=round(dist, 1),
+            slip_rate_mm_yr=_parse_slip_rate(slip_rate),
+            slip_sense=slip_sense,
+            fault_id=props.get('ogc_fid', props.get('fault_id')),
+            length_km=props.get('length_km'),
+            metadata=dict(props)
+        ))
 
     return sorted(faults, key=lambda f: f.distance_km)
 
@@ -404,65 +663,36 @@ def _query_diss_file(
     radius_km: float,
     source_type: str
 ) -> List[Fault]:
-    """Query a DISS GeoJSON file."""
-    faults = []
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+    """Query a DISS GeoJSON file (polygons use their centroid)."""
+    store = get_fault_store(filepath, polygon_centroids=True)
+    if store is None:
         return []
 
-    for feature in data.get('features', []):
-        props = feature.get('properties', {})
-        geom = feature.get('geometry', {})
-
-        # DISS uses various geometry types
-        if geom.get('type') == 'Polygon':
-            # Use centroid approximation
-            coords = geom.get('coordinates', [[]])[0]
-            if coords:
-                center_lon = sum(c[0] for c in coords) / len(coords)
-                center_lat = sum(c[1] for c in coords) / len(coords)
-                dist = haversine(lat, lon, center_lat, center_lon)
-            else:
-                continue
-        elif geom.get('type') in ('LineString', 'MultiLineString'):
-            if geom.get('type') == 'MultiLineString':
-                coords = [c for line in geom.get('coordinates', []) for c in line]
-            else:
-                coords = geom.get('coordinates', [])
-            dist = point_to_line_distance(lat, lon, coords)
-        elif geom.get('type') == 'Point':
-            coords = geom.get('coordinates', [])
-            if len(coords) >= 2:
-                dist = haversine(lat, lon, coords[1], coords[0])
-            else:
-                continue
-        else:
-            continue
+    faults = []
 
-        if dist <= radius_km:
-            # Extract DISS-specific properties
-            faults.append(Fault(
-                name=props.get('name', props.get('Name', f'DISS {source_type}')),
-                database='diss',
-                distance_km=round(dist, 1),
-                slip_rate_mm_yr=props.get('slip_rate_min'),  # DISS has min/max
-                slip_sense=props.get('rake_class', props.get('mechanism')),
-                fault_id=props.get('iss_id', props.get('css_id', props.get('id'))),
-                dip=props.get('dip'),
-                rake=props.get('rake'),
-                max_magnitude=props.get('max_mag', props.get('Mmax')),
-                recurrence_yr=props.get('rec_int_min'),  # Recurrence interval
-                length_km=props.get('length'),
-                metadata={
-                    'source_type': source_type,
-                    'min_depth': props.get('min_depth'),
-                    'max_depth': props.get('max_depth'),
-                    **props
-                }
-            ))
+    for idx, dist in store.query(lat, lon, radius_km):
+        props = store.properties[idx]
+
+        # Extract DISS-specific properties
+        faults.append(Fault(
+            name=props.get('name', props.get('Name', f'DISS {source_type}')),
+            database='diss',
+            distance_km=round(dist, 1),
+            slip_rate_mm_yr=props.get('slip_rate_min'),  # DISS has min/max
+            slip_sense=props.get('rake_class', props.get('mechanism')),
+            fault_id=props.get('iss_id', props.get('css_id', props.get('id'))),
+            dip=props.get('dip'),
+            rake=props.get('rake'),
+            max_magnitude=props.get('max_mag', props.get('Mmax')),
+            recurrence_yr=props.get('rec_int_min'),  # Recurrence interval
+            length_km=props.get('length'),
+            metadata={
+                'source_type': source_type,
+                'min_depth': props.get('min_depth'),
+                'max_depth': props.get('max_depth'),
+                **props
+            }
+        ))
 
     return faults
 
@@ -498,97 +728,215 @@ def search_scec_faults(
     return _query_local_geojson(scec_path, lat, lon, radius_km, "scec")
 
 
+# =============================================================================
+# PRELOADING
+# =============================================================================
+
+def preload_fault_stores() -> List[str]:
+    """
+    Parse (or load from the on-disk cache) every local fault file up front,
+    so the first proximity query does not pay for it.
+
+    Returns:
+        Names of the files whose FaultStore is now in memory
+    """
+    data_dir = Path(__file__).parent.parent / "data" / "fault_databases"
+    files = [
+        (_gem_path(), False),
+        (data_dir / "usgs_qfaults.geojson", False),
+        (data_dir / "scec_cfm7.geojson", False),
+        (data_dir / "diss331" / "individual_seismogenic_sources.geojson", True),
+        (data_dir / "diss331" / "composite_seismogenic_sources.geojson", True),
+        (data_dir / "diss331" / "diss331.geojson", True),
+    ]
+
+    loaded = []
+    for filepath, polygon_centroids in files:
+        if filepath is not None and get_fault_store(filepath, polygon_centroids) is not None:
+            loaded.append(filepath.name)
+    return loaded
+
+
 # =============================================================================
 # UNIFIED FAULT PROXIMITY CHECK
 # =============================================================================
 
-def check_fault_proximity(
+# Per-source time budget in seconds, counted from when the query starts running.
+# Local files get a generous budget because the first call may have to parse
+# the GeoJSON into a FaultStore. Each call also has an overall deadline that
+# covers time spent queued (default: the largest budget among its queries, times
+# the number of pool rounds those queries need).
+SOURCE_TIMEOUTS = {
+    'usgs': 30.0,
+    'gem': 60.0,
+    'diss': 60.0,
+    'scec': 60.0,
+}
+
+FAULT_QUERY_WORKERS = 8
+
+_FAULT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_FAULT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _is_italy(lat: float, lon: float) -> bool:
+    # Italy region: 35-47°N, 6-19°E
+    return 35 <= lat <= 47 and 6 <= lon <= 19
+
+
+def _is_california(lat: float, lon: float) -> bool:
+    # California region: 32-42°N, 114-125°W
+    return 32 <= lat <= 42 and -125 <= lon <= -114
+
+
+def _always(lat: float, lon: float) -> bool:
+    return True
+
+
+# name -> (search function, applies to location, label, note when nothing found),
+# in the order results are merged
+FAULT_SOURCES: Dict[str, Tuple[Callable, Callable, str, str]] = {
+    'usgs': (search_usgs_faults, _always, "USGS", "USGS: No faults found (note: 9-27yr database lag)"),
+    'gem': (search_gem_faults, _always, "GEM", "GEM: No faults found"),
+    'diss': (search_diss_sources, _is_italy, "DISS", "DISS: No seismogenic sources found"),
+    'scec': (search_scec_faults, _is_california, "SCEC", "SCEC CFM: No faults found"),
+}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool shared by all fault proximity checks."""
+    global _FAULT_EXECUTOR
+    with _FAULT_EXECUTOR_LOCK:
+        if _FAULT_EXECUTOR is None:
+            _FAULT_EXECUTOR = ThreadPoolExecutor(max_workers=FAULT_QUERY_WORKERS,
+                                                 thread_name_prefix="fault-db")
+        return _FAULT_EXECUTOR
+
+
+class _CallDeadline:
+    """Overall wall-clock limit of one proximity call, queued time included."""
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.start = time.monotonic()
+        self.seconds = seconds
+        self.at = float('inf')
+
+    def settle(self, queries: Iterable['_SourceQuery']):
+        """
+        Fix the deadline once all queries are submitted.
+
+        The default scales with the queue: the largest budget once per round
+        of FAULT_QUERY_WORKERS queries, so a long batch is not cut off while
+        its later locations are still waiting for a worker.
+        """
+        if self.seconds is None:
+            queries = list(queries)
+            rounds = -(-len(queries) // FAULT_QUERY_WORKERS)
+            self.seconds = max((q.timeout for q in queries), default=0.0) * rounds
+        self.at = self.start + self.seconds
+
+
+class _SourceQuery:
+    """One database query for one location, running on the shared pool."""
+
+    def __init__(self, source: str, lat: float, lon: float, radius_km: float, timeout: float,
+                 deadline: _CallDeadline):
+        self.source = source
+        self.timeout = timeout
+        self.deadline = deadline
+        self.started: Optional[float] = None
+        self.future = _get_executor().submit(self._run, FAULT_SOURCES[source][0], lat, lon, radius_km)
+
+    def _run(self, search: Callable, lat: float, lon: float, radius_km: float) -> List[Fault]:
+        self.started = time.monotonic()
+        return search(lat, lon, radius_km)
+
+    def expires_at(self) -> float:
+        if self.started is None:
+            return self.deadline.at
+        return min(self.started + self.timeout, self.deadline.at)
+
+    def expired(self, now: float) -> bool:
+        return now > self.expires_at()
+
+    def timeout_note(self, label: str) -> str:
+        if self.started is None:
+            return f"{label} query not started within the {self.deadline.seconds:g}s deadline (partial results)"
+        if self.timeout <= self.deadline.seconds:
+            return f"{label} query timed out after {self.timeout:g}s (partial results)"
+        return f"{label} query cut off at the {self.deadline.seconds:g}s deadline (partial results)"
+
+
+def _submit_queries(
     lat: float,
     lon: float,
-    radius_km: float = 50,
-    include_databases: Optional[List[str]] = None
-) -> FaultProximityResult:
-    """
-    Check all fault databases for mapped faults near a location.
+    radius_km: float,
+    include_databases: Optional[List[str]],
+    timeouts: Optional[Dict[str, float]],
+    deadline: _CallDeadline
+) -> List[_SourceQuery]:
+    """Start every applicable database query for one location."""
+    if include_databases is None:
+        include_databases = list(FAULT_SOURCES)
+    budgets = {**SOURCE_TIMEOUTS, **(timeouts or {})}
 
-    This is the main function for verifying "dark earthquake" candidates.
-    A true dark earthquake has NO mapped fault within the search radius
-    in ANY database.
+    return [
+        _SourceQuery(source, lat, lon, radius_km, budgets[source], deadline)
+        for source, (_, applies, _, _) in FAULT_SOURCES.items()
+        if source in include_databases and applies(lat, lon)
+    ]
 
-    Args:
-        lat, lon: Location to check
-        radius_km: Search radius in km (default 50 km for M6-7 events)
-        include_databases: List of databases to check. Default: all available.
-            Options: 'usgs', 'gem', 'diss', 'scec'
 
-    Returns:
-        FaultProximityResult with:
-        - has_mapped_fault: True if ANY fault found
-        - is_dark_candidate: True if NO fault found (potential dark earthquake)
-        - nearest_fault: Closest fault if any
-        - faults_within_radius: All faults found
-        - confidence: Assessment confidence
+def _settled(query: _SourceQuery, now: float) -> bool:
+    return query.future.done() or query.expired(now)
 
-    Example:
-        >>> result = check_fault_proximity(44.125, 8.208, radius_km=50)
-        >>> if result.is_dark_candidate:
-        ...     print("No mapped fault - potential dark earthquake!")
-        >>> else:
-        ...     print(f"Nearest fault: {result.nearest_fault.name} at {result.distance_km} km")
-    """
-    if include_databases is None:
-        include_databases = ['usgs', 'gem', 'diss', 'scec']
 
+def _wait_for_any(pending: List[_SourceQuery], now: float, poll_s: float):
+    """Block until one pending query finishes or the next budget runs out."""
+    # Sleep until the next budget or deadline runs out (or poll while queued,
+    # since a query's own budget starts when it does)
+    step = min(q.expires_at() for q in pending) - now
+    if any(q.started is None for q in pending):
+        step = min(step, poll_s)
+    wait([q.future for q in pending], timeout=max(step, 0.0), return_when=FIRST_COMPLETED)
+
+
+def _wait_for_queries(queries: List[_SourceQuery], poll_s: float = 0.05):
+    """Block until every query has finished or run past its time budget."""
+    pending = list(queries)
+    while pending:
+        now = time.monotonic()
+        pending = [q for q in pending if not _settled(q, now)]
+        if not pending:
+            break
+        _wait_for_any(pending, now, poll_s)
+
+
+def _build_proximity_result(lat: float, lon: float, queries: List[_SourceQuery]) -> FaultProximityResult:
+    """Merge per-source results (partial if some sources failed or timed out)."""
     all_faults = []
     databases_checked = []
     notes = []
 
-    # Determine which databases are relevant based on location
-    # Italy region: 35-47°N, 6-19°E
-    is_italy = 35 <= lat <= 47 and 6 <= lon <= 19
-    # California region: 32-42°N, 114-125°W
-    is_california = 32 <= lat <= 42 and -125 <= lon <= -114
+    for query in queries:
+        label, empty_note = FAULT_SOURCES[query.source][2:]
+        future = query.future
 
-    # Query each database
-    if 'usgs' in include_databases:
-        try:
-            usgs_faults = search_usgs_faults(lat, lon, radius_km)
-            all_faults.extend(usgs_faults)
-            databases_checked.append('usgs')
-            if not usgs_faults:
-                notes.append("USGS: No faults found (note: 9-27yr database lag)")
-        except Exception as e:
-            notes.append(f"USGS query failed: {e}")
+        if not future.done():
+            future.cancel()  # no-op if already running; the thread finishes on its own
+            notes.append(query.timeout_note(label))
+            continue
 
-    if 'gem' in include_databases:
         try:
-            gem_faults = search_gem_faults(lat, lon, radius_km)
-            all_faults.extend(gem_faults)
-            databases_checked.append('gem')
-            if not gem_faults:
-                notes.append("GEM: No faults found")
+            faults = future.result()
         except Exception as e:
-            notes.append(f"GEM query failed: {e}")
+            notes.append(f"{label} query failed: {e}")
+            continue
 
-    if 'diss' in include_databases and is_italy:
-        try:
-            diss_faults = search_diss_sources(lat, lon, radius_km)
-            all_faults.extend(diss_faults)
-            databases_checked.append('diss')
-            if not diss_faults:
-                notes.append("DISS: No seismogenic sources found")
-        except Exception as e:
-            notes.append(f"DISS query failed: {e}")
-
-    if 'scec' in include_databases and is_california:
-        try:
-            scec_faults = search_scec_faults(lat, lon, radius_km)
-            all_faults.extend(scec_faults)
-            databases_checked.append('scec')
-            if not scec_faults:
-                notes.append("SCEC CFM: No faults found")
-        except Exception as e:
-            notes.append(f"SCEC query failed: {e}")
+        all_faults.extend(faults)
+        databases_checked.append(query.source)
+        if not faults:
+            notes.append(empty_note)
 
     # Sort by distance and deduplicate by name
     all_faults.sort(key=lambda f: f.distance_km)
@@ -599,8 +947,11 @@ def check_fault_proximity(
             unique_faults.append(f)
             seen_names.add(f.name.lower())
 
-    # Determine result
+    # Determine result (no answer at all says nothing about dark status)
     has_mapped_fault = len(unique_faults) > 0
+    is_dark_candidate = not has_mapped_fault if databases_checked else None
+    if not databases_checked:
+        notes.append("No fault database answered - dark-candidate status unknown")
     nearest = unique_faults[0] if unique_faults else None
     distance = nearest.distance_km if nearest else None
 
@@ -614,7 +965,7 @@ def check_fault_proximity(
         notes.append("Limited database coverage - verify with additional sources")
 
     # Add region-specific warnings
-    if not is_italy and not is_california:
+    if not _is_italy(lat, lon) and not _is_california(lat, lon):
         notes.append("Location outside well-mapped regions (Italy/California)")
         if confidence == "HIGH":
             confidence = "MODERATE"
@@ -625,12 +976,161 @@ def check_fault_proximity(
         distance_km=distance,
         faults_within_radius=unique_faults,
         databases_checked=databases_checked,
-        is_dark_candidate=not has_mapped_fault,
+        is_dark_candidate=is_dark_candidate,
         confidence=confidence,
         notes=notes
     )
 
 
+def check_fault_proximity(
+    lat: float,
+    lon: float,
+    radius_km: float = 50,
+    include_databases: Optional[List[str]] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+    deadline_s: Optional[float] = None
+) -> FaultProximityResult:
+    """
+    Check all fault databases for mapped faults near a location.
+
+    This is the main function for verifying "dark earthquake" candidates.
+    A true dark earthquake has NO mapped fault within the search radius
+    in ANY database.
+
+    The databases are queried concurrently, so latency is that of the
+    slowest source rather than the sum. A source that exceeds its time
+    budget, or has not answered by the overall deadline, is left out of
+    databases_checked and noted; the result is built from the sources that
+    did answer.
+
+    Args:
+        lat, lon: Location to check
+        radius_km: Search radius in km (default 50 km for M6-7 events)
+        include_databases: List of databases to check. Default: all available.
+            Options: 'usgs', 'gem', 'diss', 'scec'
+        timeouts: Per-source time budgets in seconds, overriding SOURCE_TIMEOUTS
+        deadline_s: Overall time limit in seconds, including time queued behind
+            other checks (default: the largest budget among the queried sources)
+
+    Returns:
+        FaultProximityResult with:
+        - has_mapped_fault: True if ANY fault found
+        - is_dark_candidate: True if NO fault found (potential dark earthquake),
+          None if no database answered
+        - nearest_fault: Closest fault if any
+        - faults_within_radius: All faults found
+        - confidence: Assessment confidence
+
+    Example:
+        >>> result = check_fault_proximity(44.125, 8.208, radius_km=50)
+        >>> if result.is_dark_candidate:
+        ...     print("No mapped fault - potential dark earthquake!")
+        >>> else:
+        ...     print(f"Nearest fault: {result.nearest_fault.name} at {result.distance_km} km")
+    """
+    deadline = _CallDeadline(deadline_s)
+    queries = _submit_queries(lat, lon, radius_km, include_databases, timeouts, deadline)
+    deadline.settle(queries)
+    _wait_for_queries(queries)
+    return _build_proximity_result(lat, lon, queries)
+
+
+def check_fault_proximity_batch(
+    locations: Iterable[Tuple[float, float]],
+    radius_km: float = 50,
+    include_databases: Optional[List[str]] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+    deadline_s: Optional[float] = None
+) -> List[FaultProximityResult]:
+    """
+    check_fault_proximity() for many locations through one concurrent pipeline.
+
+    Every (location, database) query is submitted to the shared pool up
+    front, so a list of cave sites costs roughly N / FAULT_QUERY_WORKERS
+    network round trips instead of N x the sum of all source latencies.
+    Time budgets apply per query from the moment it starts running; the
+    overall deadline covers the whole batch, so queries still queued when it
+    passes are cancelled and noted rather than waited for (a location with no
+    answering database reports is_dark_candidate=None).
+
+    Args:
+        locations: (lat, lon) pairs
+        radius_km: Search radius in km
+        include_databases: Databases to check (default: all available)
+        timeouts: Per-source time budgets in seconds, overriding SOURCE_TIMEOUTS
+        deadline_s: Time limit in seconds for the whole batch (default: the
+            largest budget among the queried sources per round of
+            FAULT_QUERY_WORKERS queries)
+
+    Returns:
+        One FaultProximityResult per location, in input order
+    """
+    locations = list(locations)
+    results: List[Optional[FaultProximityResult]] = [None] * len(locations)
+    for index, result in iter_fault_proximity_batch(locations, radius_km, include_databases,
+                                                    timeouts, deadline_s):
+        results[index] = result
+    return results
+
+
+def iter_fault_proximity_batch(
+    locations: Iterable[Tuple[float, float]],
+    radius_km: float = 50,
+    include_databases: Optional[List[str]] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+    deadline_s: Optional[float] = None,
+    poll_s: float = 0.05
+) -> Iterator[Tuple[int, FaultProximityResult]]:
+    """
+    check_fault_proximity_batch() that yields each location as soon as all
+    of its queries have finished or run out of budget.
+
+    Args:
+        locations: (lat, lon) pairs
+        radius_km: Search radius in km
+        include_databases: Databases to check (default: all available)
+        timeouts: Per-source time budgets in seconds, overriding SOURCE_TIMEOUTS
+        deadline_s: Time limit in seconds for the whole batch (default: the
+            largest budget among the queried sources per round of
+            FAULT_QUERY_WORKERS queries)
+        poll_s: Polling interval while queries are still queued
+
+    Yields:
+        (input index, FaultProximityResult), in completion order. Closing the
+        generator early cancels the queries that have not started.
+    """
+    locations = [(float(lat), float(lon)) for lat, lon in locations]
+    deadline = _CallDeadline(deadline_s)
+    per_location = [_submit_queries(lat, lon, radius_km, include_databases, timeouts, deadline)
+                    for lat, lon in locations]
+    deadline.settle(q for queries in per_location for q in queries)
+
+    remaining = list(range(len(locations)))
+    try:
+        while remaining:
+            now = time.monotonic()
+            still_running = []
+            for index in remaining:
+                if all(_settled(q, now) for q in per_location[index]):
+                    lat, lon = locations[index]
+                    yield index, _build_proximity_result(lat, lon, per_location[index])
+                else:
+                    still_running.append(index)
+            remaining = still_running
+            if not remaining:
+                break
+
+            now = time.monotonic()
+            pending = [q for index in remaining for q in per_location[index] if not _settled(q, now)]
+            if pending:
+                _wait_for_any(pending, now, poll_s)
+    finally:
+        # Stopped early: drop whatever is still queued (running queries finish on their own)
+        for queries in per_location:
+            for query in queries:
+                query.future.cancel()
+
+
 # =============================================================================
 # CLI INTERFACE
 # =============================================================================
@@ -679,7 +1179,8 @@ def main():
         print(f"  Databases: {', '.join(result.databases_checked)}")
         print(f"  ---")
         print(f"  Mapped fault found: {'YES' if result.has_mapped_fault else 'NO'}")
-        print(f"  Dark candidate: {'YES' if result.is_dark_candidate else 'NO'}")
+        dark = {True: 'YES', False: 'NO', None: 'UNKNOWN'}[result.is_dark_candidate]
+        print(f"  Dark candidate: {dark}")
         print(f"  Confidence: {result.confidence}")
 
         if result.nearest_fault:
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Great-Circle Geodesy Kernels for Fault Proximity.
+
+Shared numpy kernels for "how far is this earthquake/cave from that fault
+trace", used by fault_databases and the orphan-earthquake scripts:
+
+- haversine_km: point-to-point great-circle distance
+- point_segment_distance_km: exact distance from points to great-circle
+  segments (perpendicular foot when it falls inside the segment, else the
+  nearer endpoint) - not just the distance to the vertices
+- nearest_segment / nearest_polyline: M points x N segments in chunks, with
+  a bounding-box prefilter so the exact kernel only runs on pairs that can
+  beat each point's best candidate
+
+Usage:
+    from geodesy import nearest_polyline, point_to_polyline_distance
+
+    dist = point_to_polyline_distance(41.42, 31.93, fault_coords)
+    fault_idx, dist = nearest_polyline(eq_lats, eq_lons, [f['coords'] for f in faults])
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+# =============================================================================
+# POINT KERNELS
+# =============================================================================
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km (numpy-broadcasting)."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float))
+                              for v in (lat1, lon1, lat2, lon2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2)**2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def unit_vectors(lat, lon) -> np.ndarray:
+    """(..., 3) unit vectors on the sphere for latitude/longitude in degrees."""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def point_segment_distance_km(lat, lon, lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Exact great-circle distance in km from points to segments (broadcasting).
+
+    A segment is the minor great-circle arc between its endpoints; a
+    zero-length segment is a single point.
+
+    Args:
+        lat, lon: Query points (degrees)
+        lat1, lon1, lat2, lon2: Segment endpoints (degrees)
+
+    Returns:
+        Distance in km
+    """
+    p = unit_vectors(lat, lon)
+    a = unit_vectors(lat1, lon1)
+    b = unit_vectors(lat2, lon2)
+    p, a, b = np.broadcast_arrays(p, a, b)
+
+    endpoint_km = np.minimum(haversine_km(lat, lon, lat1, lon1), haversine_km(lat, lon, lat2, lon2))
+
+    normal = np.cross(a, b)
+    norm = np.linalg.norm(normal, axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normal = normal / norm[..., None]
+        sin_off = np.einsum('...i,...i->...', p, normal)
+
+        # The perpendicular foot lies inside the arc when it is on the a -> b
+        # side of both endpoints
+        foot = p - sin_off[..., None] * normal
+        inside = ((np.einsum('...i,...i->...', np.cross(a, foot), normal) >= 0) &
+                  (np.einsum('...i,...i->...', np.cross(foot, b), normal) >= 0) &
+                  (norm > 1e-12))
+
+        arc_km = EARTH_RADIUS_KM * np.arcsin(np.minimum(np.abs(sin_off), 1.0))
+
+    return np.where(inside, np.minimum(arc_km, endpoint_km), endpoint_km)
+
+
+# =============================================================================
+# SEGMENT SETS
+# =============================================================================
+
+def polyline_segments(polylines: Sequence[Sequence[Sequence[float]]]) -> Tuple[np.ndarray, ...]:
+    """
+    Flatten polylines ([lon, lat(, z)] vertex lists) into segment arrays.
+
+    A single-vertex polyline becomes one zero-length segment; empty ones
+    contribute nothing.
+
+    Returns:
+        (lat1, lon1, lat2, lon2, owner) where owner is the polyline index
+    """
+    lat1, lon1, lat2, lon2, owner = [], [], [], [], []
+    for i, coords in enumerate(polylines):
+        if len(coords) == 0:
+            continue
+        lons = [c[0] for c in coords]
+        lats = [c[1] for c in coords]
+        if len(coords) == 1:
+            lons, lats = lons * 2, lats * 2
+        lon1.extend(lons[:-1])
+        lat1.extend(lats[:-1])
+        lon2.extend(lons[1:])
+        lat2.extend(lats[1:])
+        owner.extend([i] * (len(lons) - 1))
+
+    return (np.array(lat1, dtype=float), np.array(lon1, dtype=float),
+            np.array(lat2, dtype=float), np.array(lon2, dtype=float),
+            np.array(owner, dtype=np.int64))
+
+
+def segment_bboxes(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Lat/lon boxes guaranteed to contain each great-circle segment.
+
+    Uses the spherical cap centred on the segment midpoint with radius half
+    its length (which contains the arc, including its poleward bulge).
+
+    Returns:
+        (n, 4) array of min_lat, max_lat, min_lon, max_lon; boxes around a
+        pole span all longitudes
+    """
+    a = unit_vectors(lat1, lon1)
+    b = unit_vectors(lat2, lon2)
+    mid = a + b
+    mid_norm = np.linalg.norm(mid, axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mid = np.where(mid_norm[..., None] > 1e-12, mid / mid_norm[..., None], a)
+    half = np.arccos(np.clip(np.einsum('...i,...i->...', a, mid), -1.0, 1.0))
+
+    mid_lat = np.arcsin(np.clip(mid[..., 2], -1.0, 1.0))
+    mid_lon = np.arctan2(mid[..., 1], mid[..., 0])
+    # Keep the original longitude convention (e.g. 0-360 data) for the centre
+    mid_lon = np.radians(np.asarray(lon1, dtype=float)) + \
+        (mid_lon - np.radians(np.asarray(lon1, dtype=float)) + np.pi) % (2 * np.pi) - np.pi
+
+    with np.errstate(invalid='ignore'):
+        polar = np.abs(mid_lat) + half >= np.pi / 2
+        dlon = np.where(polar, np.pi,
+                        np.arcsin(np.minimum(np.sin(half) / np.cos(mid_lat), 1.0)))
+
+    boxes = np.stack([mid_lat - half, mid_lat + half, mid_lon - dlon, mid_lon + dlon], axis=-1)
+    boxes = np.degrees(boxes)
+    boxes[..., 0] = np.maximum(boxes[..., 0], -90.0)
+    boxes[..., 1] = np.minimum(boxes[..., 1], 90.0)
+    return boxes
+
+
+def search_window(lat, radius_km) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Half-widths (dlat, dlon) in degrees of a box containing every point
+    within radius_km of latitude lat.
+
+    From the haversine formula: |dlat| <= d/R and hav(dlon) <= hav(d/R) /
+    (cos(lat) cos(lat')) with lat' bounded by the latitude band; dlon is 180
+    when the band reaches a pole.
+    """
+    lat = np.asarray(lat, dtype=float)
+    angle = np.minimum(np.asarray(radius_km, dtype=float) / EARTH_RADIUS_KM, np.pi)
+    dlat = np.degrees(angle)
+    band = np.radians(np.minimum(np.abs(lat) + dlat, 90.0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.sin(angle / 2)**2 / (np.cos(np.radians(lat)) * np.cos(band))
+        dlon = np.where(ratio < 1, np.degrees(2 * np.arcsin(np.sqrt(np.minimum(ratio, 1.0)))), 180.0)
+    return dlat, dlon
+
+
+def bbox_overlaps(lat, lon, dlat, dlon, boxes: np.ndarray) -> np.ndarray:
+    """
+    Whether each point's search window overlaps each box (longitudes
+    compared modulo 360).
+
+    Args:
+        lat, lon, dlat, dlon: (m,) window centres and half-widths
+        boxes: (n, 4) boxes from segment_bboxes
+
+    Returns:
+        (m, n) bool
+    """
+    lat, lon, dlat, dlon = (np.asarray(v, dtype=float)[:, None] for v in (lat, lon, dlat, dlon))
+    hit = (boxes[:, 1] >= lat - dlat) & (boxes[:, 0] <= lat + dlat)
+
+    full_lon = (dlon >= 180) | (boxes[:, 3] - boxes[:, 2] >= 360)
+    lon_hit = np.zeros(hit.shape, dtype=bool)
+    for shift in (-360.0, 0.0, 360.0):
+        lon_hit |= (boxes[:, 3] + shift >= lon - dlon) & (boxes[:, 2] + shift <= lon + dlon)
+
+    return hit & (lon_hit | full_lon)
+
+
+# =============================================================================
+# NEAREST SEGMENT / POLYLINE
+# =============================================================================
+
+def nearest_segment(lats, lons, lat1, lon1, lat2, lon2,
+                    max_distance_km: Optional[float] = None,
+                    chunk_size: int = 4_000_000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest segment and exact great-circle distance for M points x N segments.
+
+    Per chunk of points, the distance to each segment's midpoint (which lies
+    on the segment) bounds the answer from above; only segments whose
+    bounding box overlaps the search window of that bound go through the
+    exact kernel.
+
+    Args:
+        lats, lons: (m,) query points (degrees)
+        lat1, lon1, lat2, lon2: (n,) segment endpoints (degrees)
+        max_distance_km: Report no segment beyond this distance
+        chunk_size: Point x segment pairs per vectorized block
+
+    Returns:
+        (segment index or -1, distance in km or inf); ties go to the lowest index
+    """
+    lats = np.atleast_1d(np.asarray(lats, dtype=float))
+    lons = np.atleast_1d(np.asarray(lons, dtype=float))
+    lat1, lon1, lat2, lon2 = (np.atleast_1d(np.asarray(v, dtype=float))
+                              for v in (lat1, lon1, lat2, lon2))
+
+    best = np.full(len(lats), -1, dtype=np.int64)
+    best_km = np.full(len(lats), np.inf)
+    if len(lats) == 0 or len(lat1) == 0:
+        return best, best_km
+
+    boxes = segment_bboxes(lat1, lon1, lat2, lon2)
+    mid = unit_vectors(lat1, lon1) + unit_vectors(lat2, lon2)
+    mid_norm = np.linalg.norm(mid, axis=1)
+    mid = np.where(mid_norm[:, None] > 1e-12, mid / np.maximum(mid_norm, 1e-300)[:, None],
+                   unit_vectors(lat1, lon1))
+
+    valid = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+    rows = max(1, chunk_size // len(lat1))
+
+    for start in range(0, len(valid), rows):
+        q = valid[start:start + rows]
+        lat, lon = lats[q], lons[q]
+
+        # Upper bound: angle to the closest segment midpoint
+        cos_mid = np.clip(unit_vectors(lat, lon) @ mid.T, -1.0, 1.0)
+        bound = EARTH_RADIUS_KM * np.arccos(cos_mid.max(axis=1))
+        bound = bound * (1 + 1e-9) + 1e-9
+        if max_distance_km is not None:
+            bound = np.minimum(bound, max_distance_km)
+
+        dlat, dlon = search_window(lat, bound)
+        point, seg = np.nonzero(bbox_overlaps(lat, lon, dlat, dlon, boxes))
+        if len(point) == 0:
+            continue
+
+        dist = point_segment_distance_km(lat[point], lon[point],
+                                         lat1[seg], lon1[seg], lat2[seg], lon2[seg])
+        if max_distance_km is not None:
+            keep = dist <= max_distance_km
+            point, seg, dist = point[keep], seg[keep], dist[keep]
+
+        order = np.lexsort((seg, dist, point))
+        point, seg, dist = point[order], seg[order], dist[order]
+        first = np.r_[True, point[1:] != point[:-1]] if len(point) else np.zeros(0, dtype=bool)
+        best[q[point[first]]] = seg[first]
+        best_km[q[point[first]]] = dist[first]
+
+    return best, best_km
+
+
+def nearest_polyline(lats, lons, polylines: Sequence[Sequence[Sequence[float]]],
+                     max_distance_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest polyline (e.g. fault trace) and exact distance for many points.
+
+    Args:
+        lats, lons: Query points (degrees)
+        polylines: [lon, lat(, z)] vertex lists
+        max_distance_km: Report no polyline beyond this distance
+
+    Returns:
+        (polyline index or -1, distance in km or inf); ties go to the lowest index
+    """
+    lat1, lon1, lat2, lon2, owner = polyline_segments(polylines)
+    seg, dist = nearest_segment(lats, lons, lat1, lon1, lat2, lon2, max_distance_km)
+    return np.where(seg >= 0, owner[np.maximum(seg, 0)] if len(owner) else -1, -1), dist
+
+
+def point_to_polyline_distance(lat: float, lon: float,
+                               coords: Sequence[Sequence[float]]) -> float:
+    """
+    Exact great-circle distance in km from one point to one polyline.
+
+    Args:
+        lat, lon: Query point
+        coords: [lon, lat(, z)] vertex list
+
+    Returns:
+        Distance in km (inf for an empty polyline)
+    """
+    lat1, lon1, lat2, lon2, _ = polyline_segments([coords])
+    if len(lat1) == 0:
+        return math.inf
+    return float(point_segment_distance_km(lat, lon, lat1, lon1, lat2, lon2).min())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Cached HTTP Layer for Paleoseismic Data Clients.
+
+Shared GET helper for the USGS, WQP, ASF and CDSE clients. Successful
+responses are stored on disk, content-addressed by the normalized request
+(method, URL and sorted query parameters), so repeating an analysis makes
+no network round trips while the entry is younger than its TTL.
+
+- Transport: a pooled requests.Session per thread when requests is
+  installed, plain urllib otherwise
+- Storage: <cache dir>/<key[:2]>/<key>.json (request + response metadata)
+  and <key>.body (raw bytes)
+- If the network fails or the server answers 5xx, a stale entry is served
+  instead of an error
+
+Environment:
+    PALEOSEISMIC_HTTP_CACHE_DIR: cache directory (default tools/cache/http);
+        point it at a directory of recorded fixtures for tests
+    PALEOSEISMIC_HTTP_OFFLINE=1: replay mode; serve cached entries whatever
+        their age and raise OfflineCacheMiss instead of touching the network
+
+Usage:
+    from http_cache import cached_get
+
+    response = cached_get(url, params={'format': 'geojson'}, ttl=HOUR, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+HTTP_CACHE_VERSION = 1
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_TTL = DAY
+DEFAULT_USER_AGENT = 'PaleoseismicResearch/1.0'
+
+CACHE_DIR_ENV = 'PALEOSEISMIC_HTTP_CACHE_DIR'
+OFFLINE_ENV = 'PALEOSEISMIC_HTTP_OFFLINE'
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "http"
+
+
+# =============================================================================
+# ERRORS AND RESPONSES
+# =============================================================================
+
+class HTTPCacheError(IOError):
+    """Base class for errors raised by the cached HTTP layer."""
+
+
+class OfflineCacheMiss(HTTPCacheError):
+    """Offline mode is on and the request has no recorded response."""
+
+
+class HTTPStatusError(HTTPCacheError):
+    """Non-2xx response (raised by CachedResponse.raise_for_status)."""
+
+    def __init__(self, message: str, response: 'CachedResponse'):
+        super().__init__(message)
+        self.response = response
+
+
+class CachedResponse:
+    """Minimal requests.Response look-alike, from the network or the cache."""
+
+    def __init__(self, url: str, status_code: int, content: bytes,
+                 headers: Dict[str, str], from_cache: bool = False, stale: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache
+        self.stale = stale
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        content_type = self.headers.get('Content-Type', self.headers.get('content-type', ''))
+        encoding = 'utf-8'
+        for part in content_type.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                encoding = value.strip('"')
+        try:
+            return self.content.decode(encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HTTPStatusError(f"HTTP {self.status_code} for {self.url}", self)
+
+
+# =============================================================================
+# REQUEST NORMALIZATION
+# =============================================================================
+
+def _flatten_params(params: Optional[Dict[str, Any]]) -> list:
+    """(name, value) string pairs; list values become repeated parameters."""
+    pairs = []
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((str(name), str(v)) for v in values)
+    return pairs
+
+
+def normalize_request(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> tuple:
+    """
+    Canonical form of a request: parameters from the URL and from params are
+    merged and sorted, and scheme/host are lower-cased.
+
+    Returns:
+        (method, base URL without query, sorted (name, value) pairs)
+    """
+    parts = urllib.parse.urlsplit(url)
+    pairs = urllib.parse.parse_qsl(parts.query, keep_blank_values=True) + _flatten_params(params)
+    base = urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', '', ''))
+    return method.upper(), base, tuple(sorted(pairs))
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Content address (sha256 hex) of a normalized request."""
+    normalized = normalize_request(method, url, params)
+    return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class HTTPCache:
+    """On-disk response cache with TTLs, offline replay and a pooled transport."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, offline: Optional[bool] = None):
+        """
+        Args:
+            cache_dir: Storage directory (default: $PALEOSEISMIC_HTTP_CACHE_DIR
+                or tools/cache/http)
+            offline: Force replay mode on/off (default: $PALEOSEISMIC_HTTP_OFFLINE)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.cache_dir = Path(cache_dir)
+        self._offline = offline
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def offline(self) -> bool:
+        if self._offline is not None:
+            return self._offline
+        return os.environ.get(OFFLINE_ENV, '').lower() in ('1', 'true', 'yes')
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _paths(self, key: str) -> tuple:
+        folder = self.cache_dir / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def load(self, key: str) -> Optional[tuple]:
+        """(metadata, body) of a stored response, or None."""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != HTTP_CACHE_VERSION:
+            return None
+        return meta, body
+
+    def store(self, key: str, normalized: tuple, response: CachedResponse):
+        """Write a response (body first, then metadata; both atomic replace)."""
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'version': HTTP_CACHE_VERSION,
+            'method': normalized[0],
+            'url': normalized[1],
+            'params': [list(p) for p in normalized[2]],
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'fetched_at': time.time(),
+        }
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp_body = body_path.with_name(body_path.name + suffix)
+            tmp_body.write_bytes(response.content)
+            tmp_body.replace(body_path)
+            tmp_meta = meta_path.with_name(meta_path.name + suffix)
+            with open(tmp_meta, 'w') as f:
+                json.dump(meta, f, indent=1)
+            tmp_meta.replace(meta_path)
+        except OSError:
+            pass  # read-only checkout: serve uncached
+
+    # -------------------------------------------------------------------------
+    # Transport
+    # -------------------------------------------------------------------------
+
+    def _session(self):
+        """Per-thread requests.Session (connection pooling), or None without requests."""
+        if not hasattr(self._local, 'session'):
+            try:
+                import requests
+            except ImportError:
+                self._local.session = None
+            else:
+                session = requests.Session()
+                session.headers['User-Agent'] = DEFAULT_USER_AGENT
+                self._local.session = session
+        return self._local.session
+
+    def _fetch(self, url: str, pairs: tuple, headers: Optional[Dict[str, str]],
+               timeout: float) -> CachedResponse:
+        session = self._session()
+        if session is not None:
+            r = session.get(url, params=list(pairs), headers=headers, timeout=timeout)
+            return CachedResponse(r.url, r.status_code, r.content, dict(r.headers))
+
+        full_url = url + ('?' + urllib.parse.urlencode(pairs) if pairs else '')
+        request = urllib.request.Request(
+            full_url, headers={'User-Agent': DEFAULT_USER_AGENT, **(headers or {})})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as r:
+                return CachedResponse(full_url, r.status, r.read(), dict(r.headers))
+        except urllib.error.HTTPError as e:
+            return CachedResponse(full_url, e.code, e.read(), dict(e.headers or {}))
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            ttl: Optional[float] = None, timeout: float = 30,
+            headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+        """
+        GET through the cache.
+
+        Args:
+            url: Endpoint (may already contain query parameters)
+            params: Query parameters (part of the cache key)
+            ttl: Seconds a stored response stays fresh (default DEFAULT_TTL;
+                0 forces a refetch). Headers are not part of the key.
+            timeout: Network timeout in seconds
+            headers: Extra request headers
+
+        Returns:
+            CachedResponse (from_cache / stale tell where it came from; a
+            stored response stands in for a failed fetch or a 5xx answer)
+
+        Raises:
+            OfflineCacheMiss: Offline mode and nothing recorded
+            Transport errors (requests / urllib) when the fetch fails and
+            there is no stored response to fall back on
+        """
+        ttl = DEFAULT_TTL if ttl is None else ttl
+        normalized = normalize_request('GET', url, params)
+        key = request_key('GET', url, params)
+        cached = self.load(key)
+
+        if cached is not None:
+            meta, body = cached
+            age = time.time() - meta['fetched_at']
+            if self.offline or age <= ttl:
+                self.hits += 1
+                return CachedResponse(url, meta['status_code'], body, meta['headers'],
+                                      from_cache=True, stale=age > ttl)
+
+        if self.offline:
+            raise OfflineCacheMiss(f"No recorded response for {normalized[1]} {list(normalized[2])}")
+
+        self.misses += 1
+        try:
+            response = self._fetch(normalized[1], normalized[2], headers, timeout)
+        except Exception:
+            if cached is None:
+                raise
+            response = None
+
+        # An overloaded endpoint (5xx) is no better than no answer
+        if cached is not None and (response is None or response.status_code >= 500):
+            meta, body = cached
+            return CachedResponse(url, meta['status_code'], body, meta['headers'],
+                                  from_cache=True, stale=True)
+
+        if response.ok:
+            self.store(key, normalized, response)
+        return response
+
+
+_DEFAULT_CACHE: Optional[HTTPCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """Process-wide HTTPCache (created on first use)."""
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = HTTPCache()
+        return _DEFAULT_CACHE
+
+
+def cached_get(url: str, params: Optional[Dict[str, Any]] = None,
+               ttl: Optional[float] = None, timeout: float = 30,
+               headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+    """HTTPCache.get() on the process-wide cache."""
+    return get_http_cache().get(url, params=params, ttl=ttl, timeout=timeout, headers=headers)
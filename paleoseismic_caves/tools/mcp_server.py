@@ -7,6 +7,7 @@ This server provides Claude with direct access to:
 - Earthquake catalog searches (USGS)
 - Domain calculators (PGA, Chiodini, etc.)
 - RAG search over project documents
+- Batch variants of the earthquake, fault, volcanic and calculator tools
 
 To use with Claude Code, add to settings:
 {
@@ -18,14 +19,24 @@ To use with Claude Code, add to settings:
     }
   }
 }
+
+Environment:
+    PALEOSEISMIC_MCP_WORKERS: threads for blocking tool calls (default 8)
+    PALEOSEISMIC_MCP_WARMUP: resources to preload in the background after
+        start-up, comma-separated from sisal, faults, earthquake_catalog, rag
+        (default all; "none" disables). Progress: the server_status tool.
 """
 
+import asyncio
+import importlib
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
-import csv
 from datetime import datetime
 
 # Add tools directory to path
@@ -36,11 +47,29 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-# Import our modules
-import calculators
-from rag import RAGDatabase
-import fault_databases
-import volcanic_databases
+
+class _LazyModule:
+    """Module proxy that imports on first attribute access (keeps start-up fast)."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# Import our modules (lazily: numpy, SQLite stores etc. load on first use
+# or during warm-up, not before the handshake)
+calculators = _LazyModule("calculators")
+rag = _LazyModule("rag")
+fault_databases = _LazyModule("fault_databases")
+volcanic_databases = _LazyModule("volcanic_databases")
+http_cache = _LazyModule("http_cache")
+earthquake_catalog = _LazyModule("earthquake_catalog")
+sisal_store = _LazyModule("sisal_store")
 
 # =============================================================================
 # SISAL DATABASE
@@ -51,97 +80,20 @@ SISAL_PATH = Path(__file__).parent.parent / "data" / "SISAL3" / "sisalv3_databas
 
 def query_sisal_entities(region: str = None, min_samples: int = 100) -> list[dict]:
     """Query SISAL entities (caves) with optional filtering."""
-    entity_file = SISAL_PATH / "entity.csv"
-    site_file = SISAL_PATH / "site.csv"
-    sample_file = SISAL_PATH / "sample.csv"
-
-    if not entity_file.exists():
+    store = sisal_store.get_sisal_store(SISAL_PATH)
+    if store is None:
         return [{"error": f"SISAL not found at {SISAL_PATH}"}]
 
-    # Load sites for location data
-    sites = {}
-    with open(site_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            sites[row['site_id']] = {
-                'name': row['site_name'],
-                'lat': float(row['latitude']) if row['latitude'] else None,
-                'lon': float(row['longitude']) if row['longitude'] else None,
-                'country': row.get('country', '')
-            }
-
-    # Count samples per entity
-    sample_counts = {}
-    with open(sample_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            eid = row['entity_id']
-            sample_counts[eid] = sample_counts.get(eid, 0) + 1
-
-    # Load entities
-    results = []
-    with open(entity_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            site = sites.get(row['site_id'], {})
-            count = sample_counts.get(row['entity_id'], 0)
-
-            if count < min_samples:
-                continue
-
-            if region:
-                country = site.get('country', '').lower()
-                name = site.get('name', '').lower()
-                if region.lower() not in country and region.lower() not in name:
-                    continue
-
-            results.append({
-                'entity_id': row['entity_id'],
-                'entity_name': row['entity_name'],
-                'site_name': site.get('name', ''),
-                'country': site.get('country', ''),
-                'lat': site.get('lat'),
-                'lon': site.get('lon'),
-                'sample_count': count
-            })
-
-    return sorted(results, key=lambda x: -x['sample_count'])[:50]
+    return store.entities(region, min_samples, limit=50)
 
 
 def query_sisal_samples(entity_id: str, proxy: str = 'd18O_measurement') -> list[dict]:
     """Get samples for a specific entity."""
-    sample_file = SISAL_PATH / "sample.csv"
-    d18o_file = SISAL_PATH / "d18o.csv"
-
-    if not sample_file.exists():
+    store = sisal_store.get_sisal_store(SISAL_PATH)
+    if store is None:
         return [{"error": "SISAL not found"}]
 
-    # Load d18O data
-    d18o_data = {}
-    if d18o_file.exists():
-        with open(d18o_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sid = row['sample_id']
-                d18o_data[sid] = float(row['d18O_measurement']) if row['d18O_measurement'] else None
-
-    # Load samples
-    results = []
-    with open(sample_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row['entity_id'] != entity_id:
-                continue
-
-            sample_id = row['sample_id']
-            results.append({
-                'sample_id': sample_id,
-                'depth_mm': float(row['depth_sample']) if row.get('depth_sample') else None,
-                'age_bp': float(row['interp_age']) if row.get('interp_age') else None,
-                'd18O': d18o_data.get(sample_id)
-            })
-
-    return sorted(results, key=lambda x: x.get('age_bp') or 0)
+    return store.samples(entity_id)
 
 
 # =============================================================================
@@ -153,13 +105,22 @@ def query_usgs_earthquakes(
     start_date: str = "2000-01-01", end_date: str = None,
     min_magnitude: float = 4.0
 ) -> list[dict]:
-    """Query USGS earthquake catalog."""
-    import urllib.request
-    import urllib.parse
+    """
+    Query USGS earthquake catalog.
 
+    Answered from the local ComCat mirror (earthquake_catalog) when it covers
+    the whole request, otherwise live from FDSN (responses cached for an hour,
+    see http_cache).
+    """
     if end_date is None:
         end_date = datetime.now().strftime("%Y-%m-%d")
 
+    catalog = earthquake_catalog.get_catalog()
+    if catalog is not None and catalog.covers(lat, lon, radius_km, start_date, end_date,
+                                              min_magnitude, source='comcat'):
+        return catalog.query(lat, lon, radius_km, start_date, end_date, min_magnitude,
+                             sources=['comcat'])
+
     params = {
         'format': 'geojson',
         'latitude': lat,
@@ -172,11 +133,12 @@ def query_usgs_earthquakes(
         'orderby': 'time'
     }
 
-    url = "https://earthquake.usgs.gov/fdsnws/event/1/query?" + urllib.parse.urlencode(params)
+    url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode())
+        response = http_cache.cached_get(url, params=params, ttl=http_cache.HOUR, timeout=30)
+        response.raise_for_status()
+        data = response.json()
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -206,13 +168,18 @@ def query_usgs_earthquakes(
 # Initialize server
 server = Server("paleoseismic-tools")
 
-# Initialize RAG (lazily)
+# Initialize RAG (lazily; warm-up and the first rag_* call may race)
 _rag_db = None
+_rag_lock = threading.Lock()
+# Held by every thread driving the embedding model, which is not thread-safe
+# (rag_* calls and the warm-up encode)
+_rag_model_lock = threading.Lock()
 
 def get_rag():
     global _rag_db
-    if _rag_db is None:
-        _rag_db = RAGDatabase()
+    with _rag_lock:
+        if _rag_db is None:
+            _rag_db = rag.RAGDatabase()
     return _rag_db
 
 
@@ -473,312 +440,971 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["start_year", "end_year"]
             }
+        ),
+        # Batch Tools
+        Tool(
+            name="earthquake_search_batch",
+            description="earthquake_search for many sites in one call (e.g. every cave of a validation run). Sites run concurrently; each finished site is streamed as a progress notification when the client sends a progress token.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "sites": {
+                        "type": "array",
+                        "description": "Sites: {lat, lon, name?} plus optional per-site radius_km, start_date, end_date, min_magnitude",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "lat": {"type": "number"},
+                                "lon": {"type": "number"},
+                                "name": {"type": "string"}
+                            },
+                            "required": ["lat", "lon"]
+                        }
+                    },
+                    "radius_km": {"type": "number", "description": "Default search radius in km", "default": 100},
+                    "start_date": {"type": "string", "description": "Default start date (YYYY-MM-DD)", "default": "2000-01-01"},
+                    "end_date": {"type": "string", "description": "Default end date (YYYY-MM-DD)"},
+                    "min_magnitude": {"type": "number", "description": "Default minimum magnitude", "default": 4.0},
+                    "max_events": {"type": "integer", "description": "Events listed per site, largest first (default 20; counts are always complete)", "default": 20}
+                },
+                "required": ["sites"]
+            }
+        ),
+        Tool(
+            name="check_fault_proximity_batch",
+            description="check_fault_proximity for many sites in one call. All site/database queries share the loaded fault files and run concurrently; finished sites are streamed as progress notifications.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "sites": {
+                        "type": "array",
+                        "description": "Sites: {lat, lon, name?}",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "lat": {"type": "number"},
+                                "lon": {"type": "number"},
+                                "name": {"type": "string"}
+                            },
+                            "required": ["lat", "lon"]
+                        }
+                    },
+                    "radius_km": {"type": "number", "description": "Search radius in km (default 50)", "default": 50}
+                },
+                "required": ["sites"]
+            }
+        ),
+        Tool(
+            name="check_volcanic_activity_batch",
+            description="check_volcanic_activity for many time windows in one call; the volcanic databases are read once for all windows.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "windows": {
+                        "type": "array",
+                        "description": "Windows: {start_year, end_year, name?}",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "start_year": {"type": "integer"},
+                                "end_year": {"type": "integer"},
+                                "name": {"type": "string"}
+                            },
+                            "required": ["start_year", "end_year"]
+                        }
+                    }
+                },
+                "required": ["windows"]
+            }
+        ),
+        Tool(
+            name="calc_batch",
+            description="Run many calculator calls (calc_pga, calc_chiodini, calc_distance, calc_recurrence, calc_energy, calc_connectivity, calc_pore_pressure) in one request.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "calls": {
+                        "type": "array",
+                        "description": "Calls: {tool, arguments} with the arguments of the named calculator tool",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "tool": {"type": "string"},
+                                "arguments": {"type": "object"}
+                            },
+                            "required": ["tool", "arguments"]
+                        }
+                    }
+                },
+                "required": ["calls"]
+            }
+        ),
+        Tool(
+            name="server_status",
+            description="Readiness of the preloaded resources (SISAL store, fault files, earthquake catalog mirror, RAG model) and tool execution settings.",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
         )
     ]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls."""
+# =============================================================================
+# TOOL HANDLERS
+# =============================================================================
+# Plain (blocking) functions: call_tool runs them on the tool executor.
+# Batch tools are coroutines that put their items on the executor themselves.
+
+def _tool_sisal_search_caves(arguments: dict) -> list[TextContent]:
+    results = query_sisal_entities(
+        region=arguments.get("region"),
+        min_samples=arguments.get("min_samples", 100)
+    )
+    return [TextContent(type="text", text=json.dumps(results, indent=2))]
+
+
+def _tool_sisal_get_samples(arguments: dict) -> list[TextContent]:
+    results = query_sisal_samples(arguments["entity_id"])
+    return [TextContent(type="text", text=json.dumps(results[:100], indent=2))]  # Limit output
+
+
+def _tool_earthquake_search(arguments: dict) -> list[TextContent]:
+    results = query_usgs_earthquakes(
+        lat=arguments["lat"],
+        lon=arguments["lon"],
+        radius_km=arguments.get("radius_km", 100),
+        start_date=arguments.get("start_date", "2000-01-01"),
+        end_date=arguments.get("end_date"),
+        min_magnitude=arguments.get("min_magnitude", 4.0)
+    )
+    return [TextContent(type="text", text=json.dumps(results, indent=2))]
+
+
+def _calc_pga(arguments: dict) -> dict:
+    result = calculators.pga_attenuation(
+        magnitude=arguments["magnitude"],
+        distance_km=arguments["distance_km"],
+        depth_km=arguments.get("depth_km", 10),
+        model=arguments.get("model", "bindi2011")
+    )
+    output = {
+        "pga_g": round(result.pga_g, 4),
+        "pga_cm_s2": round(result.pga_cm_s2, 1),
+        "mmi": result.mmi,
+        "model": result.model,
+        "sigma": result.sigma
+    }
+    return output
+
+
+def _calc_chiodini(arguments: dict) -> dict:
+    result = calculators.chiodini_co2_flux(
+        magnitude=arguments["magnitude"],
+        distance_km=arguments["distance_km"]
+    )
+    output = {
+        "flux_ratio": round(result.flux_ratio, 2),
+        "perturbation_pct": round(result.perturbation_pct, 1),
+        "duration_years": round(result.duration_years, 1),
+        "detectable": result.detectable
+    }
+    return output
+
+
+def _calc_distance(arguments: dict) -> dict:
+    dist = calculators.haversine(
+        arguments["lat1"], arguments["lon1"],
+        arguments["lat2"], arguments["lon2"]
+    )
+    bearing = calculators.bearing(
+        arguments["lat1"], arguments["lon1"],
+        arguments["lat2"], arguments["lon2"]
+    )
+    output = {
+        "distance_km": round(dist, 1),
+        "bearing_deg": round(bearing, 1)
+    }
+    return output
+
+
+def _calc_recurrence(arguments: dict) -> dict:
+    mean_int, std_int, intervals = calculators.recurrence_interval(arguments["events"])
+    last_event = max(arguments["events"])
+    years_since = 2025 - last_event
+    output = {
+        "events": sorted(arguments["events"]),
+        "intervals": intervals,
+        "mean_recurrence": round(mean_int, 1),
+        "std_recurrence": round(std_int, 1),
+        "years_since_last": years_since,
+        "percent_of_cycle": round(100 * years_since / mean_int, 0) if mean_int > 0 else None
+    }
+    return output
+
+
+def _calc_energy(arguments: dict) -> dict:
+    result = calculators.seismic_energy_density(
+        magnitude=arguments["magnitude"],
+        distance_km=arguments["distance_km"],
+        connectivity=arguments.get("connectivity", 1.0)
+    )
+    max_dist = calculators.detection_distance_limit(
+        arguments["magnitude"],
+        arguments.get("connectivity", 1.0)
+    )
+    output = {
+        "raw_energy_jm3": result.raw_energy_jm3,
+        "effective_energy_jm3": result.effective_energy_jm3,
+        "connectivity": result.connectivity,
+        "threshold_jm3": result.threshold_jm3,
+        "threshold_exceeded": result.threshold_exceeded,
+        "ratio_to_threshold": round(result.ratio_to_threshold, 1),
+        "max_detection_distance_km": round(max_dist, 0)
+    }
+    return output
+
+
+def _calc_connectivity(arguments: dict) -> dict:
+    result = calculators.aquifer_connectivity(
+        fault_type=arguments["fault_type"],
+        geology=arguments["geology"],
+        distance_km=arguments["distance_km"],
+        fault_intersects_aquifer=arguments.get("fault_intersects_aquifer", False)
+    )
+    output = {
+        "connectivity": round(result.connectivity, 2),
+        "fault_factor": round(result.fault_factor, 2),
+        "geology_factor": round(result.geology_factor, 2),
+        "distance_factor": round(result.distance_factor, 2),
+        "confidence": result.confidence,
+        "explanation": result.explanation
+    }
+    return output
+
+
+def _calc_pore_pressure(arguments: dict) -> dict:
+    result = calculators.pore_pressure_perturbation(
+        magnitude=arguments["magnitude"],
+        distance_km=arguments["distance_km"],
+        skempton_b=arguments.get("skempton_b", 0.7)
+    )
+    output = {
+        "delta_p_kpa": round(result.delta_p_kpa, 3),
+        "delta_p_bar": round(result.delta_p_bar, 4),
+        "static_stress_pa": result.static_stress_pa,
+        "skempton_b": result.skempton_b,
+        "detectable": result.detectable
+    }
+    return output
 
-    if name == "sisal_search_caves":
-        results = query_sisal_entities(
-            region=arguments.get("region"),
-            min_samples=arguments.get("min_samples", 100)
-        )
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
-
-    elif name == "sisal_get_samples":
-        results = query_sisal_samples(arguments["entity_id"])
-        return [TextContent(type="text", text=json.dumps(results[:100], indent=2))]  # Limit output
-
-    elif name == "earthquake_search":
-        results = query_usgs_earthquakes(
-            lat=arguments["lat"],
-            lon=arguments["lon"],
-            radius_km=arguments.get("radius_km", 100),
-            start_date=arguments.get("start_date", "2000-01-01"),
-            end_date=arguments.get("end_date"),
-            min_magnitude=arguments.get("min_magnitude", 4.0)
-        )
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
-
-    elif name == "calc_pga":
-        result = calculators.pga_attenuation(
-            magnitude=arguments["magnitude"],
-            distance_km=arguments["distance_km"],
-            depth_km=arguments.get("depth_km", 10),
-            model=arguments.get("model", "bindi2011")
-        )
-        output = {
-            "pga_g": round(result.pga_g, 4),
-            "pga_cm_s2": round(result.pga_cm_s2, 1),
-            "mmi": result.mmi,
-            "model": result.model,
-            "sigma": result.sigma
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_chiodini":
-        result = calculators.chiodini_co2_flux(
-            magnitude=arguments["magnitude"],
-            distance_km=arguments["distance_km"]
-        )
-        output = {
-            "flux_ratio": round(result.flux_ratio, 2),
-            "perturbation_pct": round(result.perturbation_pct, 1),
-            "duration_years": round(result.duration_years, 1),
-            "detectable": result.detectable
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_distance":
-        dist = calculators.haversine(
-            arguments["lat1"], arguments["lon1"],
-            arguments["lat2"], arguments["lon2"]
-        )
-        bearing = calculators.bearing(
-            arguments["lat1"], arguments["lon1"],
-            arguments["lat2"], arguments["lon2"]
-        )
-        output = {
-            "distance_km": round(dist, 1),
-            "bearing_deg": round(bearing, 1)
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_recurrence":
-        mean_int, std_int, intervals = calculators.recurrence_interval(arguments["events"])
-        last_event = max(arguments["events"])
-        years_since = 2025 - last_event
-        output = {
-            "events": sorted(arguments["events"]),
-            "intervals": intervals,
-            "mean_recurrence": round(mean_int, 1),
-            "std_recurrence": round(std_int, 1),
-            "years_since_last": years_since,
-            "percent_of_cycle": round(100 * years_since / mean_int, 0) if mean_int > 0 else None
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_energy":
-        result = calculators.seismic_energy_density(
-            magnitude=arguments["magnitude"],
-            distance_km=arguments["distance_km"],
-            connectivity=arguments.get("connectivity", 1.0)
-        )
-        max_dist = calculators.detection_distance_limit(
-            arguments["magnitude"],
-            arguments.get("connectivity", 1.0)
-        )
-        output = {
-            "raw_energy_jm3": result.raw_energy_jm3,
-            "effective_energy_jm3": result.effective_energy_jm3,
-            "connectivity": result.connectivity,
-            "threshold_jm3": result.threshold_jm3,
-            "threshold_exceeded": result.threshold_exceeded,
-            "ratio_to_threshold": round(result.ratio_to_threshold, 1),
-            "max_detection_distance_km": round(max_dist, 0)
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_connectivity":
-        result = calculators.aquifer_connectivity(
-            fault_type=arguments["fault_type"],
-            geology=arguments["geology"],
-            distance_km=arguments["distance_km"],
-            fault_intersects_aquifer=arguments.get("fault_intersects_aquifer", False)
-        )
-        output = {
-            "connectivity": round(result.connectivity, 2),
-            "fault_factor": round(result.fault_factor, 2),
-            "geology_factor": round(result.geology_factor, 2),
-            "distance_factor": round(result.distance_factor, 2),
-            "confidence": result.confidence,
-            "explanation": result.explanation
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "calc_pore_pressure":
-        result = calculators.pore_pressure_perturbation(
-            magnitude=arguments["magnitude"],
-            distance_km=arguments["distance_km"],
-            skempton_b=arguments.get("skempton_b", 0.7)
-        )
-        output = {
-            "delta_p_kpa": round(result.delta_p_kpa, 3),
-            "delta_p_bar": round(result.delta_p_bar, 4),
-            "static_stress_pa": result.static_stress_pa,
-            "skempton_b": result.skempton_b,
-            "detectable": result.detectable
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "rag_search":
-        rag = get_rag()
+
+def _tool_calc_pga(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_pga(arguments), indent=2))]
+
+
+def _tool_calc_chiodini(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_chiodini(arguments), indent=2))]
+
+
+def _tool_calc_distance(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_distance(arguments), indent=2))]
+
+
+def _tool_calc_recurrence(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_recurrence(arguments), indent=2))]
+
+
+def _tool_calc_energy(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_energy(arguments), indent=2))]
+
+
+def _tool_calc_connectivity(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_connectivity(arguments), indent=2))]
+
+
+def _tool_calc_pore_pressure(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(_calc_pore_pressure(arguments), indent=2))]
+
+
+def _tool_rag_search(arguments: dict) -> list[TextContent]:
+    rag = get_rag()
+    with _rag_model_lock:
         results = rag.search(
             query=arguments["query"],
             top_k=arguments.get("top_k", 5)
         )
-        output = []
-        for r in results:
-            output.append({
-                "source": r["source"],
-                "page": r["page"],
-                "similarity": round(r["similarity"], 2),
-                "text": r["text"][:500] + "..." if len(r["text"]) > 500 else r["text"]
-            })
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "rag_index":
-        rag = get_rag()
-        try:
+    output = []
+    for r in results:
+        output.append({
+            "source": r["source"],
+            "page": r["page"],
+            "similarity": round(r["similarity"], 2),
+            "text": r["text"][:500] + "..." if len(r["text"]) > 500 else r["text"]
+        })
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_rag_index(arguments: dict) -> list[TextContent]:
+    rag = get_rag()
+    try:
+        with _rag_model_lock:
             chunks = rag.index_document(Path(arguments["file_path"]))
-            return [TextContent(type="text", text=f"Indexed {chunks} chunks from {arguments['file_path']}")]
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error: {e}")]
-
-    # Fault Database Tools
-    elif name == "search_usgs_faults":
-        faults = fault_databases.search_usgs_faults(
-            lat=arguments["lat"],
-            lon=arguments["lon"],
-            radius_km=arguments.get("radius_km", 50)
-        )
-        output = [{
-            "name": f.name,
-            "database": f.database,
-            "distance_km": f.distance_km,
-            "slip_rate_mm_yr": f.slip_rate_mm_yr,
-            "slip_sense": f.slip_sense,
-            "age": f.age
-        } for f in faults]
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "search_gem_faults":
-        faults = fault_databases.search_gem_faults(
-            lat=arguments["lat"],
-            lon=arguments["lon"],
-            radius_km=arguments.get("radius_km", 50)
-        )
-        output = [{
-            "name": f.name,
-            "database": f.database,
-            "distance_km": f.distance_km,
-            "slip_rate_mm_yr": f.slip_rate_mm_yr,
-            "slip_sense": f.slip_sense,
-            "length_km": f.length_km
-        } for f in faults]
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "search_diss_sources":
-        faults = fault_databases.search_diss_sources(
-            lat=arguments["lat"],
-            lon=arguments["lon"],
-            radius_km=arguments.get("radius_km", 50)
-        )
-        output = [{
-            "name": f.name,
-            "database": f.database,
-            "distance_km": f.distance_km,
-            "max_magnitude": f.max_magnitude,
-            "slip_sense": f.slip_sense,
-            "recurrence_yr": f.recurrence_yr,
-            "dip": f.dip,
-            "rake": f.rake
-        } for f in faults]
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "check_fault_proximity":
-        result = fault_databases.check_fault_proximity(
-            lat=arguments["lat"],
-            lon=arguments["lon"],
-            radius_km=arguments.get("radius_km", 50)
-        )
-        output = {
-            "has_mapped_fault": result.has_mapped_fault,
-            "is_dark_candidate": result.is_dark_candidate,
-            "confidence": result.confidence,
-            "databases_checked": result.databases_checked,
-            "distance_km": result.distance_km,
-            "nearest_fault": {
-                "name": result.nearest_fault.name,
-                "database": result.nearest_fault.database,
-                "distance_km": result.nearest_fault.distance_km,
-                "slip_sense": result.nearest_fault.slip_sense
-            } if result.nearest_fault else None,
-            "faults_count": len(result.faults_within_radius),
-            "notes": result.notes
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    # Volcanic Database Tools
-    elif name == "search_gvp_eruptions":
-        eruptions = volcanic_databases.search_gvp_eruptions(
-            start_year=arguments["start_year"],
-            end_year=arguments["end_year"],
-            vei_min=arguments.get("vei_min", 4)
-        )
-        output = [{
-            "volcano_name": e.volcano_name,
-            "year": e.start_year,
-            "vei": e.vei,
-            "country": e.country,
-            "lat": e.lat,
-            "lon": e.lon
-        } for e in eruptions]
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "search_evolv2k":
-        events = volcanic_databases.search_evolv2k(
-            start_year=arguments["start_year"],
-            end_year=arguments["end_year"],
-            vssi_min=arguments.get("vssi_min", 5.0)
-        )
-        output = [{
-            "year": e.year,
-            "vssi_tg_s": e.vssi,
-            "eruption_name": e.eruption_name,
-            "hemisphere": e.hemisphere,
-            "rank": e.rank,
-            "lat": e.lat
-        } for e in events]
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    elif name == "check_volcanic_activity":
-        result = volcanic_databases.check_volcanic_activity(
-            start_year=arguments["start_year"],
-            end_year=arguments["end_year"],
-            cave_lat=arguments.get("cave_lat"),
-            cave_lon=arguments.get("cave_lon")
+        return [TextContent(type="text", text=f"Indexed {chunks} chunks from {arguments['file_path']}")]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error: {e}")]
+
+
+# Fault Database Tools
+
+def _tool_search_usgs_faults(arguments: dict) -> list[TextContent]:
+    faults = fault_databases.search_usgs_faults(
+        lat=arguments["lat"],
+        lon=arguments["lon"],
+        radius_km=arguments.get("radius_km", 50)
+    )
+    output = [{
+        "name": f.name,
+        "database": f.database,
+        "distance_km": f.distance_km,
+        "slip_rate_mm_yr": f.slip_rate_mm_yr,
+        "slip_sense": f.slip_sense,
+        "age": f.age
+    } for f in faults]
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_search_gem_faults(arguments: dict) -> list[TextContent]:
+    faults = fault_databases.search_gem_faults(
+        lat=arguments["lat"],
+        lon=arguments["lon"],
+        radius_km=arguments.get("radius_km", 50)
+    )
+    output = [{
+        "name": f.name,
+        "database": f.database,
+        "distance_km": f.distance_km,
+        "slip_rate_mm_yr": f.slip_rate_mm_yr,
+        "slip_sense": f.slip_sense,
+        "length_km": f.length_km
+    } for f in faults]
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_search_diss_sources(arguments: dict) -> list[TextContent]:
+    faults = fault_databases.search_diss_sources(
+        lat=arguments["lat"],
+        lon=arguments["lon"],
+        radius_km=arguments.get("radius_km", 50)
+    )
+    output = [{
+        "name": f.name,
+        "database": f.database,
+        "distance_km": f.distance_km,
+        "max_magnitude": f.max_magnitude,
+        "slip_sense": f.slip_sense,
+        "recurrence_yr": f.recurrence_yr,
+        "dip": f.dip,
+        "rake": f.rake
+    } for f in faults]
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_check_fault_proximity(arguments: dict) -> list[TextContent]:
+    result = fault_databases.check_fault_proximity(
+        lat=arguments["lat"],
+        lon=arguments["lon"],
+        radius_km=arguments.get("radius_km", 50)
+    )
+    return [TextContent(type="text", text=json.dumps(_fault_proximity_output(result), indent=2))]
+
+
+def _fault_proximity_output(result) -> dict:
+    return {
+        "has_mapped_fault": result.has_mapped_fault,
+        "is_dark_candidate": result.is_dark_candidate,
+        "confidence": result.confidence,
+        "databases_checked": result.databases_checked,
+        "distance_km": result.distance_km,
+        "nearest_fault": {
+            "name": result.nearest_fault.name,
+            "database": result.nearest_fault.database,
+            "distance_km": result.nearest_fault.distance_km,
+            "slip_sense": result.nearest_fault.slip_sense
+        } if result.nearest_fault else None,
+        "faults_count": len(result.faults_within_radius),
+        "notes": result.notes
+    }
+
+
+# Volcanic Database Tools
+
+def _tool_search_gvp_eruptions(arguments: dict) -> list[TextContent]:
+    eruptions = volcanic_databases.search_gvp_eruptions(
+        start_year=arguments["start_year"],
+        end_year=arguments["end_year"],
+        vei_min=arguments.get("vei_min", 4)
+    )
+    output = [{
+        "volcano_name": e.volcano_name,
+        "year": e.start_year,
+        "vei": e.vei,
+        "country": e.country,
+        "lat": e.lat,
+        "lon": e.lon
+    } for e in eruptions]
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_search_evolv2k(arguments: dict) -> list[TextContent]:
+    events = volcanic_databases.search_evolv2k(
+        start_year=arguments["start_year"],
+        end_year=arguments["end_year"],
+        vssi_min=arguments.get("vssi_min", 5.0)
+    )
+    output = [{
+        "year": e.year,
+        "vssi_tg_s": e.vssi,
+        "eruption_name": e.eruption_name,
+        "hemisphere": e.hemisphere,
+        "rank": e.rank,
+        "lat": e.lat
+    } for e in events]
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_check_volcanic_activity(arguments: dict) -> list[TextContent]:
+    result = volcanic_databases.check_volcanic_activity(
+        start_year=arguments["start_year"],
+        end_year=arguments["end_year"],
+        cave_lat=arguments.get("cave_lat"),
+        cave_lon=arguments.get("cave_lon")
+    )
+    return [TextContent(type="text", text=json.dumps(_volcanic_check_output(result), indent=2))]
+
+
+def _volcanic_check_output(result) -> dict:
+    return {
+        "has_major_eruption": result.has_major_eruption,
+        "is_volcanic_false_positive_likely": result.is_volcanic_false_positive_likely,
+        "confidence": result.confidence,
+        "max_vei": result.max_vei,
+        "max_vssi_tg_s": result.max_vssi,
+        "eruptions_count": len(result.eruptions),
+        "forcing_events_count": len(result.forcing_events),
+        "forcing_events": [{
+            "year": f.year,
+            "vssi": f.vssi,
+            "name": f.eruption_name,
+            "rank": f.rank
+        } for f in result.forcing_events[:5]],  # Top 5
+        "notes": result.notes
+    }
+
+
+# Batch Tools
+
+CALCULATORS = {
+    "calc_pga": _calc_pga,
+    "calc_chiodini": _calc_chiodini,
+    "calc_distance": _calc_distance,
+    "calc_recurrence": _calc_recurrence,
+    "calc_energy": _calc_energy,
+    "calc_connectivity": _calc_connectivity,
+    "calc_pore_pressure": _calc_pore_pressure,
+}
+
+EARTHQUAKE_SEARCH_OPTIONS = ("radius_km", "start_date", "end_date", "min_magnitude")
+
+
+def _earthquake_site_output(events: list[dict], max_events: int) -> dict:
+    """Per-site summary: complete counts, the largest events listed."""
+    if events and "error" in events[0]:
+        return {"error": events[0]["error"]}
+    magnitudes = [e["magnitude"] for e in events if e["magnitude"] is not None]
+    largest = sorted(events, key=lambda e: e["magnitude"] if e["magnitude"] is not None else float("-inf"),
+                     reverse=True)
+    return {
+        "count": len(events),
+        "max_magnitude": max(magnitudes, default=None),
+        "events": largest[:max_events]
+    }
+
+
+async def _tool_earthquake_search_batch(arguments: dict) -> list[TextContent]:
+    sites = _batch_items(arguments, "sites")
+    defaults = {k: arguments[k] for k in EARTHQUAKE_SEARCH_OPTIONS if k in arguments}
+    max_events = arguments.get("max_events", 20)
+
+    def search(site: dict) -> dict:
+        options = {**defaults, **{k: site[k] for k in EARTHQUAKE_SEARCH_OPTIONS if k in site}}
+        events = query_usgs_earthquakes(
+            lat=site["lat"],
+            lon=site["lon"],
+            radius_km=options.get("radius_km", 100),
+            start_date=options.get("start_date", "2000-01-01"),
+            end_date=options.get("end_date"),
+            min_magnitude=options.get("min_magnitude", 4.0)
         )
-        output = {
-            "has_major_eruption": result.has_major_eruption,
-            "is_volcanic_false_positive_likely": result.is_volcanic_false_positive_likely,
-            "confidence": result.confidence,
-            "max_vei": result.max_vei,
-            "max_vssi_tg_s": result.max_vssi,
-            "eruptions_count": len(result.eruptions),
-            "forcing_events_count": len(result.forcing_events),
-            "forcing_events": [{
-                "year": f.year,
-                "vssi": f.vssi,
-                "name": f.eruption_name,
-                "rank": f.rank
-            } for f in result.forcing_events[:5]],  # Top 5
-            "notes": result.notes
-        }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
-
-    else:
+        return _earthquake_site_output(events, max_events)
+
+    return await _collect_batch(sites, _gather_batch("earthquake_search", sites, search))
+
+
+async def _tool_check_fault_proximity_batch(arguments: dict) -> list[TextContent]:
+    sites = _batch_items(arguments, "sites")
+
+    # Bad coordinates fail their own item, not the batch
+    valid, invalid = [], {}
+    for index, site in enumerate(sites):
+        try:
+            valid.append((index, float(site["lat"]), float(site["lon"])))
+        except (KeyError, TypeError, ValueError) as e:
+            invalid[index] = {"error": f"{type(e).__name__}: {e}"}
+
+    def results():
+        yield from invalid.items()
+        for i, result in fault_databases.iter_fault_proximity_batch(
+                [(lat, lon) for _, lat, lon in valid], radius_km=arguments.get("radius_km", 50)):
+            yield valid[i][0], _fault_proximity_output(result)
+
+    return await _collect_batch(sites, _stream_batch("check_fault_proximity", results))
+
+
+async def _tool_check_volcanic_activity_batch(arguments: dict) -> list[TextContent]:
+    windows = _batch_items(arguments, "windows")
+
+    def results():
+        checks = volcanic_databases.check_volcanic_activity_batch(
+            [(w["start_year"], w["end_year"]) for w in windows])
+        for index, result in enumerate(checks):
+            yield index, _volcanic_check_output(result)
+
+    return await _collect_batch(windows, _stream_batch("check_volcanic_activity", results))
+
+
+def _tool_calc_batch(arguments: dict) -> list[TextContent]:
+    calls = _batch_items(arguments, "calls")
+    results = []
+    for index, call in enumerate(calls):
+        calculator = CALCULATORS.get(call.get("tool"))
+        try:
+            if calculator is None:
+                raise ValueError(f"unknown calculator: {call.get('tool')}")
+            results.append({"index": index, "tool": call["tool"], **calculator(call.get("arguments", {}))})
+        except Exception as e:
+            results.append({"index": index, "tool": call.get("tool"), "error": f"{type(e).__name__}: {e}"})
+
+    output = {
+        "count": len(results),
+        "errors": sum("error" in r for r in results),
+        "results": results
+    }
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+def _tool_server_status(arguments: dict) -> list[TextContent]:
+    output = {
+        "uptime_s": round(time.monotonic() - _SERVER_STARTED, 1),
+        "warmup": warmup_status(),
+        "tool_workers": TOOL_WORKERS,
+        "tool_concurrency": {**TOOL_CONCURRENCY, "default": DEFAULT_TOOL_CONCURRENCY},
+    }
+    return [TextContent(type="text", text=json.dumps(output, indent=2))]
+
+
+TOOL_HANDLERS = {
+    "sisal_search_caves": _tool_sisal_search_caves,
+    "sisal_get_samples": _tool_sisal_get_samples,
+    "earthquake_search": _tool_earthquake_search,
+    "calc_pga": _tool_calc_pga,
+    "calc_chiodini": _tool_calc_chiodini,
+    "calc_distance": _tool_calc_distance,
+    "calc_recurrence": _tool_calc_recurrence,
+    "calc_energy": _tool_calc_energy,
+    "calc_connectivity": _tool_calc_connectivity,
+    "calc_pore_pressure": _tool_calc_pore_pressure,
+    "rag_search": _tool_rag_search,
+    "rag_index": _tool_rag_index,
+    "search_usgs_faults": _tool_search_usgs_faults,
+    "search_gem_faults": _tool_search_gem_faults,
+    "search_diss_sources": _tool_search_diss_sources,
+    "check_fault_proximity": _tool_check_fault_proximity,
+    "search_gvp_eruptions": _tool_search_gvp_eruptions,
+    "search_evolv2k": _tool_search_evolv2k,
+    "check_volcanic_activity": _tool_check_volcanic_activity,
+    "earthquake_search_batch": _tool_earthquake_search_batch,
+    "check_fault_proximity_batch": _tool_check_fault_proximity_batch,
+    "check_volcanic_activity_batch": _tool_check_volcanic_activity_batch,
+    "calc_batch": _tool_calc_batch,
+    "server_status": _tool_server_status,
+}
+
+# Pure arithmetic: cheaper to run on the event loop than to hand off
+INLINE_TOOLS = {
+    "calc_pga", "calc_chiodini", "calc_distance", "calc_recurrence",
+    "calc_energy", "calc_connectivity", "calc_pore_pressure", "calc_batch",
+    "server_status",
+}
+
+
+# =============================================================================
+# TOOL EXECUTION
+# =============================================================================
+
+# Threads shared by all blocking tool calls
+TOOL_WORKERS = int(os.environ.get("PALEOSEISMIC_MCP_WORKERS", "8"))
+
+# Tools sharing state also share a concurrency limit. The RAG model and index
+# are not safe to drive from several threads at once.
+TOOL_GROUPS = {
+    "rag_search": "rag",
+    "rag_index": "rag",
+}
+
+# Max concurrent calls per tool or group (others wait); unlisted ones use the default
+TOOL_CONCURRENCY = {
+    "rag": 1,
+    "earthquake_search": 4,
+    "search_usgs_faults": 4,
+    "check_fault_proximity": 4,
+}
+DEFAULT_TOOL_CONCURRENCY = 2
+
+_tool_executor = None
+_tool_semaphores: dict = {}
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="mcp-tool")
+    return _tool_executor
+
+
+def _tool_semaphore(name: str) -> asyncio.Semaphore:
+    group = TOOL_GROUPS.get(name, name)
+    if group not in _tool_semaphores:
+        _tool_semaphores[group] = asyncio.Semaphore(TOOL_CONCURRENCY.get(group, DEFAULT_TOOL_CONCURRENCY))
+    return _tool_semaphores[group]
+
+
+def _log_request(name: str, status: str, wait_s: float, run_s: float):
+    """Request-level timing on stderr (stdout carries the MCP protocol)."""
+    print(f"[mcp] tool={name} status={status} wait_ms={wait_s * 1000:.1f} "
+          f"run_ms={run_s * 1000:.1f} total_ms={(wait_s + run_s) * 1000:.1f}",
+          file=sys.stderr, flush=True)
+
+
+# =============================================================================
+# BATCH EXECUTION
+# =============================================================================
+
+# Upper bound on items per batch call
+BATCH_MAX_ITEMS = 1000
+
+
+def _batch_items(arguments: dict, key: str) -> list[dict]:
+    items = arguments.get(key)
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"'{key}' must be a non-empty array")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise ValueError(f"'{key}' has {len(items)} items (max {BATCH_MAX_ITEMS})")
+    return items
+
+
+async def _gather_batch(name: str, items: list, fn):
+    """
+    Run fn(item) for every item on the tool executor, each behind the
+    semaphore of the single-item tool name, so a batch shares the limits of
+    individual calls.
+
+    Yields:
+        (index, output dict) in completion order; a failing item yields
+        {"error": ...} instead of failing the batch
+    """
+    loop = asyncio.get_running_loop()
+
+    async def run(index: int, item):
+        async with _tool_semaphore(name):
+            try:
+                return index, await loop.run_in_executor(_get_tool_executor(), fn, item)
+            except Exception as e:
+                return index, {"error": f"{type(e).__name__}: {e}"}
+
+    tasks = [asyncio.ensure_future(run(i, item)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _stream_batch(name: str, results):
+    """
+    Drive a blocking generator of (index, output dict) on the tool executor
+    (behind the semaphore of name) and yield its items as they come.
+
+    If the consumer stops early (e.g. the request is cancelled), the
+    generator is closed after its current item instead of run to the end.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    stop = threading.Event()
+
+    def produce():
+        items = results()
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            items.close()
+            if not stop.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    async with _tool_semaphore(name):
+        producer = loop.run_in_executor(_get_tool_executor(), produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+            await producer  # re-raises a failure of the generator
+        finally:
+            stop.set()
+
+
+def _progress_reporter():
+    """
+    Coroutine function sending progress notifications for the current
+    request, or None when the client did not ask for progress (or the mcp
+    version has no request context).
+    """
+    try:
+        ctx = server.request_context
+        token = ctx.meta.progressToken if ctx.meta is not None else None
+    except (AttributeError, LookupError):
+        return None
+    if token is None:
+        return None
+
+    async def report(progress: int, total: int, message: str):
+        try:
+            await ctx.session.send_progress_notification(token, progress, total, message=message)
+        except TypeError:
+            # mcp releases before progress messages
+            await ctx.session.send_progress_notification(token, progress, total)
+
+    return report
+
+
+async def _collect_batch(items: list, results) -> list[TextContent]:
+    """
+    Gather a batch's (index, output) stream into one response in input
+    order, streaming each item as a progress notification on the way.
+    """
+    report = _progress_reporter()
+    outputs: list = [None] * len(items)
+
+    completed = 0
+    async for index, output in results:
+        label = {"index": index}
+        if isinstance(items[index], dict) and "name" in items[index]:
+            label["name"] = items[index]["name"]
+        output = outputs[index] = {**label, **output}
+        completed += 1
+        if report is not None:
+            try:
+                await report(completed, len(items), json.dumps(output))
+            except Exception as e:
+                print(f"[mcp] progress notification failed: {e}", file=sys.stderr, flush=True)
+                report = None
+
+    response = {
+        "count": len(outputs),
+        "errors": sum("error" in o for o in outputs),
+        "results": outputs
+    }
+    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """
+    Handle tool calls.
+
+    Blocking handlers run on a bounded thread pool behind a per-tool
+    semaphore, so a slow query does not stall other requests on the stdio
+    channel. Batch handlers are awaited directly and queue their items
+    the same way. If the client cancels a request, its queued work is dropped
+    (work already running finishes in the background and is discarded).
+    """
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+    queued = time.perf_counter()
+    started = None
+    status = "ok"
+    try:
+        if name in INLINE_TOOLS:
+            started = queued
+            return handler(arguments)
+
+        if asyncio.iscoroutinefunction(handler):
+            # Batch tools schedule (and rate-limit) their own items
+            started = queued
+            return await handler(arguments)
+
+        async with _tool_semaphore(name):
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_tool_executor(), handler, arguments)
+    except asyncio.CancelledError:
+        status = "cancelled"
+        raise
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        now = time.perf_counter()
+        wait_s = (started or now) - queued
+        _log_request(name, status, wait_s, now - (started or now))
+
+
+# =============================================================================
+# WARM-UP
+# =============================================================================
+
+_SERVER_STARTED = time.monotonic()
+
+
+def _warm_sisal() -> str:
+    store = sisal_store.get_sisal_store(SISAL_PATH)
+    if store is None:
+        raise FileNotFoundError(f"SISAL not found at {SISAL_PATH}")
+    return str(store.db_path)
+
+
+def _warm_faults() -> str:
+    loaded = fault_databases.preload_fault_stores()
+    return ", ".join(loaded) if loaded else "no local fault files"
+
+
+def _warm_earthquake_catalog() -> str:
+    catalog = earthquake_catalog.get_catalog()
+    if catalog is None:
+        return "no local mirror (live USGS queries)"
+    counts = catalog.status()["events"]
+    return ", ".join(f"{source}: {n} events" for source, n in counts.items()) or "empty mirror"
+
+
+def _warm_rag() -> str:
+    db = get_rag()
+    with _rag_model_lock:
+        db.model.encode(["warm-up"])  # first encode initializes the tokenizer
+    return f"{db.collection.count()} chunks"
+
+
+# Resource -> loader; each runs in its own thread and returns a short summary
+WARMUP_LOADERS = {
+    "sisal": _warm_sisal,
+    "faults": _warm_faults,
+    "earthquake_catalog": _warm_earthquake_catalog,
+    "rag": _warm_rag,
+}
+
+_warmup_state: dict = {}
+_warmup_lock = threading.Lock()
+
+
+def warmup_resources(value: str = None) -> list[str]:
+    """
+    Resources to preload, from $PALEOSEISMIC_MCP_WARMUP (default all).
+
+    Args:
+        value: Comma-separated resource names, "all" or "none"
+    """
+    if value is None:
+        value = os.environ.get("PALEOSEISMIC_MCP_WARMUP", "all")
+    names = [n.strip().lower() for n in value.split(",") if n.strip()]
+    if "none" in names:
+        return []
+    if not names or "all" in names:
+        return list(WARMUP_LOADERS)
+
+    unknown = [n for n in names if n not in WARMUP_LOADERS]
+    if unknown:
+        print(f"[mcp] ignoring unknown warm-up resources: {', '.join(unknown)}", file=sys.stderr, flush=True)
+    return [n for n in WARMUP_LOADERS if n in names]
+
+
+def _set_warmup_state(name: str, **fields):
+    with _warmup_lock:
+        _warmup_state[name].update(fields)
+
+
+def _run_warmup(name: str):
+    started = time.perf_counter()
+    _set_warmup_state(name, state="loading")
+    try:
+        detail = WARMUP_LOADERS[name]()
+    except Exception as e:
+        _set_warmup_state(name, state="failed", seconds=round(time.perf_counter() - started, 2),
+                          error=f"{type(e).__name__}: {e}")
+        print(f"[mcp] warm-up {name} failed: {e}", file=sys.stderr, flush=True)
+        return
+
+    seconds = round(time.perf_counter() - started, 2)
+    _set_warmup_state(name, state="ready", seconds=seconds, detail=detail)
+    print(f"[mcp] warm-up {name} ready in {seconds}s ({detail})", file=sys.stderr, flush=True)
+
+
+def start_warmup(resources: list[str]) -> list[threading.Thread]:
+    """
+    Preload resources in background daemon threads.
+
+    Tool calls never wait on the warm-up itself: a call that needs a resource
+    still loading blocks on that resource's own lock (SISAL store, fault
+    store, RAG model) and proceeds as soon as it is ready.
+
+    Args:
+        resources: Names from WARMUP_LOADERS
+
+    Returns:
+        The started threads
+    """
+    with _warmup_lock:
+        for name in WARMUP_LOADERS:
+            _warmup_state[name] = {"state": "pending" if name in resources else "disabled",
+                                   "seconds": None, "detail": None, "error": None}
+
+    threads = []
+    for name in resources:
+        thread = threading.Thread(target=_run_warmup, args=(name,), name=f"mcp-warmup-{name}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def warmup_status() -> dict:
+    """Per-resource warm-up state: disabled, pending, loading, ready or failed."""
+    with _warmup_lock:
+        return {name: dict(state) for name, state in _warmup_state.items()}
+
 
 async def main():
     async with stdio_server() as (read_stream, write_stream):
+        # Heavy state loads in the background; list_tools and the handshake
+        # are answered straight away
+        start_warmup(warmup_resources())
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Indexed SISAL Store for the MCP Server.
+
+Builds a SQLite copy of the SISAL v3 CSV export (site, entity, sample and
+d18o tables) once, with indexes on entity_id, site_id and country and the
+per-entity sample counts precomputed. The MCP tools then read only the rows
+they return instead of streaming the CSVs on every call.
+
+The store is rebuilt automatically when any source CSV changes (size or
+mtime), and lives in tools/cache/sisal.sqlite.
+
+Usage:
+    from sisal_store import get_sisal_store
+
+    store = get_sisal_store(SISAL_PATH)
+    caves = store.entities(region='italy', min_samples=100)
+    samples = store.samples('123')
+
+    python sisal_store.py build /path/to/sisalv3_csv
+"""
+
+import csv
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SISAL_STORE_VERSION = 1
+DEFAULT_STORE_PATH = Path(__file__).parent / "cache" / "sisal.sqlite"
+
+SOURCE_FILES = ('site.csv', 'entity.csv', 'sample.csv', 'd18o.csv')
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE sites (
+    site_id TEXT,
+    site_name TEXT,
+    lat REAL,
+    lon REAL,
+    country TEXT,
+    site_name_lc TEXT,
+    country_lc TEXT
+);
+CREATE TABLE entities (
+    entity_id TEXT,
+    entity_name TEXT,
+    site_id TEXT,
+    sample_count INTEGER
+);
+CREATE TABLE samples (
+    sample_id TEXT,
+    entity_id TEXT,
+    depth_mm REAL,
+    age_bp REAL,
+    d18O REAL
+);
+"""
+
+INDEXES = """
+CREATE INDEX sites_site_id ON sites (site_id);
+CREATE INDEX sites_country ON sites (country_lc);
+CREATE INDEX entities_entity_id ON entities (entity_id);
+CREATE INDEX entities_site_id ON entities (site_id);
+CREATE INDEX entities_sample_count ON entities (sample_count);
+CREATE INDEX samples_entity_id ON samples (entity_id);
+"""
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    """CSV value to float (empty -> None), as the old CSV readers did."""
+    return float(value) if value else None
+
+
+def source_signature(csv_dir: Path) -> str:
+    """Size and mtime of every source CSV (missing files included as such)."""
+    parts = [f"v{SISAL_STORE_VERSION}"]
+    for name in SOURCE_FILES:
+        try:
+            stat = (Path(csv_dir) / name).stat()
+            parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{name}:missing")
+    return '|'.join(parts)
+
+
+class SISALStore:
+    """Read-only SQLite view of the SISAL CSV export."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """One read-only connection per thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    @property
+    def signature(self) -> Optional[str]:
+        try:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    # -------------------------------------------------------------------------
+    # Build
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, csv_dir: Path, db_path: Path = DEFAULT_STORE_PATH) -> 'SISALStore':
+        """
+        Build the store from the SISAL CSV directory (atomic replace).
+
+        Args:
+            csv_dir: Directory with site.csv, entity.csv, sample.csv (d18o.csv optional)
+            db_path: SQLite file to write
+
+        Returns:
+            SISALStore
+        """
+        csv_dir, db_path = Path(csv_dir), Path(db_path)
+        signature = source_signature(csv_dir)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = db_path.with_name(f"{db_path.name}.{os.getpid()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            conn.executescript(SCHEMA)
+
+            with open(csv_dir / "site.csv", 'r', encoding='utf-8') as f:
+                conn.executemany("INSERT INTO sites VALUES (?, ?, ?, ?, ?, ?, ?)", (
+                    (row['site_id'], row['site_name'], _float(row['latitude']),
+                     _float(row['longitude']), row.get('country', ''),
+                     row['site_name'].lower(), row.get('country', '').lower())
+                    for row in csv.DictReader(f)))
+
+            # d18O per sample (last value wins, as in the old dict reader)
+            d18o = {}
+            d18o_file = csv_dir / "d18o.csv"
+            if d18o_file.exists():
+                with open(d18o_file, 'r', encoding='utf-8') as f:
+                    for row in csv.DictReader(f):
+                        d18o[row['sample_id']] = _float(row['d18O_measurement'])
+
+            sample_counts: Dict[str, int] = {}
+
+            def samples():
+                with open(csv_dir / "sample.csv", 'r', encoding='utf-8') as f:
+                    for row in csv.DictReader(f):
+                        entity_id = row['entity_id']
+                        sample_counts[entity_id] = sample_counts.get(entity_id, 0) + 1
+                        yield (row['sample_id'], entity_id, _float(row.get('depth_sample')),
+                               _float(row.get('interp_age')), d18o.get(row['sample_id']))
+
+            conn.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?)", samples())
+
+            with open(csv_dir / "entity.csv", 'r', encoding='utf-8') as f:
+                conn.executemany("INSERT INTO entities VALUES (?, ?, ?, ?)", (
+                    (row['entity_id'], row['entity_name'], row['site_id'],
+                     sample_counts.get(row['entity_id'], 0))
+                    for row in csv.DictReader(f)))
+
+            conn.executescript(INDEXES)
+            conn.execute("INSERT INTO meta VALUES ('source', ?)", (signature,))
+            conn.commit()
+        finally:
+            conn.close()
+
+        tmp_path.replace(db_path)
+        return cls(db_path)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def entities(self, region: Optional[str] = None, min_samples: int = 100,
+                 limit: int = 50) -> List[Dict]:
+        """
+        Entities with at least min_samples samples, most samples first.
+
+        Args:
+            region: Case-insensitive substring of the site's country or name
+            min_samples: Minimum sample count
+            limit: Maximum number of entities returned
+
+        Returns:
+            List of entity dicts (entity_id, entity_name, site_name, country,
+            lat, lon, sample_count); ties keep entity.csv order
+        """
+        where = ["e.sample_count >= ?"]
+        args: list = [min_samples]
+        if region:
+            where.append("(instr(COALESCE(s.country_lc, ''), ?) > 0 OR instr(COALESCE(s.site_name_lc, ''), ?) > 0)")
+            args.extend([region.lower(), region.lower()])
+        args.append(limit)
+
+        rows = self._connect().execute(f"""
+            SELECT e.entity_id, e.entity_name, COALESCE(s.site_name, ''), COALESCE(s.country, ''),
+                   s.lat, s.lon, e.sample_count
+            FROM entities e
+            LEFT JOIN sites s ON s.rowid = (SELECT MAX(rowid) FROM sites WHERE site_id = e.site_id)
+            WHERE {' AND '.join(where)}
+            ORDER BY e.sample_count DESC, e.rowid
+            LIMIT ?
+        """, args).fetchall()
+
+        return [{
+            'entity_id': entity_id,
+            'entity_name': entity_name,
+            'site_name': site_name,
+            'country': country,
+            'lat': lat,
+            'lon': lon,
+            'sample_count': count,
+        } for entity_id, entity_name, site_name, country, lat, lon, count in rows]
+
+    def samples(self, entity_id: str) -> List[Dict]:
+        """Samples of one entity ordered by age (missing ages sort as 0)."""
+        rows = self._connect().execute("""
+            SELECT sample_id, depth_mm, age_bp, d18O FROM samples
+            WHERE entity_id = ?
+            ORDER BY COALESCE(age_bp, 0), rowid
+        """, (str(entity_id),)).fetchall()
+
+        return [{
+            'sample_id': sample_id,
+            'depth_mm': depth_mm,
+            'age_bp': age_bp,
+            'd18O': d18o,
+        } for sample_id, depth_mm, age_bp, d18o in rows]
+
+
+_STORES: Dict[str, SISALStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_sisal_store(csv_dir: Path, db_path: Path = DEFAULT_STORE_PATH) -> Optional[SISALStore]:
+    """
+    Open the store for a SISAL CSV directory, (re)building it if missing or stale.
+
+    Args:
+        csv_dir: SISAL CSV directory
+        db_path: SQLite file
+
+    Returns:
+        SISALStore, or None if the SISAL CSVs are not there
+    """
+    csv_dir = Path(csv_dir)
+    if not all((csv_dir / name).exists() for name in ('site.csv', 'entity.csv', 'sample.csv')):
+        return None
+
+    signature = source_signature(csv_dir)
+    with _STORES_LOCK:
+        store = _STORES.get(str(db_path))
+        if store is not None and store.signature == signature:
+            return store
+
+        store = SISALStore(db_path) if Path(db_path).exists() else None
+        if store is None or store.signature != signature:
+            # stderr: stdout carries the MCP protocol
+            print(f"Building SISAL store {db_path} from {csv_dir}...", file=sys.stderr, flush=True)
+            store = SISALStore.build(csv_dir, db_path)
+
+        _STORES[str(db_path)] = store
+        return store
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def main():
+    """Build or inspect the SISAL store."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Indexed SISAL store for the MCP server")
+    parser.add_argument("--db", type=str, default=str(DEFAULT_STORE_PATH))
+    subparsers = parser.add_subparsers(dest="command", help="Command")
+
+    build_parser = subparsers.add_parser("build", help="Build the store from SISAL CSVs")
+    build_parser.add_argument("csv_dir", type=str)
+
+    entities_parser = subparsers.add_parser("entities", help="List entities")
+    entities_parser.add_argument("--region", type=str, default=None)
+    entities_parser.add_argument("--min-samples", type=int, default=100)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        store = SISALStore.build(Path(args.csv_dir), Path(args.db))
+        print(f"Built {store.db_path}")
+    elif args.command == "entities":
+        store = SISALStore(Path(args.db))
+        print(json.dumps(store.entities(args.region, args.min_samples), indent=2))
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ Usage:
 
     # Check volcanic forcing
     forcing = search_evolv2k(start_year=1250, end_year=1300)
+
+    # Many anomaly windows, databases read once
+    results = check_volcanic_activity_batch([(1250, 1300), (1800, 1820)])
 """
 
 import json
@@ -26,7 +29,7 @@ import urllib.request
 import urllib.parse
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 
 
@@ -346,12 +349,55 @@ def check_volcanic_activity(
     Returns:
         VolcanicCheckResult with assessment
     """
-    notes = []
-
     # Query both databases
     eruptions = search_gvp_eruptions(start_year, end_year, vei_threshold)
     forcing = search_evolv2k(start_year, end_year, vssi_threshold)
 
+    return _assess_volcanic_activity(eruptions, forcing)
+
+
+def check_volcanic_activity_batch(
+    windows: Iterable[Tuple[int, int]],
+    vei_threshold: int = 4,
+    vssi_threshold: float = 5.0
+) -> List[VolcanicCheckResult]:
+    """
+    check_volcanic_activity() for many time windows.
+
+    GVP and eVolv2k are read once for the span covering every window, and
+    each window is then answered from those lists, instead of re-reading
+    both CSVs per window.
+
+    Args:
+        windows: (start_year, end_year) pairs (CE)
+        vei_threshold: Minimum VEI to flag (default 4)
+        vssi_threshold: Minimum VSSI to flag (default 5.0 Tg S)
+
+    Returns:
+        One VolcanicCheckResult per window, in input order
+    """
+    windows = [(int(start), int(end)) for start, end in windows]
+    if not windows:
+        return []
+
+    span_start = min(start for start, _ in windows)
+    span_end = max(end for _, end in windows)
+    all_eruptions = search_gvp_eruptions(span_start, span_end, vei_threshold)
+    all_forcing = search_evolv2k(span_start, span_end, vssi_threshold)
+
+    return [_assess_volcanic_activity(
+        [e for e in all_eruptions if start <= e.start_year <= end],
+        [f for f in all_forcing if start <= f.year <= end]
+    ) for start, end in windows]
+
+
+def _assess_volcanic_activity(
+    eruptions: List[Eruption],
+    forcing: List[VolcanicForcing]
+) -> VolcanicCheckResult:
+    """Assess the eruptions and forcing events found in one time window."""
+    notes = []
+
     # Combine and analyze
     max_vei = max([e.vei for e in eruptions if e.vei], default=None)
     max_vssi = max([f.vssi for f in forcing], default=None)